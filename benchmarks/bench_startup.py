@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Script Startup Benchmark for Rescume v2.0
+
+Agents launch every skill script as a fresh process, so cold-start cost
+matters. For each script in skills/*/scripts this runs
+`python -X importtime <script> <args>` a few times and reports median wall
+time, total import time and the slowest top-level imports.
+
+Usage:
+    bench_startup.py [--runs N] [--top K] [--json] [script-name ...]
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# Cheapest invocation per script (usage/help paths that touch no files)
+SCRIPT_ARGS = {
+    "compile.py": ["--help"],
+    "batch_compile.py": ["--help"],
+    "json_to_typst.py": [],
+    "validate_pdf.py": [],
+    "list_templates.py": ["--json"],
+    "compile_cache.py": ["--help"],
+    "pdf_pages.py": [],
+    "check_coverage.py": ["--help"],
+}
+DEFAULT_ARGS = ["--help"]
+
+
+def parse_importtime(stderr: str) -> List[Dict[str, Any]]:
+    """Return top-level imports as {module, self_us, cumulative_us}."""
+    imports = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3:
+            continue
+        module = fields[2]
+        # Nested imports are indented by two spaces per level after the separator
+        if module[1:2] == " ":
+            continue
+        imports.append({
+            "module": module.strip(),
+            "self_us": int(fields[0]),
+            "cumulative_us": int(fields[1]),
+        })
+    return imports
+
+
+def bench_script(script: Path, runs: int, top: int) -> Dict[str, Any]:
+    args = SCRIPT_ARGS.get(script.name, DEFAULT_ARGS)
+    walls = []
+    imports: List[Dict[str, Any]] = []
+
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", str(script), *args],
+            capture_output=True, text=True, cwd=script.parent
+        )
+        walls.append((time.perf_counter() - start) * 1000)
+        imports = parse_importtime(result.stderr)
+
+    imports.sort(key=lambda i: i["cumulative_us"], reverse=True)
+    return {
+        "script": str(script.relative_to(REPO_ROOT)),
+        "args": args,
+        "wall_ms": round(statistics.median(walls), 1),
+        "imports_ms": round(sum(i["cumulative_us"] for i in imports) / 1000, 1),
+        "slowest": [f"{i['module']} {i['cumulative_us'] / 1000:.1f}ms" for i in imports[:top]],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark skill script startup")
+    parser.add_argument("scripts", nargs="*", help="Script names to include (default: all)")
+    parser.add_argument("--runs", type=int, default=5, help="Runs per script (default: 5)")
+    parser.add_argument("--top", type=int, default=3, help="Slowest imports to show (default: 3)")
+    parser.add_argument("--json", action="store_true", help="Emit JSON instead of a table")
+    args = parser.parse_args()
+
+    scripts = sorted(REPO_ROOT.glob("skills/*/scripts/*.py"))
+    if args.scripts:
+        scripts = [s for s in scripts if s.name in args.scripts or s.stem in args.scripts]
+
+    start = time.perf_counter()
+    for _ in range(args.runs):
+        subprocess.run([sys.executable, "-c", "pass"])
+    interpreter_ms = round((time.perf_counter() - start) * 1000 / args.runs, 1)
+
+    results = [bench_script(script, args.runs, args.top) for script in scripts]
+
+    if args.json:
+        print(json.dumps({"interpreter_ms": interpreter_ms, "scripts": results}, indent=2))
+        return
+
+    print(f"Bare interpreter: {interpreter_ms}ms\n")
+    print(f"{'script':<58} {'wall ms':>8} {'imports ms':>11}  slowest imports")
+    for r in results:
+        print(f"{r['script']:<58} {r['wall_ms']:>8} {r['imports_ms']:>11}  {', '.join(r['slowest'])}")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,20 +3,172 @@
 
 import argparse
 import json
+import os
+import re
 import sys
 from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Set, Tuple
 
-try:
-    from docx import Document
-except ImportError:
-    print("Error: python-docx not installed. Run: pip install python-docx", file=sys.stderr)
-    sys.exit(1)
+
+from docx_text import TextCache, extract_docx_text
+from resume_sources import Segment, load_segments
 
 
 def extract_text_from_docx(docx_path: str) -> str:
-    """Extract all text from DOCX file."""
-    doc = Document(docx_path)
-    return " ".join([para.text for para in doc.paragraphs])
+    """Extract all text from DOCX file, including table cells."""
+    return extract_docx_text(docx_path)
+
+
+# Common variations checked when the exact skill isn't found
+SKILL_VARIATIONS = {
+    "ml": ["machine learning", "ml", "deep learning"],
+    "a/b testing": ["a/b testing", "ab testing", "experimentation", "experiments"],
+    "sql": ["sql", "structured query language", "database queries"],
+    "aws": ["aws", "amazon web services", "s3", "ec2", "lambda"],
+    "python": ["python", "py", "pandas", "numpy"]
+}
+
+# Words are runs of letters/digits, keeping trailing + or # (c++, c#)
+TOKEN_RE = re.compile(r"[a-z0-9]+[+#]*")
+
+
+def tokenize(text: str) -> Tuple[str, ...]:
+    """Lower-case text and split it into word tokens."""
+    return tuple(TOKEN_RE.findall(text.lower()))
+
+
+class SkillMatcher:
+    """
+    All required skills and their variations, compiled once per JD.
+
+    Every skill, variation and skill word becomes a token phrase. Matching
+    tokenizes the resume once and builds the set of its n-grams for just
+    the phrase lengths in use, so each phrase check is a set lookup and the
+    whole requirement list is matched in one linear pass over the text.
+    Matching is word-boundary aware: "py" no longer matches "happy".
+    """
+
+    def __init__(self, skills: List[str]):
+        self.rules: Dict[str, Tuple] = {}
+        self.lengths: Set[int] = set()
+
+        for skill in skills:
+            exact = tokenize(skill)
+            variants = [tokenize(v) for v in SKILL_VARIATIONS.get(skill.lower(), [])]
+            words = [tokenize(word) for word in skill.lower().split()]
+            words = [word for word in words if word]
+            self.rules[skill] = (exact, variants, words)
+            self.lengths.update(len(p) for p in [exact, *variants, *words] if p)
+
+    def index(self, tokens: Tuple[str, ...]) -> Set[Tuple[str, ...]]:
+        """Return every n-gram of tokens for the phrase lengths this matcher needs."""
+        grams: Set[Tuple[str, ...]] = set()
+        for n in self.lengths:
+            grams.update(tokens[i:i + n] for i in range(len(tokens) - n + 1))
+        return grams
+
+    def match(self, text: str) -> Dict[str, Tuple[bool, float]]:
+        """Return {skill: (found, relevance)} for every skill."""
+        return self.match_tokens(tokenize(text))
+
+    def match_tokens(self, tokens: Tuple[str, ...]) -> Dict[str, Tuple[bool, float]]:
+        """Like match(), for text that has already been tokenized."""
+        return self.resolve(self.hits(tokens))
+
+    def hits(self, tokens: Tuple[str, ...]) -> Dict[str, list]:
+        """
+        Return the raw phrase hits in tokens: {skill: [exact, variant, word_indexes]}.
+
+        Only skills with at least one hit are included. Hits are plain JSON
+        so they can be stored per bullet and merged across bullets later.
+        """
+        grams = self.index(tokens)
+        hits = {}
+
+        for skill, (exact, variants, words) in self.rules.items():
+            exact_hit = bool(exact) and exact in grams
+            variant_hit = any(variant in grams for variant in variants)
+            word_hits = [i for i, word in enumerate(words) if word in grams]
+            if exact_hit or variant_hit or word_hits:
+                hits[skill] = [exact_hit, variant_hit, word_hits]
+
+        return hits
+
+    @staticmethod
+    def merge_hits(all_hits: List[Dict[str, list]]) -> Dict[str, list]:
+        """Combine per-segment hits into hits for the whole resume."""
+        merged: Dict[str, list] = {}
+        for hits in all_hits:
+            for skill, (exact_hit, variant_hit, word_hits) in hits.items():
+                current = merged.setdefault(skill, [False, False, []])
+                current[0] = current[0] or exact_hit
+                current[1] = current[1] or variant_hit
+                current[2] = sorted(set(current[2]) | set(word_hits))
+        return merged
+
+    def resolve(self, hits: Dict[str, list]) -> Dict[str, Tuple[bool, float]]:
+        """Turn raw hits into {skill: (found, relevance)} for every skill."""
+        results = {}
+
+        for skill, (_, _, words) in self.rules.items():
+            exact_hit, variant_hit, word_hits = hits.get(skill, (False, False, []))
+
+            # Exact match
+            if exact_hit:
+                results[skill] = (True, 1.0)
+                continue
+
+            # Common variations
+            if variant_hit:
+                results[skill] = (True, 0.9)
+                continue
+
+            # Weak match: share of the skill's words that appear
+            if words:
+                relevance = len(word_hits) / len(words)
+                if relevance >= 0.5:
+                    results[skill] = (True, relevance)
+                    continue
+
+            results[skill] = (False, 0.0)
+
+        return results
+
+
+def load_resume(resume_path: str, cache: Optional[TextCache] = None) -> Tuple[List[Segment], Tuple[str, ...]]:
+    """
+    Return (segments, tokens) for a resume DOCX, PDF or content JSON.
+
+    DOCX and PDF extraction is cached by content hash; content JSON is read
+    directly since there is nothing to parse.
+    """
+    if Path(resume_path).suffix.lower() == ".json":
+        segments = load_segments(resume_path)
+        return segments, tokenize(" ".join(text for _, text in segments))
+
+    if cache is None:
+        cache = TextCache()
+
+    key = cache.key_for(resume_path, salt=Path(resume_path).suffix.lower() + TOKEN_RE.pattern)
+    entry = cache.get(key)
+    if entry is not None:
+        return [tuple(s) for s in entry["segments"]], tuple(entry["tokens"])
+
+    segments = load_segments(resume_path)
+    tokens = tokenize(" ".join(text for _, text in segments))
+    cache.put(key, {"segments": segments, "tokens": list(tokens)})
+    return segments, tokens
+
+
+def coverage_strength(evidence_count: int) -> str:
+    """Map an evidence count to the documented strength levels."""
+    if evidence_count >= 3:
+        return "strong"
+    if evidence_count == 2:
+        return "moderate"
+    if evidence_count == 1:
+        return "weak"
+    return "none"
 
 
 def check_skill_in_text(skill: str, text: str) -> tuple[bool, float]:
@@ -24,60 +176,205 @@ def check_skill_in_text(skill: str, text: str) -> tuple[bool, float]:
     Check if skill is mentioned in text.
     Returns (found, relevance_score).
     """
-    text_lower = text.lower()
-    skill_lower = skill.lower()
-    
-    # Exact match
-    if skill_lower in text_lower:
-        return True, 1.0
-    
-    # Check for common variations
-    variations = {
-        "ml": ["machine learning", "ml", "deep learning"],
-        "a/b testing": ["a/b testing", "ab testing", "experimentation", "experiments"],
-        "sql": ["sql", "structured query language", "database queries"],
-        "aws": ["aws", "amazon web services", "s3", "ec2", "lambda"],
-        "python": ["python", "py", "pandas", "numpy"]
-    }
-    
-    if skill_lower in variations:
-        for variant in variations[skill_lower]:
-            if variant in text_lower:
-                return True, 0.9
-    
-    # Check if any word from skill appears (weak match)
-    skill_words = skill_lower.split()
-    matches = sum(1 for word in skill_words if word in text_lower)
-    if matches > 0:
-        relevance = matches / len(skill_words)
-        if relevance >= 0.5:
-            return True, relevance
-    
-    return False, 0.0
+    return SkillMatcher([skill]).match(text)[skill]
 
 
-def check_coverage(resume_path: str, requirements_path: str) -> dict:
-    """Check coverage of required skills in resume."""
+def check_coverage(resume_path: str, requirements_path: str,
+                   cache: Optional[TextCache] = None,
+                   state_path: Optional[str] = None) -> dict:
+    """
+    Check coverage of required skills in resume.
+
+    With state_path, only bullets added or changed since the run that wrote
+    the state are re-matched, and the result carries a "diff" against that
+    run (see diff_coverage).
+    """
     
     # Load requirements
     with open(requirements_path, 'r') as f:
         requirements = json.load(f)
     
-    # Extract resume text
-    resume_text = extract_text_from_docx(resume_path)
+    # Extract resume text (cached by content hash)
+    segments, tokens = load_resume(resume_path, cache)
+    resume_text = " ".join(text for _, text in segments)
+    
+    if state_path:
+        return incremental_coverage(segments, requirements, state_path)
+    
+    return score_coverage(resume_text, requirements, tokens=tokens, segments=segments)
+
+
+STATE_VERSION = 1
+
+
+def segment_hash(text: str) -> str:
+    import hashlib  # deferred: only needed for incremental runs
+
+    return hashlib.sha1(text.encode('utf-8')).hexdigest()[:16]
+
+
+def requirements_key(requirements: dict) -> str:
+    """Hash everything that changes how bullets match, so stale state is discarded."""
+    return segment_hash(json.dumps(
+        [requirements.get("required_skills", []), SKILL_VARIATIONS, TOKEN_RE.pattern],
+        sort_keys=True
+    ))
+
+
+def incremental_coverage(segments: List[Segment], requirements: dict, state_path: str) -> dict:
+    """
+    Score segments, re-matching only those whose text isn't in the state file.
+
+    The state keeps a per-bullet match index (bullet hash → raw skill hits)
+    and the previous result. Aggregate metrics are rebuilt from the merged
+    hits, so the output is identical to a full run.
+    """
+    try:
+        with open(state_path, 'r', encoding='utf-8') as f:
+            state = json.load(f)
+    except (OSError, ValueError):
+        state = {}
+
+    key = requirements_key(requirements)
+    reusable = state.get("version") == STATE_VERSION and state.get("requirements_key") == key
+    known_hits: Dict[str, Dict[str, list]] = state.get("hits", {}) if reusable else {}
+    previous_ids: Dict[str, str] = state.get("segments", {}) if reusable else {}
+
+    matcher = SkillMatcher([req["skill"] for req in requirements.get("required_skills", [])])
+    hashes = [segment_hash(text) for _, text in segments]
+    segment_hits = []
+    rescored = 0
+    for (_, text), digest in zip(segments, hashes):
+        if digest not in known_hits:
+            known_hits[digest] = matcher.hits(tokenize(text))
+            rescored += 1
+        segment_hits.append(known_hits[digest])
+
+    resume_text = " ".join(text for _, text in segments)
+    result = score_coverage(resume_text, requirements, matcher=matcher,
+                            segments=segments, segment_hits=segment_hits)
+
+    current_ids = {segment_id: digest for (segment_id, _), digest in zip(segments, hashes)}
+    incremental = {
+        "segments": len(segments),
+        "rescored": rescored,
+        "added": [i for i in current_ids if i not in previous_ids],
+        "removed": [i for i in previous_ids if i not in current_ids],
+        "changed": [i for i in current_ids if i in previous_ids and previous_ids[i] != current_ids[i]],
+    }
+
+    new_state = {
+        "version": STATE_VERSION,
+        "requirements_key": key,
+        "segments": current_ids,
+        "hits": {digest: known_hits[digest] for digest in set(hashes)},
+        "result": result,
+    }
+    tmp_path = f"{state_path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(new_state, f)
+    os.replace(tmp_path, state_path)
+
+    output = dict(result, incremental=incremental)
+    if reusable and "result" in state:
+        output["diff"] = diff_coverage(state["result"], result)
+    return output
+
+
+def diff_coverage(before: dict, after: dict) -> dict:
+    """
+    Compare two coverage results (verify_unchanged format).
+
+    A skill is lost if it was covered before and isn't now, and weakened if
+    it is still covered but by fewer segments or with lower relevance.
+    """
+    before_skills = before.get("skill_coverage", {})
+    after_skills = after.get("skill_coverage", {})
+
+    skills_lost = []
+    skills_weakened = []
+    skills_gained = []
+    details = {}
+
+    for skill in sorted(set(before_skills) | set(after_skills)):
+        old = before_skills.get(skill, {})
+        new = after_skills.get(skill, {})
+        old_count = len(old.get("evidence", []))
+        new_count = len(new.get("evidence", []))
+        was_covered = old.get("covered", False)
+        still_covered = new.get("covered", False)
+
+        if was_covered and not still_covered:
+            skills_lost.append(skill)
+        elif still_covered and not was_covered:
+            skills_gained.append(skill)
+        elif still_covered and (new_count < old_count or
+                                new.get("relevance", 0.0) < old.get("relevance", 0.0)):
+            skills_weakened.append(skill)
+        elif old_count == new_count and old.get("relevance") == new.get("relevance"):
+            continue
+
+        details[skill] = {
+            "before_evidence_count": old_count,
+            "after_evidence_count": new_count,
+            "still_covered": still_covered,
+            "strength_change": f"{old.get('coverage_strength', coverage_strength(old_count))} → "
+                               f"{new.get('coverage_strength', coverage_strength(new_count))}"
+        }
+
+    return {
+        "coverage_maintained": not skills_lost,
+        "skills_lost": skills_lost,
+        "skills_weakened": skills_weakened,
+        "skills_gained": skills_gained,
+        "details": details
+    }
+
+
+def score_coverage(resume_text: str, requirements: dict,
+                   matcher: Optional[SkillMatcher] = None,
+                   tokens: Optional[Tuple[str, ...]] = None,
+                   segments: Optional[List[Segment]] = None,
+                   segment_hits: Optional[List[Dict[str, list]]] = None) -> dict:
+    """
+    Score already-extracted resume text against loaded JD requirements.
+
+    Pass a prebuilt matcher and/or tokenized text to reuse them across
+    many resume × JD pairs. When the resume's (segment_id, text) segments
+    are given, skills are matched per segment and each covered skill also
+    lists the segments it was found in; segment_hits (one matcher.hits()
+    result per segment) skips re-matching segments already scored.
+    """
     
     # Analyze coverage
     skill_coverage = {}
     must_have_skills = []
     nice_to_have_skills = []
     
-    for req in requirements.get("required_skills", []):
+    required = requirements.get("required_skills", [])
+    if matcher is None:
+        matcher = SkillMatcher([req["skill"] for req in required])
+    
+    # Attribute each covered skill to the sections/entries that mention it
+    evidence: Dict[str, List[str]] = {}
+    if segments is not None:
+        if segment_hits is None:
+            segment_hits = [matcher.hits(tokenize(text)) for _, text in segments]
+        matches = matcher.resolve(SkillMatcher.merge_hits(segment_hits))
+        for (segment_id, _), hits in zip(segments, segment_hits):
+            for skill, (found, _) in matcher.resolve(hits).items():
+                if found:
+                    evidence.setdefault(skill, []).append(segment_id)
+    else:
+        matches = matcher.match_tokens(tokens if tokens is not None else tokenize(resume_text))
+    
+    for req in required:
         skill = req["skill"]
         category = req.get("category", "must_have")
         importance = req.get("importance", 5)
         
         # Check if skill is in resume
-        found, relevance = check_skill_in_text(skill, resume_text)
+        found, relevance = matches[skill]
         
         skill_coverage[skill] = {
             "required": True,
@@ -86,6 +383,11 @@ def check_coverage(resume_path: str, requirements_path: str) -> dict:
             "relevance": relevance if found else 0.0,
             "category": category
         }
+        if segments is not None:
+            skill_coverage[skill]["evidence"] = evidence.get(skill, [])
+            skill_coverage[skill]["coverage_strength"] = coverage_strength(
+                len(evidence.get(skill, [])) if found else 0
+            )
         
         if category == "must_have":
             must_have_skills.append(skill)
@@ -129,15 +431,122 @@ def check_coverage(resume_path: str, requirements_path: str) -> dict:
     }
 
 
+MATRIX_FIELDS = [
+    "resume", "requirements", "coverage_percentage", "must_have_coverage",
+    "nice_to_have_coverage", "total_required", "total_covered", "status",
+    "missing_skills", "error"
+]
+
+
+def _score_resume(resume_path: str, jds: List[Tuple[str, dict, SkillMatcher]],
+                  use_cache: bool = True) -> List[dict]:
+    """
+    Parse one resume and score it against every JD. Runs inside a worker process.
+
+    Scoring is per segment, as in check_coverage, so a pair gets the same
+    figures whether it is checked alone or as part of a matrix.
+    """
+    try:
+        segments, _ = load_resume(resume_path, TextCache(enabled=use_cache))
+    except Exception as e:
+        return [{"resume": resume_path, "requirements": jd_path, "error": str(e)}
+                for jd_path, _, _ in jds]
+
+    # Tokenize each segment once; only the phrase lookups repeat per JD
+    segment_tokens = [tokenize(text) for _, text in segments]
+    rows = []
+    for jd_path, requirements, matcher in jds:
+        result = score_coverage("", requirements, matcher=matcher, segments=segments,
+                                segment_hits=[matcher.hits(tokens) for tokens in segment_tokens])
+        del result["skill_coverage"]
+        rows.append({"resume": resume_path, "requirements": jd_path, **result})
+    return rows
+
+
+def coverage_matrix(resume_paths: List[str], requirements_paths: List[str],
+                    jobs: int = 1, use_cache: bool = True) -> Iterator[dict]:
+    """
+    Score N resumes against M JDs, yielding one row per pair.
+
+    Requirements are loaded and compiled into a SkillMatcher once per JD;
+    each DOCX is parsed once, with resumes spread across a process pool.
+    Rows are yielded per resume as soon as its worker finishes.
+    """
+    jds = []
+    for path in requirements_paths:
+        with open(path, 'r') as f:
+            requirements = json.load(f)
+        skills = [req["skill"] for req in requirements.get("required_skills", [])]
+        jds.append((path, requirements, SkillMatcher(skills)))
+
+    if jobs <= 1 or len(resume_paths) <= 1:
+        for resume_path in resume_paths:
+            yield from _score_resume(resume_path, jds, use_cache)
+        return
+
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+
+    with ProcessPoolExecutor(max_workers=min(jobs, len(resume_paths))) as pool:
+        futures = [pool.submit(_score_resume, path, jds, use_cache) for path in resume_paths]
+        for future in as_completed(futures):
+            yield from future.result()
+
+
+def write_matrix(rows: Iterator[dict], fmt: str) -> int:
+    """Stream matrix rows to stdout as JSONL or CSV. Returns the number of failed rows."""
+    failed = 0
+    writer = None
+    if fmt == "csv":
+        import csv
+        writer = csv.DictWriter(sys.stdout, fieldnames=MATRIX_FIELDS, extrasaction="ignore")
+        writer.writeheader()
+
+    for row in rows:
+        if "error" in row:
+            failed += 1
+        if writer:
+            writer.writerow({**row, "missing_skills": ";".join(row.get("missing_skills", []))})
+        else:
+            print(json.dumps(row))
+        sys.stdout.flush()
+
+    return failed
+
+
 def main():
     parser = argparse.ArgumentParser(description="Check skill coverage in resume")
-    parser.add_argument("--resume", required=True, help="Path to resume DOCX file")
-    parser.add_argument("--requirements", required=True, help="Path to JD requirements JSON")
+    parser.add_argument("--resume", required=True, nargs="+",
+                        help="Resume DOCX, PDF or content JSON (several for matrix mode)")
+    parser.add_argument("--requirements", required=True, nargs="+",
+                        help="Path to JD requirements JSON (several for matrix mode)")
+    parser.add_argument("--format", choices=["jsonl", "csv"], default="jsonl",
+                        help="Matrix mode output format (default: jsonl)")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1,
+                        help="Matrix mode parallel workers (default: CPU count)")
+    parser.add_argument("--state",
+                        help="Per-bullet match index from the previous run; only changed bullets are re-scored")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Always re-parse DOCX/PDF input; do not read or write the text cache")
     
     args = parser.parse_args()
     
+    if len(args.resume) > 1 or len(args.requirements) > 1:
+        try:
+            failed = write_matrix(coverage_matrix(args.resume, args.requirements, args.jobs,
+                                                   not args.no_cache), args.format)
+            return 1 if failed else 0
+        except FileNotFoundError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 2
+        except (json.JSONDecodeError, KeyError) as e:
+            print(f"Error: Invalid requirements format: {e}", file=sys.stderr)
+            return 3
+    
+    args.resume, args.requirements = args.resume[0], args.requirements[0]
+    
     try:
-        result = check_coverage(args.resume, args.requirements)
+        result = check_coverage(args.resume, args.requirements,
+                                TextCache(enabled=not args.no_cache), args.state)
         print(json.dumps(result, indent=2))
         
         # Exit code based on status
@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+DOCX Text Extraction and Cache for Rescume v2.0
+
+Streams word/document.xml straight out of the DOCX zip with iterparse
+instead of building the python-docx object model. Every paragraph is
+read in document order, including those inside table cells.
+
+Extracted text (and whatever the caller derives from it, e.g. tokens) is
+cached on disk keyed by a hash of the file's bytes. A per-path pointer
+records the mtime and size that hash was taken at, so an unchanged
+resume is answered without reading or parsing it at all.
+
+Usage:
+    docx_text.py <file.docx>
+    docx_text.py [--stats | --clear]
+"""
+
+import json
+import os
+import shutil
+import sys
+import zipfile
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+
+# Configuration
+CACHE_DIR = Path(os.environ.get(
+    "RESCUME_DOCX_CACHE_DIR", Path.home() / ".cache" / "rescume" / "docx"
+))
+
+# Bump when extraction output changes so stale entries are ignored
+EXTRACTOR_VERSION = "2"
+
+W_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+W_P = W_NS + "p"
+W_T = W_NS + "t"
+W_TAB = W_NS + "tab"
+W_BR = W_NS + "br"
+W_BODY = W_NS + "body"
+
+
+def extract_docx_paragraphs(docx_path: str) -> List[str]:
+    """
+    Return the text of every paragraph in the document body, in order.
+
+    Raises zipfile.BadZipFile / KeyError for files that aren't a DOCX.
+    """
+    from xml.etree.ElementTree import iterparse
+
+    paragraphs = []
+    parts = []
+    depth = 0  # nesting of <w:p> (text boxes can nest paragraphs)
+
+    with zipfile.ZipFile(docx_path) as archive:
+        with archive.open("word/document.xml") as xml:
+            for event, elem in iterparse(xml, events=("start", "end")):
+                tag = elem.tag
+                if event == "start":
+                    if tag == W_P:
+                        depth += 1
+                    continue
+
+                if tag == W_T:
+                    parts.append(elem.text or "")
+                elif tag in (W_TAB, W_BR):
+                    parts.append(" ")
+                elif tag == W_P:
+                    depth -= 1
+                    if depth == 0:
+                        paragraphs.append("".join(parts))
+                        parts = []
+                    elem.clear()
+                elif tag == W_BODY:
+                    elem.clear()
+
+    return paragraphs
+
+
+def extract_docx_text(docx_path: str) -> str:
+    """Return the text of every paragraph in the document body, space-joined."""
+    return " ".join(extract_docx_paragraphs(docx_path))
+
+
+class TextCache:
+    """On-disk cache of per-document extraction results."""
+
+    def __init__(self, cache_dir: Path = CACHE_DIR, enabled: bool = True):
+        self.cache_dir = Path(cache_dir)
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _digest(data: bytes) -> str:
+        import hashlib  # deferred: only needed when the cache is enabled
+
+        return hashlib.sha256(data).hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def _pointer_path(self, docx_path: Path) -> Path:
+        return self.cache_dir / "paths" / f"{self._digest(str(docx_path).encode('utf-8'))}.json"
+
+    @staticmethod
+    def _write_json(path: Path, data: Dict[str, Any]) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f".json.{os.getpid()}.tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+        os.replace(tmp_path, path)
+
+    def key_for(self, docx_path: str, salt: str = "") -> str:
+        """
+        Return the content key for docx_path.
+
+        Reuses the stored hash while the file's mtime and size are unchanged,
+        so repeated lookups never read the file.
+        """
+        path = Path(docx_path).resolve()
+        stat = path.stat()
+        signature = [stat.st_mtime_ns, stat.st_size]
+        pointer_path = self._pointer_path(path)
+
+        if self.enabled:
+            try:
+                with open(pointer_path, 'r', encoding='utf-8') as f:
+                    pointer = json.load(f)
+                if pointer["signature"] == signature:
+                    return self._digest(f"{pointer['hash']}:{EXTRACTOR_VERSION}:{salt}".encode('utf-8'))
+            except (OSError, ValueError, KeyError):
+                pass
+
+        content_hash = self._digest(path.read_bytes())
+        if self.enabled:
+            try:
+                self._write_json(pointer_path, {"signature": signature, "hash": content_hash})
+            except OSError:
+                pass
+        return self._digest(f"{content_hash}:{EXTRACTOR_VERSION}:{salt}".encode('utf-8'))
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the stored entry for key, counting the hit or miss."""
+        if not self.enabled:
+            return None
+        try:
+            with open(self._entry_path(key), 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return entry
+
+    def put(self, key: str, entry: Dict[str, Any]) -> None:
+        """Store entry under key."""
+        if not self.enabled:
+            return
+        try:
+            self._write_json(self._entry_path(key), entry)
+        except OSError as e:
+            print(f"Warning: could not write text cache: {e}", file=sys.stderr)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters for this process."""
+        return {"enabled": self.enabled, "hits": self.hits, "misses": self.misses}
+
+    def usage(self) -> Dict[str, Any]:
+        """Return on-disk size and entry count."""
+        files = [p for p in self.cache_dir.glob("*/*.json") if p.parent.name != "paths"]
+        return {
+            "cache_dir": str(self.cache_dir),
+            "entries": len(files),
+            "size_kb": round(sum(p.stat().st_size for p in files) / 1024, 2),
+        }
+
+    def clear(self) -> None:
+        """Remove every cached entry."""
+        if self.cache_dir.exists():
+            shutil.rmtree(self.cache_dir)
+
+
+def main():
+    """CLI entry point."""
+    cache = TextCache()
+
+    if "--clear" in sys.argv:
+        cache.clear()
+        print(f"✓ Cleared DOCX text cache at {cache.cache_dir}")
+        sys.exit(0)
+
+    if "--stats" in sys.argv or len(sys.argv) == 1:
+        print(json.dumps(cache.usage(), indent=2))
+        sys.exit(0)
+
+    try:
+        print(extract_docx_text(sys.argv[1]))
+    except FileNotFoundError:
+        print(f"Error: File not found: {sys.argv[1]}", file=sys.stderr)
+        sys.exit(2)
+    except (zipfile.BadZipFile, KeyError) as e:
+        print(f"Error: Not a DOCX file: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Resume Input Adapters for Rescume v2.0
+
+Turns a resume in any of the formats the pipeline produces into a list of
+(segment_id, text) pairs, so coverage can be checked on the exact artifact
+that ships and each matched skill can be traced back to where it appears.
+
+    .json  resume content JSON (content_schema.json) - no parsing needed;
+           ids look like "experience[0].bullets[2]" or "skills.languages"
+    .pdf   compiled PDF - one segment per text line, e.g. "experience@p1.l14"
+    .docx  Word document - one segment per paragraph, e.g. "document.p7"
+
+Usage:
+    resume_sources.py <resume.json|resume.pdf|resume.docx>
+"""
+
+import json
+import re
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+from docx_text import extract_docx_paragraphs
+
+
+Segment = Tuple[str, str]
+
+# Lines of a compiled PDF that start a new section
+SECTION_HEADINGS = {
+    "summary": "summary",
+    "professional summary": "summary",
+    "education": "education",
+    "experience": "experience",
+    "work experience": "experience",
+    "professional experience": "experience",
+    "projects": "projects",
+    "skills": "skills",
+    "technical skills": "skills",
+}
+
+
+def _entry_id(section: str, index: int, entry: Dict[str, Any]) -> str:
+    """Prefer an entry's own database id; fall back to its position."""
+    return str(entry["id"]) if entry.get("id") else f"{section}[{index}]"
+
+
+def segments_from_content(content: Dict[str, Any]) -> List[Segment]:
+    """Split already-loaded resume content JSON into attributed segments."""
+    segments: List[Segment] = []
+
+    if content.get("summary"):
+        segments.append(("summary", content["summary"]))
+
+    for section, title_keys, list_key in (
+        ("experience", ("role", "company"), "bullets"),
+        ("projects", ("name", "subtitle"), "bullets"),
+        ("education", ("degree", "institution"), "details"),
+    ):
+        for i, entry in enumerate(content.get(section) or []):
+            entry_id = _entry_id(section, i, entry)
+            title = " ".join(str(entry[k]) for k in title_keys if entry.get(k))
+            if title:
+                segments.append((entry_id, title))
+            for j, line in enumerate(entry.get(list_key) or []):
+                segments.append((f"{entry_id}.{list_key}[{j}]", line))
+
+    skills = content.get("skills") or {}
+    if isinstance(skills, dict):
+        for category, items in skills.items():
+            if isinstance(items, list):
+                segments.append((f"skills.{category}", ", ".join(map(str, items))))
+            else:
+                segments.append((f"skills.{category}", str(items)))
+    elif isinstance(skills, list):
+        segments.append(("skills", ", ".join(map(str, skills))))
+
+    return segments
+
+
+def segments_from_json(json_path: str) -> List[Segment]:
+    """Read resume content JSON from disk into attributed segments."""
+    with open(json_path, 'r', encoding='utf-8') as f:
+        return segments_from_content(json.load(f))
+
+
+def segments_from_pdf(pdf_path: str) -> List[Segment]:
+    """
+    Extract one segment per text line of a PDF.
+
+    Lines are tagged with the most recent section heading seen, so a skill
+    found in a compiled resume can still be traced to its section.
+    """
+    # Imported here so JSON and DOCX inputs don't pay for pdfminer
+    try:
+        import pdfplumber
+    except ImportError:
+        raise RuntimeError("pdfplumber not installed. Run: pip install pdfplumber")
+
+    segments: List[Segment] = []
+    section = "header"
+    with pdfplumber.open(pdf_path) as pdf:
+        for page_no, page in enumerate(pdf.pages, 1):
+            for line_no, line in enumerate((page.extract_text() or "").splitlines(), 1):
+                line = line.strip()
+                if not line:
+                    continue
+                heading = re.sub(r"[^a-z ]", "", line.lower()).strip()
+                if heading in SECTION_HEADINGS:
+                    section = SECTION_HEADINGS[heading]
+                    continue
+                segments.append((f"{section}@p{page_no}.l{line_no}", line))
+
+    return segments
+
+
+def segments_from_docx(docx_path: str) -> List[Segment]:
+    """Extract one segment per non-empty DOCX paragraph."""
+    return [
+        (f"document.p{i}", text)
+        for i, text in enumerate(extract_docx_paragraphs(docx_path))
+        if text.strip()
+    ]
+
+
+def load_segments(resume_path: str) -> List[Segment]:
+    """Dispatch on file extension; anything unrecognised is read as DOCX."""
+    suffix = Path(resume_path).suffix.lower()
+    if suffix == ".json":
+        return segments_from_json(resume_path)
+    if suffix == ".pdf":
+        return segments_from_pdf(resume_path)
+    return segments_from_docx(resume_path)
+
+
+def main():
+    """CLI entry point."""
+    if len(sys.argv) != 2:
+        print("Usage: resume_sources.py <resume.json|resume.pdf|resume.docx>")
+        sys.exit(1)
+
+    try:
+        for segment_id, text in load_segments(sys.argv[1]):
+            print(f"{segment_id}\t{text}")
+    except FileNotFoundError:
+        print(f"Error: File not found: {sys.argv[1]}", file=sys.stderr)
+        sys.exit(2)
+    except json.JSONDecodeError as e:
+        print(f"Error: Invalid JSON - {e}", file=sys.stderr)
+        sys.exit(3)
+    except Exception as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""Verify that coverage did not degrade between two check_coverage runs."""
+
+import argparse
+import json
+import sys
+
+from check_coverage import diff_coverage
+
+
+def load_coverage(path: str) -> dict:
+    """Load a check_coverage result, or the last result stored in a --state file."""
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    if "skill_coverage" not in data and "result" in data:
+        return data["result"]
+    return data
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Verify coverage hasn't degraded")
+    parser.add_argument("--before", required=True, help="Coverage JSON before compression")
+    parser.add_argument("--after", required=True, help="Coverage JSON after compression")
+
+    args = parser.parse_args()
+
+    try:
+        result = diff_coverage(load_coverage(args.before), load_coverage(args.after))
+    except FileNotFoundError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+    except json.JSONDecodeError as e:
+        print(f"Error: Invalid JSON - {e}", file=sys.stderr)
+        return 3
+
+    print(json.dumps(result, indent=2))
+    return 0 if result["coverage_maintained"] else 1
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Storage Backend Benchmark for Rescume v2.0
+
+Times add / load / query on the JSON-directory and SQLite backends for a
+synthetic database at 10x, 100x and 1000x a base of one experience (four
+bullets), one project and one skill.
+
+    add    db_add.add_entry for --adds new experiences
+    load   db_load.load_database of the whole database
+    query  entries demonstrating one skill (JSON: load + scan;
+           SQLite: indexed entry_skills lookup)
+    search bullets containing a word (JSON: load + scan; SQLite: FTS5)
+
+Usage:
+    bench_storage.py [--scales 10,100,1000] [--adds N]
+"""
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent / "scripts"
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+from db_add import add_entry  # noqa: E402
+from db_load import load_database  # noqa: E402
+from db_save import save_database  # noqa: E402
+from db_sqlite import SqliteBackend  # noqa: E402
+
+SKILL_POOL = ["Python", "SQL", "Kafka", "Spark", "React", "AWS", "Docker", "Go"]
+
+
+def synthetic_database(scale: int) -> dict:
+    experiences, projects, skills = [], [], []
+    for i in range(1, scale + 1):
+        experiences.append({
+            "id": f"exp_{i:03d}",
+            "company": f"Company {i}",
+            "role": "Engineer",
+            "duration": "2020-2024",
+            "bullets": [
+                {
+                    "id": f"bullet_{i}_{j}",
+                    "text": f"Built {SKILL_POOL[(i + j) % len(SKILL_POOL)]} service number {i}-{j} "
+                            f"improving throughput by {j * 10}%",
+                    "skills_demonstrated": [SKILL_POOL[(i + j) % len(SKILL_POOL)]],
+                }
+                for j in range(4)
+            ],
+        })
+        projects.append({
+            "id": f"project_{i:03d}",
+            "name": f"Project {i}",
+            "description": "Side project",
+            "technologies": [SKILL_POOL[i % len(SKILL_POOL)]],
+        })
+        skills.append({"id": f"skill_{i:03d}", "name": f"{SKILL_POOL[i % len(SKILL_POOL)]} {i}"})
+    return {
+        "experiences": {"experiences": experiences},
+        "projects": {"projects": projects},
+        "skills": {"skills": skills},
+        "education": {"education": []},
+        "metadata": {"name": "Bench", "email": "bench@example.com"},
+    }
+
+
+def timed(fn, repeat: int = 1) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) * 1000 / repeat
+
+
+def json_query(db_path: str, skill: str) -> list:
+    data = load_database(db_path)
+    found = []
+    for key in ("experiences", "projects", "skills"):
+        for entry in data.get(key, {}).get(key, []):
+            names = {s for b in entry.get("bullets", []) for s in b.get("skills_demonstrated", [])}
+            names.update(entry.get("technologies", []))
+            if skill in names:
+                found.append(entry)
+    return found
+
+
+def json_search(db_path: str, word: str) -> list:
+    data = load_database(db_path, "experiences")
+    return [e for e in data["experiences"]
+            if any(word in b.get("text", "").lower() for b in e.get("bullets", []))]
+
+
+def sqlite_query(db_path: str, skill: str) -> list:
+    with SqliteBackend(db_path, create=False) as backend:
+        return backend.by_skill(skill)
+
+
+def sqlite_search(db_path: str, word: str) -> list:
+    with SqliteBackend(db_path, create=False) as backend:
+        return backend.search(word)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark JSON vs SQLite storage")
+    parser.add_argument("--scales", default="10,100,1000", help="Comma-separated entry multipliers")
+    parser.add_argument("--adds", type=int, default=20, help="Entries added per measurement")
+    args = parser.parse_args()
+
+    new_entry = {"company": "New", "role": "Engineer",
+                 "bullets": [{"text": "Shipped Kafka pipeline", "skills_demonstrated": ["Kafka"]}]}
+    rows = []
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for scale in [int(s) for s in args.scales.split(",")]:
+            data = synthetic_database(scale)
+            json_path = str(Path(tmp) / f"json_{scale}")
+            sqlite_path = str(Path(tmp) / f"db_{scale}.sqlite")
+            save_database(json_path, data)
+            SqliteBackend(sqlite_path).save(data)
+
+            for backend, db_path, query, search in (
+                ("json", json_path, json_query, json_search),
+                ("sqlite", sqlite_path, sqlite_query, sqlite_search),
+            ):
+                rows.append({
+                    "backend": backend,
+                    "scale": scale,
+                    "add_ms": round(timed(lambda: add_entry(db_path, "experience", dict(new_entry)),
+                                          args.adds), 3),
+                    "load_ms": round(timed(lambda: load_database(db_path), 3), 3),
+                    "query_ms": round(timed(lambda: query(db_path, "Kafka"), 3), 3),
+                    "search_ms": round(timed(lambda: search(db_path, "kafka"), 3), 3),
+                })
+                print(json.dumps(rows[-1]), file=sys.stderr)
+
+    print(f"{'backend':<8} {'scale':>6} {'add ms':>9} {'load ms':>9} {'query ms':>9} {'search ms':>10}")
+    for row in rows:
+        print(f"{row['backend']:<8} {row['scale']:>6} {row['add_ms']:>9} {row['load_ms']:>9} "
+              f"{row['query_ms']:>9} {row['search_ms']:>10}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,14 +1,37 @@
 #!/usr/bin/env python3
-"""Add new entry to resume database with auto-generated ID."""
+"""
+Add new entry to resume database with auto-generated ID.
+
+--bulk reads JSONL records ({"type": "experience", "data": {...}}) from a
+file or stdin and applies them in one locked pass: ids are assigned once,
+records whose content matches an existing entry are skipped, and records
+carrying an existing id replace that entry.
+"""
 
 import argparse
+import hashlib
 import json
 import sys
 from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+
+from db_index import DatabaseIndex
+from db_journal import append_records, compact, journal_path, load_files
+from db_lock import bump_versions, database_lock
+from db_sqlite import SqliteBackend, is_sqlite_path
+
+
+# type → (file, key, id prefix)
+TYPE_MAP = {
+    "experience": ("experiences.json", "experiences", "exp"),
+    "skill": ("skills.json", "skills", "skill"),
+    "project": ("projects.json", "projects", "project"),
+    "education": ("education.json", "education", "edu")
+}
 
 
 def generate_id(entries: list, prefix: str) -> str:
-    """Generate unique ID for new entry."""
+    """Generate unique ID for new entry by scanning existing IDs (used when no index)."""
     if not entries:
         return f"{prefix}_001"
     
@@ -32,53 +55,178 @@ def add_entry(db_path: str, entry_type: str, data: dict) -> str:
     """Add new entry to database."""
     db_path = Path(db_path)
     
-    # Map type to file and key
-    type_map = {
-        "experience": ("experiences.json", "experiences", "exp"),
-        "skill": ("skills.json", "skills", "skill"),
-        "project": ("projects.json", "projects", "project"),
-        "education": ("education.json", "education", "edu")
-    }
+    if entry_type not in TYPE_MAP:
+        raise ValueError(f"Invalid type: {entry_type}. Must be: {', '.join(TYPE_MAP.keys())}")
+    
+    filename, key, prefix = TYPE_MAP[entry_type]
     
-    if entry_type not in type_map:
-        raise ValueError(f"Invalid type: {entry_type}. Must be: {', '.join(type_map.keys())}")
+    if is_sqlite_path(db_path):
+        with SqliteBackend(db_path) as backend:
+            return backend.add(key, data)
     
-    filename, key, prefix = type_map[entry_type]
-    filepath = db_path / filename
+    if not db_path.is_dir():
+        raise FileNotFoundError(f"Database not found: {db_path}")
     
-    # Load existing data
-    if filepath.exists():
-        with open(filepath, 'r') as f:
-            db_data = json.load(f)
-    else:
-        db_data = {key: []}
+    # Id assignment and the append must not interleave with another writer
+    with database_lock(db_path):
+        # Generate ID from the index's persisted counter, falling back to a scan
+        try:
+            index = DatabaseIndex(db_path)
+            if index.stale and journal_path(db_path).exists():
+                # The rebuilt counter would miss journaled ids; fold them in first
+                compact(db_path)
+                index = DatabaseIndex(db_path)
+            index.refresh()
+            new_id = index.next_id(key)
+            index.save()
+        except (OSError, ValueError):
+            entries = load_files(db_path, [key]).get(key, {}).get(key, [])
+            new_id = generate_id(entries, prefix)
+        data['id'] = new_id
+        
+        # Journal first, so a crash mid-rewrite is replayed on the next load;
+        # then fold it in, so readers of the table files see the entry at once
+        append_records(db_path, [{"op": "upsert", "table": key, "entry": data}])
+        bump_versions(db_path, [key])
+        compact(db_path)
     
-    entries = db_data.get(key, [])
+    return new_id
+
+
+def fingerprint(entry: Dict[str, Any]) -> str:
+    """Content hash of an entry, ignoring ids and case/whitespace differences in text."""
+    def canonical(value: Any) -> Any:
+        if isinstance(value, dict):
+            return {k: canonical(v) for k, v in value.items() if k != "id"}
+        if isinstance(value, list):
+            return [canonical(v) for v in value]
+        if isinstance(value, str):
+            return " ".join(value.split()).lower()
+        return value
+
+    return hashlib.sha1(json.dumps(canonical(entry), sort_keys=True).encode()).hexdigest()
+
+
+def read_bulk_records(lines: Iterable[str]) -> List[Tuple[str, Dict[str, Any]]]:
+    """Parse and check every JSONL record up front, so a bad line writes nothing."""
+    records = []
+    for line_no, line in enumerate(lines, 1):
+        if not line.strip():
+            continue
+        record = json.loads(line)
+        if not isinstance(record, dict) or not isinstance(record.get("data"), dict):
+            raise ValueError(f"Line {line_no}: expected {{\"type\": ..., \"data\": {{...}}}}")
+        if record.get("type") not in TYPE_MAP:
+            raise ValueError(f"Line {line_no}: invalid type {record.get('type')!r}. "
+                             f"Must be: {', '.join(TYPE_MAP.keys())}")
+        records.append((TYPE_MAP[record["type"]][1], record["data"]))
+    return records
+
+
+def plan_upserts(records: List[Tuple[str, Dict[str, Any]]],
+                 existing: Dict[str, List[Dict[str, Any]]],
+                 next_id: Callable[[str], str]) -> Tuple[List[Tuple[str, Dict[str, Any]]], Dict[str, list]]:
+    """
+    Decide what each (table, data) record does against the existing entries.
+
+    Returns (upserts to write, {"added", "updated", "unchanged": [ids]}).
+    """
+    by_id = {key: {e["id"]: fingerprint(e) for e in entries if isinstance(e, dict) and e.get("id")}
+             for key, entries in existing.items()}
+    by_fingerprint = {key: {fp: entry_id for entry_id, fp in ids.items()}
+                      for key, ids in by_id.items()}
+    upserts = []
+    summary = {"added": [], "updated": [], "unchanged": []}
+
+    for key, data in records:
+        fp = fingerprint(data)
+        entry_id = data.get("id")
+        if entry_id and entry_id in by_id[key]:
+            if by_id[key][entry_id] == fp:
+                summary["unchanged"].append(entry_id)
+                continue
+            summary["updated"].append(entry_id)
+        elif not entry_id and fp in by_fingerprint[key]:
+            summary["unchanged"].append(by_fingerprint[key][fp])
+            continue
+        else:
+            if not entry_id:
+                data["id"] = entry_id = next_id(key)
+            summary["added"].append(entry_id)
+
+        by_id[key][entry_id] = fp
+        by_fingerprint[key][fp] = entry_id
+        upserts.append((key, data))
+
+    return upserts, summary
+
+
+def bulk_add(db_path: str, records: List[Tuple[str, Dict[str, Any]]]) -> Dict[str, list]:
+    """Add or update many (table, data) records in one pass; see plan_upserts."""
+    db_path = Path(db_path)
+    tables = sorted({key for key, _ in records})
     
-    # Generate ID and add to data
-    new_id = generate_id(entries, prefix)
-    data['id'] = new_id
+    if is_sqlite_path(db_path):
+        with SqliteBackend(db_path) as backend, backend.write_transaction():
+            existing = {key: backend.entries(key) for key in tables}
+            upserts, summary = plan_upserts(records, existing, backend.next_id)
+            for key, data in upserts:
+                backend.upsert(key, data)
+            backend.bump_versions({key for key, _ in upserts})
+        return summary
     
-    # Add to entries
-    entries.append(data)
-    db_data[key] = entries
+    if not db_path.is_dir():
+        raise FileNotFoundError(f"Database not found: {db_path}")
     
-    # Save
-    with open(filepath, 'w') as f:
-        json.dump(db_data, f, indent=2)
+    with database_lock(db_path):
+        index = DatabaseIndex(db_path)
+        if index.stale and journal_path(db_path).exists():
+            compact(db_path)
+            index = DatabaseIndex(db_path)
+        index.refresh()
+        
+        existing = {key: content.get(key, []) for key, content in load_files(db_path, tables).items()}
+        existing.update({key: [] for key in tables if key not in existing})
+        upserts, summary = plan_upserts(records, existing, index.next_id)
+        if not upserts:
+            return summary
+        
+        for key, data in upserts:
+            index.note_id(key, data["id"])
+        index.save()
+        
+        # The whole batch is one journal write; compaction then rewrites each
+        # touched table once, so readers of the table files see the import
+        append_records(db_path, [{"op": "upsert", "table": key, "entry": data}
+                                 for key, data in upserts])
+        bump_versions(db_path, {key for key, _ in upserts})
+        compact(db_path)
     
-    return new_id
+    return summary
 
 
 def main():
     parser = argparse.ArgumentParser(description="Add entry to resume database")
     parser.add_argument("--db-path", required=True, help="Database directory path")
-    parser.add_argument("--type", required=True, help="Entry type (experience, skill, project, education)")
-    parser.add_argument("--data", required=True, help="JSON data for new entry")
+    parser.add_argument("--type", help="Entry type (experience, skill, project, education)")
+    parser.add_argument("--data", help="JSON data for new entry")
+    parser.add_argument("--bulk", metavar="FILE",
+                        help="JSONL file of {\"type\", \"data\"} records to add or update ('-' for stdin)")
     
     args = parser.parse_args()
+    if args.bulk is None and not (args.type and args.data):
+        parser.error("--type and --data are required unless --bulk is given")
     
     try:
+        if args.bulk is not None:
+            if args.bulk == "-":
+                records = read_bulk_records(sys.stdin)
+            else:
+                with open(args.bulk, 'r') as f:
+                    records = read_bulk_records(f)
+            print(json.dumps(bulk_add(args.db_path, records)))
+            return 0
+        
         data = json.loads(args.data)
         new_id = add_entry(args.db_path, args.type, data)
         print(f"Added entry with ID: {new_id}")
@@ -86,6 +234,9 @@ def main():
     except json.JSONDecodeError as e:
         print(f"Error: Invalid JSON - {e}", file=sys.stderr)
         return 1
+    except FileNotFoundError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
     except ValueError as e:
         print(f"Error: {e}", file=sys.stderr)
         return 1
@@ -0,0 +1,373 @@
+#!/usr/bin/env python3
+"""
+Derived lookup index for the resume database.
+
+Maintains .index.json next to the table files, mapping:
+  - id → table and byte span of the record inside its JSON file
+  - skill → ids of experiences/projects/skills that demonstrate it
+  - technology → ids of entries that list it
+  - next-id counter per prefix, so db_add never scans for the max id
+
+Records are read by seeking to their byte span, so a lookup parses only
+the entries it returns; pending journal records are overlaid in memory,
+and compacting them is left to writers. Each table's file size and mtime
+are recorded; a table edited by hand is re-scanned automatically on the
+next lookup. Lookups run under a shared database lock so spans can't go
+stale mid-read.
+"""
+
+import argparse
+import json
+import os
+import sys
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from db_lock import database_lock
+
+
+INDEX_FILE = ".index.json"
+INDEX_VERSION = 1
+
+# table → id prefix (same mapping as db_add)
+TABLES = {
+    "experiences": "exp",
+    "skills": "skill",
+    "projects": "project",
+    "education": "edu",
+}
+
+
+def normalize(name: str) -> str:
+    """Case- and whitespace-insensitive key for skill/technology lookups."""
+    return " ".join(str(name).lower().split())
+
+
+def file_signature(filepath: Path) -> Optional[List[int]]:
+    try:
+        stat = filepath.stat()
+    except OSError:
+        return None
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def iter_table(text: str, key: str, name: str = "table") -> Iterator[Tuple[Any, int, int]]:
+    """
+    Yield (entry, start, end) for every entry in text[key] as it is parsed.
+
+    Walks the JSON with raw_decode, so entries are produced one at a time
+    with their exact str offsets; works for any JSON formatting, not just
+    what db_save writes.
+    """
+    decoder = json.JSONDecoder()
+
+    def skip_ws(pos: int) -> int:
+        while pos < len(text) and text[pos] in " \t\r\n":
+            pos += 1
+        return pos
+
+    pos = skip_ws(0)
+    if text[pos:pos + 1] != "{":
+        raise ValueError(f"{name}: expected a JSON object")
+    pos = skip_ws(pos + 1)
+
+    while pos < len(text) and text[pos] != "}":
+        field, pos = decoder.raw_decode(text, pos)
+        pos = skip_ws(pos)
+        if text[pos] != ":":
+            raise ValueError(f"{name}: expected ':' at {pos}")
+        pos = skip_ws(pos + 1)
+
+        if field == key and text[pos] == "[":
+            pos = skip_ws(pos + 1)
+            while text[pos] != "]":
+                entry, end = decoder.raw_decode(text, pos)
+                yield entry, pos, end
+                pos = skip_ws(end)
+                if text[pos] == ",":
+                    pos = skip_ws(pos + 1)
+            return
+
+        _, pos = decoder.raw_decode(text, pos)
+        pos = skip_ws(pos)
+        if text[pos:pos + 1] == ",":
+            pos = skip_ws(pos + 1)
+
+
+def scan_table(filepath: Path, key: str) -> List[Tuple[Dict[str, Any], int, int]]:
+    """Return (entry, byte_start, byte_end) for every entry in filepath[key]."""
+    raw = filepath.read_bytes()
+    text = raw.decode('utf-8')
+    if len(raw) == len(text):
+        # ASCII: byte offsets are str offsets
+        return list(iter_table(text, key, filepath.name))
+
+    entries = []
+    last_pos = last_byte = 0
+    for entry, start, end in iter_table(text, key, filepath.name):
+        start_byte = last_byte + len(text[last_pos:start].encode('utf-8'))
+        end_byte = start_byte + len(text[start:end].encode('utf-8'))
+        entries.append((entry, start_byte, end_byte))
+        last_pos, last_byte = end, end_byte
+    return entries
+
+
+def entry_skills(entry: Dict[str, Any]) -> Iterable[str]:
+    """Skills an entry demonstrates: bullet skills, its own skill lists and technologies."""
+    for bullet in entry.get("bullets") or []:
+        if isinstance(bullet, dict):
+            yield from bullet.get("skills_demonstrated") or []
+    yield from entry.get("skills_demonstrated") or []
+    yield from entry.get("skills") or []
+    yield from entry.get("technologies") or []
+
+
+def entry_technologies(entry: Dict[str, Any]) -> Iterable[str]:
+    yield from entry.get("technologies") or []
+
+
+def entry_names(key: str, entry: Dict[str, Any], field: str) -> set:
+    """Normalized names an entry of table key is indexed under for field."""
+    if field == "technologies":
+        return set(map(normalize, entry_technologies(entry)))
+    names = set(map(normalize, entry_skills(entry)))
+    if key == "skills" and entry.get("name"):
+        names.add(normalize(entry["name"]))
+    return names
+
+
+def id_number(entry_id: str) -> int:
+    try:
+        return int(str(entry_id).split('_')[1])
+    except (IndexError, ValueError):
+        return 0
+
+
+class DatabaseIndex:
+    """Lookup index for one database directory."""
+
+    def __init__(self, db_path: str):
+        self.db_path = Path(db_path)
+        self.path = self.db_path / INDEX_FILE
+        self.data = self._load()
+        # id → (table, entry) for journal records not yet in the table files
+        self.pending: Dict[str, Tuple[str, Dict[str, Any]]] = {}
+
+    def _load(self) -> Dict[str, Any]:
+        self.stale = False
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get("version") == INDEX_VERSION:
+                return data
+        except (OSError, ValueError):
+            pass
+        # Missing, corrupt or from another version: the persisted next-id
+        # counters are gone and must be rebuilt from the table files
+        self.stale = True
+        return {"version": INDEX_VERSION, "tables": {}, "next_id": {}}
+
+    def save(self) -> None:
+        """Write the index atomically."""
+        tmp_path = self.path.with_suffix(f".json.{os.getpid()}.tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            # dumps() uses the C encoder; dump() streams through the pure-Python one
+            f.write(json.dumps(self.data, separators=(",", ":")))
+        os.replace(tmp_path, self.path)
+
+    def refresh(self, tables: Optional[Iterable[str]] = None) -> bool:
+        """
+        Re-scan the given tables (default: any whose file changed on disk).
+
+        Returns True if anything was re-scanned; call save() to persist.
+        """
+        changed = False
+        for key in (tables if tables is not None else TABLES):
+            filepath = self.db_path / f"{key}.json"
+            signature = file_signature(filepath)
+            table = self.data["tables"].get(key)
+            if tables is None and table and table["signature"] == signature:
+                continue
+
+            entries = scan_table(filepath, key) if signature else []
+            table = {"signature": signature, "ids": {}, "skills": {}, "technologies": {}}
+            max_num = 0
+            for entry, start, end in entries:
+                entry_id = entry.get("id") if isinstance(entry, dict) else None
+                if not entry_id:
+                    continue
+                table["ids"][entry_id] = [start, end]
+                max_num = max(max_num, id_number(entry_id))
+
+                for name in entry_names(key, entry, "skills"):
+                    table["skills"].setdefault(name, []).append(entry_id)
+                for tech in entry_names(key, entry, "technologies"):
+                    table["technologies"].setdefault(tech, []).append(entry_id)
+
+            self.data["tables"][key] = table
+            prefix = TABLES[key]
+            # Counter only moves forward, so ids of deleted entries are never reused
+            self.data["next_id"][prefix] = max(self.data["next_id"].get(prefix, 1), max_num + 1)
+            changed = True
+
+        return changed
+
+    def ensure_fresh(self) -> "DatabaseIndex":
+        """
+        Re-scan stale tables, persist the index if anything changed, and
+        pick up pending journal records so lookups return them.
+
+        Only reads: the journal is overlaid in memory and never compacted.
+        """
+        from db_journal import read_records
+
+        # Shared is enough: writers are excluded, and reloading under the lock
+        # means a save can't roll back a db_add's id counter
+        with database_lock(self.db_path, exclusive=False):
+            self.data = self._load()
+            if self.refresh():
+                try:
+                    self.save()
+                except OSError:
+                    pass
+            records, _ = read_records(self.db_path)
+        self.pending = {record["entry"]["id"]: (record["table"], record["entry"])
+                        for record in records
+                        if isinstance(record.get("entry"), dict) and record["entry"].get("id")}
+        return self
+
+    def next_id(self, key: str, reserve: bool = True) -> str:
+        """Return the next id for a table, advancing the persisted counter."""
+        prefix = TABLES[key]
+        num = self.data["next_id"].get(prefix, 1)
+        if reserve:
+            self.data["next_id"][prefix] = num + 1
+        return f"{prefix}_{num:03d}"
+
+    def note_id(self, key: str, entry_id: str) -> None:
+        """Advance the counter past an id assigned elsewhere (e.g. given in a bulk import)."""
+        prefix = TABLES[key]
+        self.data["next_id"][prefix] = max(self.data["next_id"].get(prefix, 1),
+                                           id_number(entry_id) + 1)
+
+    def locate(self, entry_id: str) -> Optional[Tuple[str, int, int]]:
+        """Return (table, byte_start, byte_end) for an id."""
+        for key, table in self.data["tables"].items():
+            span = table["ids"].get(entry_id)
+            if span:
+                return key, span[0], span[1]
+        return None
+
+    def table_of(self, entry_id: str) -> Optional[str]:
+        """Table holding an id, counting pending journal records."""
+        if entry_id in self.pending:
+            return self.pending[entry_id][0]
+        location = self.locate(entry_id)
+        return location[0] if location else None
+
+    def table_ids(self, key: str) -> List[str]:
+        """Ids in a table, counting pending journal records."""
+        ids = list(self.data["tables"].get(key, {}).get("ids", {}))
+        seen = set(ids)
+        ids += [i for i, (table, _) in self.pending.items() if table == key and i not in seen]
+        return ids
+
+    def get(self, entry_ids: Iterable[str]) -> List[Dict[str, Any]]:
+        """Read just the requested records from disk, in the order given."""
+        records = []
+        handles: Dict[str, Any] = {}
+        try:
+            for entry_id in entry_ids:
+                if entry_id in self.pending:
+                    records.append(self.pending[entry_id][1])
+                    continue
+                location = self.locate(entry_id)
+                if location is None:
+                    continue
+                key, start, end = location
+                if key not in handles:
+                    handles[key] = open(self.db_path / f"{key}.json", 'rb')
+                f = handles[key]
+                f.seek(start)
+                records.append(json.loads(f.read(end - start)))
+        finally:
+            for f in handles.values():
+                f.close()
+        return records
+
+    def ids_for(self, field: str, names: Iterable[str],
+                tables: Optional[Iterable[str]] = None) -> List[str]:
+        """Ids of entries whose skills/technologies include any of names."""
+        wanted = [normalize(n) for n in names]
+        ids: List[str] = []
+        for key in (tables or self.data["tables"]):
+            lookup = self.data["tables"].get(key, {}).get(field, {})
+            for name in wanted:
+                # A pending record replaces the indexed one, so it is matched below
+                ids.extend(i for i in lookup.get(name, [])
+                           if i not in ids and i not in self.pending)
+            for entry_id, (table, entry) in self.pending.items():
+                if table == key and entry_id not in ids and entry_names(key, entry, field) & set(wanted):
+                    ids.append(entry_id)
+        return ids
+
+
+def update_index(db_path: str, tables: Iterable[str]) -> None:
+    """Re-index tables just written by db_add/db_save. Never fails the write."""
+    tables = [t for t in tables if t in TABLES]
+    if not tables:
+        return
+    try:
+        index = DatabaseIndex(db_path)
+        index.refresh(tables)
+        index.save()
+    except (OSError, ValueError) as e:
+        print(f"Warning: could not update database index: {e}", file=sys.stderr)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Query the resume database index")
+    parser.add_argument("--db-path", required=True, help="Database directory path")
+    parser.add_argument("--id", action="append", default=[], help="Entry id (repeatable)")
+    parser.add_argument("--skill", action="append", default=[],
+                        help="Entries demonstrating a skill (repeatable)")
+    parser.add_argument("--technology", action="append", default=[],
+                        help="Entries listing a technology (repeatable)")
+    parser.add_argument("--type", choices=list(TABLES), help="Restrict --skill/--technology to one table")
+    parser.add_argument("--rebuild", action="store_true", help="Re-scan every table")
+
+    args = parser.parse_args()
+
+    if not Path(args.db_path).exists():
+        print(f"Error: Database not found: {args.db_path}", file=sys.stderr)
+        return 2
+
+    # Shared: lookups (and --rebuild, which only rewrites the derived index) are reads
+    with database_lock(args.db_path, exclusive=False):
+        try:
+            index = DatabaseIndex(args.db_path)
+            if args.rebuild:
+                index.refresh(list(TABLES))
+                index.save()
+            index.ensure_fresh()
+        except (OSError, ValueError) as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 1
+
+        tables = [args.type] if args.type else None
+        ids = list(args.id)
+        ids += [i for i in index.ids_for("skills", args.skill, tables) if i not in ids]
+        ids += [i for i in index.ids_for("technologies", args.technology, tables) if i not in ids]
+
+        if not (args.id or args.skill or args.technology):
+            summary = {key: len(index.table_ids(key)) for key in index.data["tables"]}
+            print(json.dumps({"entries": summary, "next_id": index.data["next_id"]}))
+            return 0
+
+        records = index.get(ids)
+    print(json.dumps(records))
+    return 0 if records else 3
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -2,15 +2,18 @@
 """Initialize empty resume database structure."""
 
 import argparse
-import json
 import os
 from pathlib import Path
 
+from db_index import INDEX_FILE
+from db_journal import JOURNAL_FILE, atomic_write_json
+from db_lock import bump_versions, database_lock
+from db_sqlite import SqliteBackend, is_sqlite_path
+
 
 def create_empty_database(output_path: str) -> None:
     """Create empty database files with proper structure."""
     db_path = Path(output_path)
-    db_path.mkdir(parents=True, exist_ok=True)
     
     # Empty structures
     empty_experiences = {"experiences": []}
@@ -37,11 +40,29 @@ def create_empty_database(output_path: str) -> None:
         "metadata.json": empty_metadata
     }
     
-    for filename, data in files.items():
-        filepath = db_path / filename
-        with open(filepath, 'w') as f:
-            json.dump(data, f, indent=2)
-        print(f"Created: {filepath}")
+    if is_sqlite_path(output_path):
+        if db_path.exists():
+            raise FileExistsError(f"Database already exists: {output_path}")
+        with SqliteBackend(output_path) as backend:
+            backend.save({filename[:-len(".json")]: data for filename, data in files.items()})
+        print(f"\n✓ Database initialized at: {output_path}")
+        return
+    
+    db_path.mkdir(parents=True, exist_ok=True)
+    
+    with database_lock(db_path):
+        # Drop any journal, index and id counters left over from a previous database
+        for leftover in (JOURNAL_FILE, INDEX_FILE):
+            if (db_path / leftover).exists():
+                (db_path / leftover).unlink()
+        
+        for filename, data in files.items():
+            filepath = db_path / filename
+            atomic_write_json(filepath, data)
+            print(f"Created: {filepath}")
+        
+        # Versions keep counting up, so a save based on the old database conflicts
+        bump_versions(db_path, [filename[:-len(".json")] for filename in files])
     
     print(f"\n✓ Database initialized at: {output_path}")
 
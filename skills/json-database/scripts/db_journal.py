@@ -0,0 +1,312 @@
+#!/usr/bin/env python3
+"""
+Write-ahead journal and atomic snapshot writes for the resume database.
+
+db_add appends one JSON line per entry to journal.jsonl (fsync'd) and
+then compacts it: every touched table is rewritten atomically (temp file
++ fsync + rename) and the journal is removed, so the table files stay
+current for direct readers. Loads read the snapshot files and replay any
+journal left by a crash on top. All of this happens under the database
+lock (see db_lock).
+
+Journal records upsert by id, so replaying a record that already reached
+the snapshot (e.g. after a crash mid-compaction) is harmless.
+
+Usage:
+    db_journal.py status  --db-path <path>
+    db_journal.py compact --db-path <path>
+    db_journal.py repair  --db-path <path>
+"""
+
+import argparse
+import json
+import os
+import sys
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Tuple
+
+from db_lock import bump_versions, database_lock
+
+
+JOURNAL_FILE = "journal.jsonl"
+
+TABLES = ["experiences", "skills", "projects", "education"]
+EMPTY_METADATA = {
+    "name": "",
+    "email": "",
+    "phone": "",
+    "location": "",
+    "linkedin": "",
+    "github": "",
+    "portfolio": "",
+    "last_updated": ""
+}
+
+
+def _fsync_dir(path: Path) -> None:
+    """Persist a rename; not supported on every platform, so best effort."""
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def atomic_write_json(filepath: Path, data: Any) -> None:
+    """Write JSON so readers see either the old file or the new one, never a torn write."""
+    filepath = Path(filepath)
+    tmp_path = filepath.with_name(f".{filepath.name}.{os.getpid()}.tmp")
+    with open(tmp_path, 'w') as f:
+        json.dump(data, f, indent=2)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, filepath)
+    _fsync_dir(filepath.parent)
+
+
+def journal_path(db_path: str) -> Path:
+    return Path(db_path) / JOURNAL_FILE
+
+
+def append_records(db_path: str, records: Iterable[Dict[str, Any]]) -> None:
+    """Durably append records ({"op": "upsert", "table": ..., "entry": ...})."""
+    lines = "".join(json.dumps(record) + "\n" for record in records)
+    with database_lock(db_path), open(journal_path(db_path), 'a') as f:
+        f.write(lines)
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def read_records(db_path: str) -> Tuple[List[Dict[str, Any]], int]:
+    """Return (records, bad_line_count). A torn last line from a crash counts as bad."""
+    path = journal_path(db_path)
+    if not path.exists():
+        return [], 0
+
+    records = []
+    bad = 0
+    with open(path, 'r') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                bad += 1
+                continue
+            if isinstance(record, dict) and record.get("table") in TABLES:
+                records.append(record)
+            else:
+                bad += 1
+    return records, bad
+
+
+def apply_records(data: Dict[str, Any], records: List[Dict[str, Any]]) -> set:
+    """Replay records onto {table: content}; returns the tables touched."""
+    positions: Dict[str, Dict[str, int]] = {}
+    touched = set()
+
+    for record in records:
+        key = record["table"]
+        content = data.setdefault(key, {key: []})
+        entries = content.setdefault(key, [])
+        if key not in positions:
+            positions[key] = {e.get("id"): i for i, e in enumerate(entries)
+                              if isinstance(e, dict) and e.get("id")}
+
+        entry = record["entry"]
+        entry_id = entry.get("id") if isinstance(entry, dict) else None
+        pos = positions[key].get(entry_id) if entry_id else None
+        if pos is None:
+            # Id-less records can't be upserted; each one is a new entry
+            if entry_id:
+                positions[key][entry_id] = len(entries)
+            entries.append(entry)
+        else:
+            entries[pos] = entry
+        touched.add(key)
+
+    return touched
+
+
+def journal_ids(db_path: str) -> List[str]:
+    """Ids of every entry currently in the journal."""
+    records, _ = read_records(db_path)
+    return [r["entry"].get("id") for r in records if r["entry"].get("id")]
+
+
+def load_files(db_path: str, names: List[str]) -> Dict[str, Any]:
+    """Load snapshot files and replay journaled changes to those tables."""
+    db_path = Path(db_path)
+    data = {}
+    # Shared lock: a compaction between the two reads would lose journaled entries
+    with database_lock(db_path, exclusive=False):
+        for name in names:
+            filepath = db_path / f"{name}.json"
+            if filepath.exists():
+                with open(filepath, 'r') as f:
+                    data[name] = json.load(f)
+        records, _ = read_records(db_path)
+
+    records = [r for r in records if r["table"] in names]
+    if records:
+        apply_records(data, records)
+    return data
+
+
+def compact(db_path: str) -> int:
+    """Fold the journal into the snapshot files. Returns records applied."""
+    with database_lock(db_path):
+        return _compact(db_path)
+
+
+def _compact(db_path: str) -> int:
+    records, _ = read_records(db_path)
+    path = journal_path(db_path)
+    if not records:
+        if path.exists():
+            path.unlink()
+        return 0
+
+    db_path = Path(db_path)
+    tables = sorted({r["table"] for r in records})
+    data = load_files(db_path, tables)
+    for name in tables:
+        atomic_write_json(db_path / f"{name}.json", data[name])
+
+    # Snapshots are durable; only now is it safe to forget the journal
+    path.unlink()
+    _fsync_dir(db_path)
+
+    from db_index import update_index
+    update_index(db_path, tables)
+    return len(records)
+
+
+def salvage_entries(filepath: Path, key: str) -> List[Any]:
+    """Recover every complete entry from a truncated or damaged table file."""
+    text = filepath.read_text(errors='replace')
+    start = text.find(f'"{key}"')
+    start = text.find("[", start) if start >= 0 else -1
+    if start < 0:
+        return []
+
+    decoder = json.JSONDecoder()
+    entries = []
+    pos = start + 1
+    while True:
+        while pos < len(text) and text[pos] in " \t\r\n,":
+            pos += 1
+        if pos >= len(text) or text[pos] == "]":
+            break
+        try:
+            entry, pos = decoder.raw_decode(text, pos)
+        except json.JSONDecodeError:
+            break
+        entries.append(entry)
+    return entries
+
+
+def repair(db_path: str) -> List[str]:
+    """
+    Bring a damaged database back to a loadable state. Returns actions taken.
+
+    Torn journal lines are dropped, unreadable table files are rebuilt from
+    their complete entries (the original kept as <file>.corrupt), missing
+    files are recreated, and the journal is then replayed and compacted.
+    """
+    with database_lock(db_path):
+        return _repair(Path(db_path))
+
+
+def _repair(db_path: Path) -> List[str]:
+    actions = []
+    rewritten = []
+
+    records, bad = read_records(db_path)
+    if bad:
+        path = journal_path(db_path)
+        tmp_path = path.with_name(f".{path.name}.tmp")
+        with open(tmp_path, 'w') as f:
+            f.write("".join(json.dumps(r) + "\n" for r in records))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+        actions.append(f"Dropped {bad} unreadable journal line(s)")
+
+    for name in TABLES + ["metadata"]:
+        filepath = db_path / f"{name}.json"
+        if not filepath.exists():
+            atomic_write_json(filepath, EMPTY_METADATA if name == "metadata" else {name: []})
+            actions.append(f"Recreated missing {filepath.name}")
+            rewritten.append(name)
+            continue
+        try:
+            with open(filepath, 'r') as f:
+                json.load(f)
+            continue
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            pass
+
+        os.replace(filepath, filepath.with_name(filepath.name + ".corrupt"))
+        rewritten.append(name)
+        if name == "metadata":
+            atomic_write_json(filepath, EMPTY_METADATA)
+            actions.append(f"Reset unreadable {filepath.name} (original kept as .corrupt)")
+        else:
+            entries = salvage_entries(filepath.with_name(filepath.name + ".corrupt"), name)
+            atomic_write_json(filepath, {name: entries})
+            actions.append(f"Rebuilt {filepath.name} from {len(entries)} recoverable entries "
+                           f"(original kept as .corrupt)")
+
+    if rewritten:
+        bump_versions(db_path, rewritten)
+
+    applied = _compact(db_path)
+    if applied:
+        actions.append(f"Replayed {applied} journal record(s) into snapshots")
+
+    return actions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Manage the resume database journal")
+    parser.add_argument("command", choices=["status", "compact", "repair"])
+    parser.add_argument("--db-path", required=True, help="Database directory path")
+
+    args = parser.parse_args()
+
+    if not Path(args.db_path).is_dir():
+        print(f"Error: Database not found: {args.db_path}", file=sys.stderr)
+        return 2
+
+    try:
+        if args.command == "status":
+            records, bad = read_records(args.db_path)
+            path = journal_path(args.db_path)
+            print(json.dumps({
+                "records": len(records),
+                "bad_lines": bad,
+                "size_kb": round(path.stat().st_size / 1024, 2) if path.exists() else 0.0,
+            }))
+        elif args.command == "compact":
+            print(f"✓ Compacted {compact(args.db_path)} journal record(s)")
+        else:
+            actions = repair(args.db_path)
+            for action in actions:
+                print(f"  - {action}")
+            print("✓ Database repaired" if actions else "✓ Nothing to repair")
+        return 0
+    except Exception as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+
+if __name__ == "__main__":
+    exit(main())
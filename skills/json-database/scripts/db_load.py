@@ -1,51 +1,238 @@
 #!/usr/bin/env python3
-"""Load data from resume database."""
+"""
+Load data from resume database.
+
+Selectors (--id, --where, --fields) return just the matching entries;
+--format jsonl streams them one per line as each is parsed instead of
+building the whole database first. Output is compact unless --pretty.
+"""
 
 import argparse
 import json
 import sys
 from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from db_index import DatabaseIndex, iter_table
+from db_journal import load_files, read_records
+from db_lock import database_lock, read_versions
+from db_sqlite import SqliteBackend, is_sqlite_path
+
+
+ENTRY_TABLES = ["experiences", "skills", "projects", "education"]
 
 
 def load_database(db_path: str, file: str = None) -> dict:
     """Load database or specific file."""
+    if is_sqlite_path(db_path):
+        with SqliteBackend(db_path, create=False) as backend:
+            return backend.load(file)
+    
     db_path = Path(db_path)
     
     if not db_path.exists():
         raise FileNotFoundError(f"Database not found: {db_path}")
     
+    # Snapshot files with any journaled adds replayed on top
     if file:
         # Load specific file
-        filepath = db_path / f"{file}.json"
-        if not filepath.exists():
-            raise FileNotFoundError(f"File not found: {filepath}")
-        
-        with open(filepath, 'r') as f:
-            return json.load(f)
+        data = load_files(db_path, [file])
+        if file not in data:
+            raise FileNotFoundError(f"File not found: {db_path / f'{file}.json'}")
+        return data[file]
     else:
         # Load all files
         files = ["experiences", "skills", "projects", "education", "metadata"]
-        data = {}
-        
-        for filename in files:
-            filepath = db_path / f"{filename}.json"
+        data = load_files(db_path, files)
+        return {name: data[name] for name in files if name in data}
+
+
+def load_database_versioned(db_path: str, file: str = None) -> Tuple[Any, Dict[str, int]]:
+    """
+    Load like load_database and also return the version of every file.
+
+    Pass the versions back to db_save.save_database(expected_versions=...)
+    to save only if nobody else wrote those files in between.
+    """
+    if is_sqlite_path(db_path):
+        with SqliteBackend(db_path, create=False) as backend:
+            return backend.load_versioned(file)
+    
+    # Shared lock so the versions belong to exactly the data returned
+    with database_lock(db_path, exclusive=False):
+        data = load_database(db_path, file)
+        versions = read_versions(db_path)
+    names = [file] if file else list(data)
+    return data, {name: versions.get(name, 0) for name in names}
+
+
+def parse_where(values: Iterable[str]) -> List[Tuple[List[str], str]]:
+    """Parse 'field=value' selectors; field may be a dotted path (bullets.skills_demonstrated)."""
+    where = []
+    for value in values:
+        field, sep, expected = value.partition("=")
+        if not sep or not field:
+            raise ValueError(f"Invalid --where {value!r}: expected field=value")
+        where.append((field.split("."), expected))
+    return where
+
+
+def field_values(value: Any, path: List[str]) -> Iterator[Any]:
+    """Every leaf value at path, descending through lists along the way."""
+    if isinstance(value, list):
+        for item in value:
+            yield from field_values(item, path)
+    elif not path:
+        yield value
+    elif isinstance(value, dict) and path[0] in value:
+        yield from field_values(value[path[0]], path[1:])
+
+
+def matches(entry: Any, where: List[Tuple[List[str], str]]) -> bool:
+    """True if every selector matches some value at its path (case-insensitive)."""
+    return all(
+        any(str(v).lower() == expected.lower() for v in field_values(entry, path))
+        for path, expected in where
+    )
+
+
+def select_entries(entries: Iterable[Any], ids: Optional[Iterable[str]] = None,
+                   where: Optional[List[Tuple[List[str], str]]] = None,
+                   fields: Optional[List[str]] = None) -> Iterator[Any]:
+    """Filter and project entries; fields keeps the id so results can be referenced."""
+    wanted = set(ids) if ids else None
+    for entry in entries:
+        if not isinstance(entry, dict):
+            continue
+        if wanted is not None and entry.get("id") not in wanted:
+            continue
+        if where and not matches(entry, where):
+            continue
+        if fields:
+            entry = {k: entry[k] for k in ["id"] + fields if k in entry}
+        yield entry
+
+
+def iter_entries(db_path: str, tables: List[str]) -> Iterator[Any]:
+    """
+    Yield every entry of the given tables, parsing one entry at a time.
+
+    Journaled changes are applied as their entry comes by; journaled new
+    entries follow each table's snapshot entries, as in load_database.
+    """
+    if is_sqlite_path(db_path):
+        with SqliteBackend(db_path, create=False) as backend:
+            for key in tables:
+                yield from backend.iter_entries(key)
+        return
+
+    db_path = Path(db_path)
+    if not db_path.exists():
+        raise FileNotFoundError(f"Database not found: {db_path}")
+
+    # Read everything under the lock, parse after releasing it
+    with database_lock(db_path, exclusive=False):
+        records, _ = read_records(db_path)
+        texts = {}
+        for key in tables:
+            filepath = db_path / f"{key}.json"
             if filepath.exists():
-                with open(filepath, 'r') as f:
-                    data[filename] = json.load(f)
-        
-        return data
+                texts[key] = filepath.read_text(encoding='utf-8')
+
+    for key in tables:
+        pending = {}
+        # Journal order of entries to append: (id, None), or (None, entry) for
+        # an id-less record, which can't replace anything
+        appended = []
+        for record in records:
+            if record["table"] != key:
+                continue
+            entry = record["entry"]
+            entry_id = entry.get("id") if isinstance(entry, dict) else None
+            if not entry_id:
+                appended.append((None, entry))
+                continue
+            if entry_id not in pending:
+                appended.append((entry_id, None))
+            pending[entry_id] = entry
+        if key in texts:
+            for entry, _, _ in iter_table(texts[key], key, f"{key}.json"):
+                entry_id = entry.get("id") if isinstance(entry, dict) else None
+                yield pending.pop(entry_id) if entry_id in pending else entry
+        for entry_id, entry in appended:
+            if entry_id is None:
+                yield entry
+            elif entry_id in pending:
+                yield pending.pop(entry_id)
+
+
+def query_database(db_path: str, file: str = None, ids: Optional[List[str]] = None,
+                   where: Optional[List[Tuple[List[str], str]]] = None,
+                   fields: Optional[List[str]] = None) -> Iterator[Any]:
+    """
+    Stream the entries matching the selectors.
+
+    A pure --id lookup reads only those records (through the index, or by
+    primary key on SQLite); anything else streams the tables once.
+    """
+    tables = [file] if file else ENTRY_TABLES
+    if file and file not in ENTRY_TABLES:
+        raise ValueError(f"Selectors apply to entry files only: {', '.join(ENTRY_TABLES)}")
+
+    if ids and not is_sqlite_path(db_path) and Path(db_path).is_dir():
+        with database_lock(db_path, exclusive=False):
+            index = DatabaseIndex(db_path).ensure_fresh()
+            found = index.get(i for i in ids if index.table_of(i) in tables)
+        yield from select_entries(found, None, where, fields)
+    elif ids and is_sqlite_path(db_path):
+        with SqliteBackend(db_path, create=False) as backend:
+            found = backend.get_ids(ids, tables)
+        yield from select_entries(found, None, where, fields)
+    else:
+        yield from select_entries(iter_entries(db_path, tables), ids, where, fields)
 
 
 def main():
     parser = argparse.ArgumentParser(description="Load resume database")
     parser.add_argument("--db-path", required=True, help="Database directory path")
     parser.add_argument("--file", help="Specific file to load (experiences, skills, etc.)")
+    parser.add_argument("--with-versions", action="store_true",
+                        help="Print {\"data\": ..., \"versions\": {file: N}} for db_save --expected-version")
+    parser.add_argument("--id", action="append", default=[], help="Only this entry id (repeatable)")
+    parser.add_argument("--where", action="append", default=[],
+                        help="Only entries with field=value; dotted paths reach into lists (repeatable)")
+    parser.add_argument("--fields", help="Comma-separated fields to keep per entry (id is always kept)")
+    parser.add_argument("--format", choices=["json", "jsonl"], default="json",
+                        help="jsonl streams one entry per line as it is parsed")
+    parser.add_argument("--pretty", action="store_true", help="Indent JSON output")
     
     args = parser.parse_args()
+    selecting = bool(args.id or args.where or args.fields)
+    if args.with_versions and (selecting or args.format == "jsonl"):
+        parser.error("--with-versions loads whole files; it can't be combined with selectors or jsonl")
+    dump_options = {"indent": 2} if args.pretty else {"separators": (",", ":")}
     
     try:
-        data = load_database(args.db_path, args.file)
-        print(json.dumps(data, indent=2))
+        if selecting or args.format == "jsonl":
+            fields = [f.strip() for f in args.fields.split(",") if f.strip()] if args.fields else None
+            entries = query_database(args.db_path, args.file, args.id, parse_where(args.where), fields)
+            if args.format == "jsonl":
+                count = 0
+                for entry in entries:
+                    sys.stdout.write(json.dumps(entry, separators=(",", ":")) + "\n")
+                    count += 1
+            else:
+                results = list(entries)
+                count = len(results)
+                print(json.dumps(results, **dump_options))
+            return 0 if count or not selecting else 3
+        
+        if args.with_versions:
+            data, versions = load_database_versioned(args.db_path, args.file)
+            data = {"data": data, "versions": versions}
+        else:
+            data = load_database(args.db_path, args.file)
+        print(json.dumps(data, **dump_options))
         return 0
     except FileNotFoundError as e:
         print(f"Error: {e}", file=sys.stderr)
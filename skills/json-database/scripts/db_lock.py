@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Advisory locking and per-file version counters for the resume database.
+
+Every mutation of a JSON-directory database (db_add, db_save, db_init,
+journal compaction and repair) holds an exclusive fcntl lock on
+<db>/.lock; loads hold a shared one, so a reader never sees a table file
+from before a compaction together with the journal from after it.
+
+.versions.json counts the writes to each file. A writer that loaded the
+database earlier passes the versions it saw to save_database, which
+refuses the save (VersionConflict) if anyone wrote those files since.
+
+Locks are re-entrant within a thread, so helpers that lock can call each
+other. Where fcntl is unavailable (Windows) locking is a no-op. SQLite
+databases rely on SQLite's own locking and keep versions in a table.
+"""
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+
+LOCK_FILE = ".lock"
+VERSIONS_FILE = ".versions.json"
+LOCK_TIMEOUT = float(os.environ.get("RESCUME_LOCK_TIMEOUT", "30"))
+
+_local = threading.local()
+
+
+class VersionConflict(Exception):
+    """A file changed since the caller loaded it."""
+
+    def __init__(self, name: str, expected: int, actual: int):
+        super().__init__(f"Version conflict on {name}: expected {expected}, found {actual} "
+                         f"(reload and retry)")
+        self.name = name
+        self.expected = expected
+        self.actual = actual
+
+
+def _held() -> Dict[str, list]:
+    if not hasattr(_local, "held"):
+        _local.held = {}
+    return _local.held
+
+
+@contextmanager
+def database_lock(db_path: str, exclusive: bool = True,
+                  timeout: Optional[float] = None) -> Iterator[None]:
+    """Hold the database lock; shared for readers, exclusive for writers."""
+    db_path = Path(db_path)
+    if fcntl is None or not db_path.is_dir():
+        yield
+        return
+
+    lock_path = str(db_path.resolve() / LOCK_FILE)
+    held = _held()
+    if lock_path in held:
+        if exclusive and not held[lock_path][1]:
+            raise RuntimeError("Cannot take an exclusive database lock while holding a shared one")
+        yield
+        return
+
+    fd = os.open(lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        operation = fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH
+        deadline = time.monotonic() + (LOCK_TIMEOUT if timeout is None else timeout)
+        while True:
+            try:
+                fcntl.flock(fd, operation | fcntl.LOCK_NB)
+                break
+            except BlockingIOError:
+                if time.monotonic() >= deadline:
+                    raise TimeoutError(f"Timed out waiting for database lock: {lock_path}")
+                time.sleep(0.02)
+
+        held[lock_path] = [fd, exclusive]
+        try:
+            yield
+        finally:
+            del held[lock_path]
+            fcntl.flock(fd, fcntl.LOCK_UN)
+    finally:
+        os.close(fd)
+
+
+def read_versions(db_path: str) -> Dict[str, int]:
+    """Current version of each file; files never written through the scripts are 0."""
+    try:
+        with open(Path(db_path) / VERSIONS_FILE, 'r') as f:
+            versions = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return versions if isinstance(versions, dict) else {}
+
+
+def check_versions(current: Dict[str, int], expected: Dict[str, int]) -> None:
+    """Raise VersionConflict unless every expected version matches."""
+    for name, version in expected.items():
+        actual = current.get(name, 0)
+        if actual != version:
+            raise VersionConflict(name, version, actual)
+
+
+def bump_versions(db_path: str, names: Iterable[str]) -> Dict[str, int]:
+    """Record a write to each file. Call while holding the exclusive lock."""
+    from db_journal import atomic_write_json
+
+    versions = read_versions(db_path)
+    for name in names:
+        versions[name] = versions.get(name, 0) + 1
+    atomic_write_json(Path(db_path) / VERSIONS_FILE, versions)
+    return versions
@@ -5,26 +5,66 @@ import argparse
 import json
 import sys
 from pathlib import Path
+from typing import Dict, Optional
 
+from db_index import update_index
+from db_journal import atomic_write_json, compact
+from db_lock import VersionConflict, bump_versions, check_versions, database_lock, read_versions
+from db_sqlite import SqliteBackend, is_sqlite_path
 
-def save_database(db_path: str, data: dict, file: str = None) -> None:
-    """Save database or specific file."""
+
+def save_database(db_path: str, data: dict, file: str = None,
+                  expected_versions: Optional[Dict[str, int]] = None) -> Dict[str, int]:
+    """
+    Save database or specific file; returns the new file versions.
+
+    With expected_versions ({file: version} as returned by
+    db_load.load_database_versioned), the save is refused with
+    VersionConflict if any of those files was written in the meantime.
+    """
+    if is_sqlite_path(db_path):
+        with SqliteBackend(db_path) as backend:
+            versions = backend.save(data, file, expected_versions)
+        print(f"Saved: {db_path}" + (f" ({file})" if file else ""))
+        return versions
+    
     db_path = Path(db_path)
     db_path.mkdir(parents=True, exist_ok=True)
     
-    if file:
-        # Save specific file
-        filepath = db_path / f"{file}.json"
-        with open(filepath, 'w') as f:
-            json.dump(data, f, indent=2)
-        print(f"Saved: {filepath}")
-    else:
-        # Save all files (data should be dict with file names as keys)
-        for filename, content in data.items():
-            filepath = db_path / f"{filename}.json"
-            with open(filepath, 'w') as f:
-                json.dump(content, f, indent=2)
+    with database_lock(db_path):
+        check_versions(read_versions(db_path), expected_versions or {})
+        
+        # Fold pending journaled adds into the snapshots so none are replayed over this save
+        compact(db_path)
+        
+        if file:
+            # Save specific file
+            filepath = db_path / f"{file}.json"
+            atomic_write_json(filepath, data)
             print(f"Saved: {filepath}")
+            update_index(db_path, [file])
+            return bump_versions(db_path, [file])
+        else:
+            # Save all files (data should be dict with file names as keys)
+            for filename, content in data.items():
+                filepath = db_path / f"{filename}.json"
+                atomic_write_json(filepath, content)
+                print(f"Saved: {filepath}")
+            update_index(db_path, data.keys())
+            return bump_versions(db_path, data.keys())
+
+
+def parse_expected_versions(values: list, file: Optional[str]) -> Dict[str, int]:
+    """Parse --expected-version values: 'N' (with --file) or 'name=N'."""
+    expected = {}
+    for value in values:
+        name, sep, version = value.rpartition("=")
+        if not sep:
+            if not file:
+                raise ValueError("--expected-version needs name=N unless --file is given")
+            name = file
+        expected[name] = int(version)
+    return expected
 
 
 def main():
@@ -32,16 +72,23 @@ def main():
     parser.add_argument("--db-path", required=True, help="Database directory path")
     parser.add_argument("--file", help="Specific file to save (experiences, skills, etc.)")
     parser.add_argument("--data", required=True, help="JSON data to save")
+    parser.add_argument("--expected-version", action="append", default=[],
+                        help="Refuse the save if a file changed since it was loaded: "
+                             "N with --file, otherwise name=N (repeatable)")
     
     args = parser.parse_args()
     
     try:
         data = json.loads(args.data)
-        save_database(args.db_path, data, args.file)
+        expected = parse_expected_versions(args.expected_version, args.file)
+        save_database(args.db_path, data, args.file, expected)
         return 0
     except json.JSONDecodeError as e:
         print(f"Error: Invalid JSON - {e}", file=sys.stderr)
         return 1
+    except VersionConflict as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 3
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
         return 1
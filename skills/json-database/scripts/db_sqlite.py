@@ -0,0 +1,499 @@
+#!/usr/bin/env python3
+"""
+SQLite storage backend for the resume database.
+
+Used automatically by db_load/db_save/db_add when --db-path names a
+.sqlite/.db file; a directory keeps the default JSON-file layout.
+
+Every entry is stored verbatim as JSON (so export is lossless), alongside
+derived tables for fast queries:
+  - bullets + bullets_fts: FTS5 full-text index over bullet text
+  - entry_skills: skill → entry links with an indexed foreign key to the
+    matching skills.json entry when one exists
+
+The database runs in WAL mode and every write is one IMMEDIATE
+transaction, so concurrent writers queue on SQLite's own lock instead of
+racing for the same id. The versions table counts writes per file for
+compare-and-swap saves (see db_lock).
+
+Usage:
+    db_sqlite.py import --db-path <json_dir> --sqlite <file.sqlite>
+    db_sqlite.py export --sqlite <file.sqlite> --db-path <json_dir>
+    db_sqlite.py search --sqlite <file.sqlite> (--text <fts query> | --skill <name>)
+"""
+
+import argparse
+import json
+import sys
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from db_lock import LOCK_TIMEOUT, check_versions
+
+
+SQLITE_SUFFIXES = (".sqlite", ".sqlite3", ".db")
+
+# table → id prefix (same mapping as db_add)
+TABLES = {
+    "experiences": "exp",
+    "skills": "skill",
+    "projects": "project",
+    "education": "edu",
+}
+DOCUMENTS = list(TABLES) + ["metadata"]
+
+SCHEMA_VERSION = 2
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (
+    name TEXT PRIMARY KEY,
+    data TEXT NOT NULL           -- the file's JSON minus its entry list
+);
+CREATE TABLE IF NOT EXISTS entries (
+    rowid INTEGER PRIMARY KEY,
+    table_name TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    id TEXT,
+    data TEXT NOT NULL,
+    UNIQUE (table_name, id)      -- ids are per table, as in the JSON files
+);
+CREATE INDEX IF NOT EXISTS entries_table ON entries(table_name, position);
+CREATE INDEX IF NOT EXISTS entries_id ON entries(id);
+CREATE TABLE IF NOT EXISTS bullets (
+    rowid INTEGER PRIMARY KEY,
+    entry_rowid INTEGER NOT NULL REFERENCES entries(rowid) ON DELETE CASCADE,
+    bullet_id TEXT,
+    text TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS bullets_entry ON bullets(entry_rowid);
+CREATE TABLE IF NOT EXISTS entry_skills (
+    entry_rowid INTEGER NOT NULL REFERENCES entries(rowid) ON DELETE CASCADE,
+    skill TEXT NOT NULL,
+    skill_rowid INTEGER REFERENCES entries(rowid) ON DELETE SET NULL
+);
+CREATE INDEX IF NOT EXISTS entry_skills_skill ON entry_skills(skill);
+CREATE INDEX IF NOT EXISTS entry_skills_entry ON entry_skills(entry_rowid);
+CREATE INDEX IF NOT EXISTS entry_skills_skill_rowid ON entry_skills(skill_rowid);
+CREATE TABLE IF NOT EXISTS counters (
+    prefix TEXT PRIMARY KEY,
+    next INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS versions (
+    name TEXT PRIMARY KEY,
+    version INTEGER NOT NULL
+);
+"""
+
+FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS bullets_fts USING fts5(
+    text, content='bullets', content_rowid='rowid'
+);
+CREATE TRIGGER IF NOT EXISTS bullets_ai AFTER INSERT ON bullets BEGIN
+    INSERT INTO bullets_fts(rowid, text) VALUES (new.rowid, new.text);
+END;
+CREATE TRIGGER IF NOT EXISTS bullets_ad AFTER DELETE ON bullets BEGIN
+    INSERT INTO bullets_fts(bullets_fts, rowid, text) VALUES ('delete', old.rowid, old.text);
+END;
+"""
+
+
+def is_sqlite_path(db_path: str) -> bool:
+    """True if db_path names an SQLite database rather than a JSON directory."""
+    return Path(db_path).suffix.lower() in SQLITE_SUFFIXES
+
+
+def normalize(name: str) -> str:
+    return " ".join(str(name).lower().split())
+
+
+def bullet_texts(entry: Dict[str, Any]) -> List[tuple]:
+    """(bullet_id, text) for every bullet-like line of an entry."""
+    lines = []
+    for bullet in entry.get("bullets") or []:
+        if isinstance(bullet, dict):
+            lines.append((bullet.get("id"), bullet.get("text", "")))
+        else:
+            lines.append((None, str(bullet)))
+    for field in ("outcomes", "details"):
+        lines.extend((None, str(line)) for line in entry.get(field) or [])
+    if entry.get("description"):
+        lines.append((None, str(entry["description"])))
+    return [(bullet_id, text) for bullet_id, text in lines if text]
+
+
+def entry_skills(entry: Dict[str, Any]) -> set:
+    names = set()
+    for bullet in entry.get("bullets") or []:
+        if isinstance(bullet, dict):
+            names.update(bullet.get("skills_demonstrated") or [])
+    for field in ("skills_demonstrated", "skills", "technologies"):
+        names.update(entry.get(field) or [])
+    return {normalize(n) for n in names}
+
+
+def id_number(entry_id: str) -> int:
+    try:
+        return int(str(entry_id).split('_')[1])
+    except (IndexError, ValueError):
+        return 0
+
+
+class SqliteBackend:
+    """Resume database stored in one SQLite file."""
+
+    def __init__(self, db_path: str, create: bool = True):
+        import sqlite3  # deferred: JSON-directory databases never need it
+
+        path = Path(db_path)
+        if not create and not path.exists():
+            raise FileNotFoundError(f"Database not found: {path}")
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        self.path = path
+        self.conn = sqlite3.connect(str(path), timeout=LOCK_TIMEOUT)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA foreign_keys=ON")
+
+        (version,) = self.conn.execute("PRAGMA user_version").fetchone()
+        if version < SCHEMA_VERSION:
+            # Every statement is IF NOT EXISTS, so this also upgrades older files
+            self.conn.executescript(SCHEMA)
+            try:
+                self.conn.executescript(FTS_SCHEMA)
+            except sqlite3.OperationalError:
+                pass  # SQLite built without FTS5: search falls back to LIKE
+            self.conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        self.has_fts = self.conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'bullets_fts'"
+        ).fetchone() is not None
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def __enter__(self) -> "SqliteBackend":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    # Reading
+
+    def _document(self, name: str) -> Optional[Dict[str, Any]]:
+        row = self.conn.execute("SELECT data FROM documents WHERE name = ?", (name,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def iter_entries(self, key: str) -> Iterator[Dict[str, Any]]:
+        rows = self.conn.execute(
+            "SELECT data FROM entries WHERE table_name = ? ORDER BY position", (key,)
+        )
+        for (data,) in rows:
+            yield json.loads(data)
+
+    def entries(self, key: str) -> List[Dict[str, Any]]:
+        return list(self.iter_entries(key))
+
+    def load_file(self, name: str) -> Optional[Any]:
+        """Rebuild one JSON file's content, or None if it was never stored."""
+        document = self._document(name)
+        if document is None:
+            return None
+        if name not in TABLES:
+            return document["value"]
+        return {name: self.entries(name), **document["extra"]}
+
+    def load(self, file: str = None) -> dict:
+        """Same shape as db_load.load_database."""
+        if file:
+            data = self.load_file(file)
+            if data is None:
+                raise FileNotFoundError(f"File not found: {self.path}#{file}")
+            return data
+        data = {}
+        for name in DOCUMENTS:
+            content = self.load_file(name)
+            if content is not None:
+                data[name] = content
+        return data
+
+    def versions(self) -> Dict[str, int]:
+        return dict(self.conn.execute("SELECT name, version FROM versions"))
+
+    def load_versioned(self, file: str = None) -> tuple:
+        """load() plus file versions, read from one consistent snapshot."""
+        with self.conn:
+            self.conn.execute("BEGIN")
+            data = self.load(file)
+            versions = self.versions()
+        names = [file] if file else list(data)
+        return data, {name: versions.get(name, 0) for name in names}
+
+    # Writing
+
+    @contextmanager
+    def write_transaction(self) -> Iterator[None]:
+        """One IMMEDIATE transaction: the write lock is taken before anything is read."""
+        with self.conn:
+            self.conn.execute("BEGIN IMMEDIATE")
+            yield
+
+    def bump_versions(self, names: Iterable[str]) -> Dict[str, int]:
+        self.conn.executemany(
+            "INSERT INTO versions (name, version) VALUES (?, 1) "
+            "ON CONFLICT(name) DO UPDATE SET version = version + 1",
+            [(name,) for name in names]
+        )
+        return self.versions()
+
+    def _insert_entry(self, key: str, position: int, entry: Dict[str, Any]) -> int:
+        entry_id = entry.get("id") if isinstance(entry, dict) else None
+        cursor = self.conn.execute(
+            "INSERT INTO entries (table_name, position, id, data) VALUES (?, ?, ?, ?)",
+            (key, position, entry_id, json.dumps(entry))
+        )
+        rowid = cursor.lastrowid
+        if not isinstance(entry, dict):
+            return rowid
+
+        self.conn.executemany(
+            "INSERT INTO bullets (entry_rowid, bullet_id, text) VALUES (?, ?, ?)",
+            [(rowid, bullet_id, text) for bullet_id, text in bullet_texts(entry)]
+        )
+        names = entry_skills(entry)
+        if key == "skills" and entry.get("name"):
+            names.add(normalize(entry["name"]))
+        self.conn.executemany(
+            "INSERT INTO entry_skills (entry_rowid, skill) VALUES (?, ?)",
+            [(rowid, name) for name in names]
+        )
+
+        prefix = TABLES[key]
+        self.conn.execute(
+            "INSERT INTO counters (prefix, next) VALUES (?, ?) "
+            "ON CONFLICT(prefix) DO UPDATE SET next = max(next, excluded.next)",
+            (prefix, id_number(entry_id) + 1 if entry_id else 1)
+        )
+        return rowid
+
+    def _link_skills(self, rowid: Optional[int] = None) -> None:
+        """
+        Point entry_skills rows at the skills.json entry of the same name.
+
+        With rowid, only links touching that one new entry are updated.
+        """
+        lookup = """(
+            SELECT s.entry_rowid FROM entry_skills s
+            JOIN entries e ON e.rowid = s.entry_rowid
+            WHERE e.table_name = 'skills' AND s.skill = entry_skills.skill
+            LIMIT 1
+        )"""
+        if rowid is None:
+            self.conn.execute(f"UPDATE entry_skills SET skill_rowid = {lookup}")
+            return
+
+        self.conn.execute(f"UPDATE entry_skills SET skill_rowid = {lookup} WHERE entry_rowid = ?",
+                          (rowid,))
+        # A new skills.json entry may be the target of existing links
+        self.conn.execute("""
+            UPDATE entry_skills SET skill_rowid = ?
+            WHERE skill_rowid IS NULL AND skill IN (
+                SELECT skill FROM entry_skills WHERE entry_rowid = ?
+            ) AND EXISTS (SELECT 1 FROM entries WHERE rowid = ? AND table_name = 'skills')
+        """, (rowid, rowid, rowid))
+
+    def _replace_file(self, name: str, content: Any) -> None:
+        if name not in TABLES:
+            document = {"value": content}
+        elif isinstance(content, dict):
+            document = {"extra": {k: v for k, v in content.items() if k != name}}
+        else:
+            # A bare list, as db_save.py --file experiences --data '[...]' allows
+            document = {"extra": {}}
+            content = {name: content}
+
+        self.conn.execute(
+            "INSERT OR REPLACE INTO documents (name, data) VALUES (?, ?)",
+            (name, json.dumps(document))
+        )
+        if name in TABLES:
+            self.conn.execute("DELETE FROM entries WHERE table_name = ?", (name,))
+            for position, entry in enumerate(content.get(name, [])):
+                self._insert_entry(name, position, entry)
+
+    def save(self, data: Any, file: str = None,
+             expected_versions: Optional[Dict[str, int]] = None) -> Dict[str, int]:
+        """Same contract as db_save.save_database, in one transaction."""
+        with self.write_transaction():
+            check_versions(self.versions(), expected_versions or {})
+            if file:
+                self._replace_file(file, data)
+            else:
+                for name, content in data.items():
+                    self._replace_file(name, content)
+            self._link_skills()
+            return self.bump_versions([file] if file else list(data))
+
+    def next_id(self, key: str) -> str:
+        """Reserve the next id for a table. Call inside write_transaction()."""
+        prefix = TABLES[key]
+        row = self.conn.execute("SELECT next FROM counters WHERE prefix = ?", (prefix,)).fetchone()
+        num = row[0] if row else 1
+        self.conn.execute(
+            "INSERT INTO counters (prefix, next) VALUES (?, ?) "
+            "ON CONFLICT(prefix) DO UPDATE SET next = max(next, excluded.next)",
+            (prefix, num + 1)
+        )
+        return f"{prefix}_{num:03d}"
+
+    def upsert(self, key: str, entry: Dict[str, Any]) -> None:
+        """Replace the entry with the same id in place, or append it. Call inside write_transaction()."""
+        row = self.conn.execute("SELECT rowid, position FROM entries WHERE table_name = ? AND id = ?",
+                                (key, entry.get("id"))).fetchone()
+        if row:
+            self.conn.execute("DELETE FROM entries WHERE rowid = ?", (row[0],))
+            position = row[1]
+        else:
+            if self._document(key) is None:
+                self.conn.execute("INSERT INTO documents (name, data) VALUES (?, ?)",
+                                  (key, json.dumps({"extra": {}})))
+            (position,) = self.conn.execute(
+                "SELECT coalesce(max(position), -1) + 1 FROM entries WHERE table_name = ?", (key,)
+            ).fetchone()
+        self._link_skills(self._insert_entry(key, position, entry))
+
+    def add(self, key: str, data: Dict[str, Any]) -> str:
+        """Append one entry with the next id for its table; returns the id."""
+        with self.write_transaction():
+            data['id'] = self.next_id(key)
+            self.upsert(key, data)
+            self.bump_versions([key])
+        return data['id']
+
+    # Queries
+
+    def _rows_to_entries(self, rowids: List[int]) -> List[Dict[str, Any]]:
+        if not rowids:
+            return []
+        marks = ",".join("?" * len(rowids))
+        rows = self.conn.execute(
+            f"SELECT data FROM entries WHERE rowid IN ({marks}) ORDER BY table_name, position", rowids
+        )
+        return [json.loads(data) for (data,) in rows]
+
+    def get_ids(self, entry_ids: List[str],
+                tables: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """
+        Entries by id, in the order given, optionally only from some tables.
+
+        Ids are unique per table, so an id used by several tables returns
+        each of those entries (in table order).
+        """
+        found = []
+        for entry_id in entry_ids:
+            if tables:
+                marks = ",".join("?" * len(tables))
+                rows = self.conn.execute(
+                    f"SELECT data FROM entries WHERE id = ? AND table_name IN ({marks}) "
+                    f"ORDER BY table_name", [entry_id, *tables])
+            else:
+                rows = self.conn.execute(
+                    "SELECT data FROM entries WHERE id = ? ORDER BY table_name", (entry_id,))
+            found.extend(json.loads(data) for (data,) in rows)
+        return found
+
+    def by_skill(self, skill: str, table: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Entries demonstrating a skill (bullet skills, skills, technologies)."""
+        sql = "SELECT DISTINCT s.entry_rowid FROM entry_skills s"
+        params: tuple = (normalize(skill),)
+        if table:
+            sql += " JOIN entries e ON e.rowid = s.entry_rowid WHERE s.skill = ? AND e.table_name = ?"
+            params += (table,)
+        else:
+            sql += " WHERE s.skill = ?"
+        return self._rows_to_entries([r for (r,) in self.conn.execute(sql, params)])
+
+    def search(self, query: str) -> List[Dict[str, Any]]:
+        """Entries with a bullet matching an FTS5 query (e.g. 'kafka OR spark')."""
+        if self.has_fts:
+            sql = ("SELECT DISTINCT b.entry_rowid FROM bullets_fts f "
+                   "JOIN bullets b ON b.rowid = f.rowid WHERE bullets_fts MATCH ?")
+            params = (query,)
+        else:
+            sql = "SELECT DISTINCT entry_rowid FROM bullets WHERE text LIKE ?"
+            params = (f"%{query}%",)
+        return self._rows_to_entries([r for (r,) in self.conn.execute(sql, params)])
+
+    def integrity_errors(self) -> List[str]:
+        errors = []
+        (result,) = self.conn.execute("PRAGMA integrity_check").fetchone()
+        if result != "ok":
+            errors.append(f"SQLite integrity check failed: {result}")
+        if self.conn.execute("PRAGMA foreign_key_check").fetchone():
+            errors.append("SQLite foreign key check failed")
+        return errors
+
+
+def import_json(json_dir: str, sqlite_path: str) -> Dict[str, int]:
+    """Copy every JSON file of a database directory into an SQLite file."""
+    from db_load import load_database
+
+    data = load_database(json_dir)
+    with SqliteBackend(sqlite_path) as backend:
+        backend.save(data)
+    return {name: len(content.get(name, [])) if name in TABLES else 1
+            for name, content in data.items()}
+
+
+def export_json(sqlite_path: str, json_dir: str) -> Dict[str, int]:
+    """Write an SQLite database back out as a JSON-file database directory."""
+    from db_save import save_database
+
+    with SqliteBackend(sqlite_path, create=False) as backend:
+        data = backend.load()
+    save_database(json_dir, data)
+    return {name: len(content.get(name, [])) if name in TABLES else 1
+            for name, content in data.items()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="SQLite backend for the resume database")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("import", help="Copy a JSON database directory into SQLite")
+    p.add_argument("--db-path", required=True, help="JSON database directory")
+    p.add_argument("--sqlite", required=True, help="SQLite file to write")
+
+    p = sub.add_parser("export", help="Write an SQLite database out as JSON files")
+    p.add_argument("--sqlite", required=True, help="SQLite file to read")
+    p.add_argument("--db-path", required=True, help="JSON database directory to write")
+
+    p = sub.add_parser("search", help="Query an SQLite database")
+    p.add_argument("--sqlite", required=True, help="SQLite file to read")
+    group = p.add_mutually_exclusive_group(required=True)
+    group.add_argument("--text", help="FTS5 query over bullet text")
+    group.add_argument("--skill", help="Entries demonstrating a skill")
+
+    args = parser.parse_args()
+
+    try:
+        if args.command == "import":
+            print(json.dumps(import_json(args.db_path, args.sqlite)))
+        elif args.command == "export":
+            print(json.dumps(export_json(args.sqlite, args.db_path)))
+        else:
+            with SqliteBackend(args.sqlite, create=False) as backend:
+                results = backend.search(args.text) if args.text else backend.by_skill(args.skill)
+            print(json.dumps(results))
+            return 0 if results else 3
+        return 0
+    except FileNotFoundError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+    except Exception as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -6,9 +6,15 @@ import json
 import sys
 from pathlib import Path
 
+from db_journal import read_records, repair
+from db_sqlite import DOCUMENTS, SqliteBackend, is_sqlite_path
+
 
 def validate_database(db_path: str) -> tuple[bool, list]:
     """Validate database structure and return (is_valid, errors)."""
+    if is_sqlite_path(db_path):
+        return validate_sqlite(db_path)
+    
     db_path = Path(db_path)
     errors = []
     
@@ -53,17 +59,51 @@ def validate_database(db_path: str) -> tuple[bool, list]:
                 if len(ids) != len(set(ids)):
                     errors.append(f"Duplicate IDs found in {filename}")
     
+    # Journaled adds not yet compacted into the files above
+    _, bad_lines = read_records(db_path)
+    if bad_lines:
+        errors.append(f"Journal has {bad_lines} unreadable line(s)")
+    
     is_valid = len(errors) == 0
     return is_valid, errors
 
 
+def validate_sqlite(db_path: str) -> tuple[bool, list]:
+    """Validate an SQLite database: integrity, foreign keys and stored documents."""
+    if not Path(db_path).exists():
+        return False, [f"Database file not found: {db_path}"]
+    
+    with SqliteBackend(db_path, create=False) as backend:
+        errors = backend.integrity_errors()
+        data = backend.load()
+    
+    for name in DOCUMENTS:
+        if name not in data:
+            errors.append(f"Missing required document: {name}")
+    metadata = data.get("metadata", {})
+    for key in ["name", "email"]:
+        if isinstance(metadata, dict) and key not in metadata:
+            errors.append(f"Missing required key '{key}' in metadata")
+    
+    return len(errors) == 0, errors
+
+
 def main():
     parser = argparse.ArgumentParser(description="Validate resume database")
     parser.add_argument("--db-path", required=True, help="Database directory path")
+    parser.add_argument("--fix", action="store_true",
+                        help="Repair first: replay the journal, salvage damaged files")
     
     args = parser.parse_args()
     
     try:
+        if args.fix:
+            if is_sqlite_path(args.db_path):
+                print("SQLite databases are transactional; nothing to repair")
+            elif Path(args.db_path).is_dir():
+                for action in repair(args.db_path):
+                    print(f"  - {action}")
+        
         is_valid, errors = validate_database(args.db_path)
         
         if is_valid:
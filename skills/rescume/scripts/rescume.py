@@ -0,0 +1,450 @@
+#!/usr/bin/env python3
+"""
+Unified Rescume CLI for Rescume v2.0
+
+One entry point for the json-database, typst-renderer and coverage-tracker
+scripts. Run a single subcommand, or start `serve` to keep one process
+open for a whole agent session: it reads newline-delimited JSON requests
+on stdin and answers each with one JSON line on stdout, keeping the
+database, template list and parsed resume text hot in memory.
+
+Usage:
+    rescume.py <command> [options]
+    rescume.py serve
+
+Serve protocol:
+    → {"id": 1, "command": "db-load", "args": {"db_path": "data/comprehensive_db"}}
+    ← {"id": 1, "ok": true, "result": {...}}
+    ← {"id": 2, "ok": false, "error": "Database not found: ...", "exit_code": 2}
+"""
+
+import argparse
+import contextlib
+import json
+import sys
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+SKILLS_DIR = Path(__file__).resolve().parents[2]
+for _skill in ("json-database", "typst-renderer", "coverage-tracker"):
+    sys.path.insert(0, str(SKILLS_DIR / _skill / "scripts"))
+
+DB_FILES = ["experiences", "skills", "projects", "education", "metadata"]
+
+
+def file_signature(*paths: Path) -> Tuple:
+    """Cheap change detector: (path, mtime_ns, size) for each existing path."""
+    signature = []
+    for path in paths:
+        try:
+            stat = path.stat()
+            signature.append((str(path), stat.st_mtime_ns, stat.st_size))
+        except OSError:
+            signature.append((str(path), None, None))
+    return tuple(signature)
+
+
+def parse_json_arg(value: Any) -> Any:
+    """Accept JSON either as a string (CLI) or already decoded (serve)."""
+    return json.loads(value) if isinstance(value, str) else value
+
+
+class Session:
+    """In-memory caches shared by every request in one process."""
+
+    def __init__(self):
+        self.db_cache: Dict[Tuple[str, Optional[str]], Tuple[Tuple, Any]] = {}
+        self.resume_cache: Dict[str, Tuple[Tuple, Tuple[list, Tuple[str, ...]]]] = {}
+        self.templates_cache: Optional[Tuple[Tuple, Any]] = None
+        # True under `serve`, where stdin carries requests
+        self.serving = False
+
+    def load_database(self, db_path: str, file: Optional[str] = None) -> Any:
+        from db_load import load_database
+
+        from db_sqlite import is_sqlite_path
+
+        root = Path(db_path).resolve()
+        if is_sqlite_path(db_path):
+            # WAL commits land in the -wal file before a checkpoint touches the db
+            signature = file_signature(root, root.with_name(root.name + "-wal"))
+        else:
+            names = [file] if file else DB_FILES
+            signature = file_signature(root, root / "journal.jsonl",
+                                       *(root / f"{name}.json" for name in names))
+
+        cached = self.db_cache.get((str(root), file))
+        if cached and cached[0] == signature:
+            return cached[1]
+
+        data = load_database(db_path, file)
+        self.db_cache[(str(root), file)] = (signature, data)
+        return data
+
+    def invalidate_database(self, db_path: str) -> None:
+        root = str(Path(db_path).resolve())
+        for key in [k for k in self.db_cache if k[0] == root]:
+            del self.db_cache[key]
+
+    def resume(self, resume_path: str) -> Tuple[list, Tuple[str, ...]]:
+        """Return (segments, tokens) for a resume; backed by the on-disk text cache."""
+        from check_coverage import load_resume
+
+        path = Path(resume_path).resolve()
+        if not path.exists():
+            raise FileNotFoundError(f"Resume not found: {resume_path}")
+
+        signature = file_signature(path)
+        cached = self.resume_cache.get(str(path))
+        if cached and cached[0] == signature:
+            return cached[1]
+
+        resume = load_resume(str(path))
+        self.resume_cache[str(path)] = (signature, resume)
+        return resume
+
+    def list_templates(self) -> Any:
+        from list_templates import TEMPLATES_DIR, list_templates
+
+        dirs = sorted(p for p in TEMPLATES_DIR.iterdir() if p.is_dir()) if TEMPLATES_DIR.exists() else []
+        signature = file_signature(TEMPLATES_DIR, *dirs, *(d / "metadata.json" for d in dirs))
+        if self.templates_cache and self.templates_cache[0] == signature:
+            return self.templates_cache[1]
+
+        templates = list_templates()
+        self.templates_cache = (signature, templates)
+        return templates
+
+
+# Command handlers: (session, args) -> JSON-serializable result
+
+def cmd_db_init(session: Session, args: Dict[str, Any]) -> Any:
+    from db_init import create_empty_database
+
+    create_empty_database(args["output"])
+    session.invalidate_database(args["output"])
+    return {"initialized": args["output"]}
+
+
+def cmd_db_load(session: Session, args: Dict[str, Any]) -> Any:
+    selecting = bool(args.get("id") or args.get("where") or args.get("fields"))
+    jsonl = args.get("format") == "jsonl"
+    if args.get("with_versions"):
+        if selecting or jsonl:
+            raise ValueError("--with-versions loads whole files; it can't be combined with "
+                             "selectors or jsonl")
+        from db_load import load_database_versioned
+
+        data, versions = load_database_versioned(args["db_path"], args.get("file"))
+        return {"data": data, "versions": versions}
+    if selecting or jsonl:
+        from db_load import parse_where, query_database
+
+        fields = args.get("fields")
+        if isinstance(fields, str):
+            fields = [f.strip() for f in fields.split(",") if f.strip()]
+        return list(query_database(args["db_path"], args.get("file"), args.get("id"),
+                                   parse_where(args.get("where") or []), fields))
+    return session.load_database(args["db_path"], args.get("file"))
+
+
+def cmd_db_save(session: Session, args: Dict[str, Any]) -> Any:
+    from db_save import parse_expected_versions, save_database
+
+    expected = args.get("expected_versions")
+    if expected is None:
+        expected = parse_expected_versions(args.get("expected_version") or [], args.get("file"))
+    versions = save_database(args["db_path"], parse_json_arg(args["data"]), args.get("file"),
+                             expected)
+    session.invalidate_database(args["db_path"])
+    return {"saved": args.get("file") or "all", "versions": versions}
+
+
+def cmd_db_add(session: Session, args: Dict[str, Any]) -> Any:
+    from db_add import add_entry, bulk_add, read_bulk_records
+
+    if args.get("records") is not None or args.get("bulk"):
+        if args.get("records") is not None:
+            # serve: a list of {"type", "data"} objects
+            records = read_bulk_records(json.dumps(r) for r in args["records"])
+        elif args["bulk"] == "-":
+            if session.serving:
+                raise ValueError("bulk '-' would read the serve request stream; pass records instead")
+            records = read_bulk_records(sys.stdin)
+        else:
+            with open(args["bulk"], 'r') as f:
+                records = read_bulk_records(f)
+        summary = bulk_add(args["db_path"], records)
+        session.invalidate_database(args["db_path"])
+        return summary
+
+    new_id = add_entry(args["db_path"], args["type"], parse_json_arg(args["data"]))
+    session.invalidate_database(args["db_path"])
+    return {"id": new_id}
+
+
+def cmd_db_query(session: Session, args: Dict[str, Any]) -> Any:
+    from db_index import DatabaseIndex
+    from db_sqlite import SqliteBackend, is_sqlite_path
+
+    if not Path(args["db_path"]).exists():
+        raise FileNotFoundError(f"Database not found: {args['db_path']}")
+
+    if is_sqlite_path(args["db_path"]):
+        with SqliteBackend(args["db_path"], create=False) as backend:
+            results = backend.get_ids(args.get("id") or [])
+            for name in (args.get("skill") or []) + (args.get("technology") or []):
+                results += [e for e in backend.by_skill(name, args.get("type")) if e not in results]
+        return results
+
+    from db_lock import database_lock
+
+    with database_lock(args["db_path"], exclusive=False):
+        index = DatabaseIndex(args["db_path"]).ensure_fresh()
+        tables = [args["type"]] if args.get("type") else None
+        ids = list(args.get("id") or [])
+        ids += [i for i in index.ids_for("skills", args.get("skill") or [], tables) if i not in ids]
+        ids += [i for i in index.ids_for("technologies", args.get("technology") or [], tables) if i not in ids]
+        return index.get(ids)
+
+
+def cmd_db_validate(session: Session, args: Dict[str, Any]) -> Any:
+    from db_validate import validate_database
+
+    is_valid, errors = validate_database(args["db_path"])
+    return {"valid": is_valid, "errors": errors}
+
+
+def cmd_list_templates(session: Session, args: Dict[str, Any]) -> Any:
+    return session.list_templates()
+
+
+def cmd_compile(session: Session, args: Dict[str, Any]) -> Any:
+    from compile import (
+        DEFAULT_BACKEND, DEFAULT_FIT_STRATEGY, FONT_STEP, PROBE_JOBS, TEMPLATES_DIR,
+        auto_fit_compile
+    )
+    from compile_cache import CompileCache
+
+    content_path = Path(args["content"])
+    if not content_path.exists():
+        raise FileNotFoundError(f"Content file not found: {content_path}")
+    if not (TEMPLATES_DIR / args["template"]).exists():
+        raise FileNotFoundError(f"Template not found: {args['template']}")
+
+    return auto_fit_compile(
+        content_path, args["template"], Path(args["output"]),
+        strategy=args.get("strategy") or DEFAULT_FIT_STRATEGY,
+        font_step=args.get("font_step") or FONT_STEP,
+        cache=CompileCache(enabled=not args.get("no_cache", False)),
+        backend=args.get("backend") or DEFAULT_BACKEND,
+        probe_jobs=args.get("probe_jobs") or PROBE_JOBS
+    )
+
+
+def cmd_validate_pdf(session: Session, args: Dict[str, Any]) -> Any:
+    from validate_pdf import validate_pdf
+
+    return validate_pdf(Path(args["pdf"]))
+
+
+def cmd_check_coverage(session: Session, args: Dict[str, Any]) -> Any:
+    from check_coverage import incremental_coverage, score_coverage
+
+    with open(args["requirements"], 'r') as f:
+        requirements = json.load(f)
+    segments, tokens = session.resume(args["resume"])
+    if args.get("state"):
+        return incremental_coverage(segments, requirements, args["state"])
+    text = " ".join(text for _, text in segments)
+    return score_coverage(text, requirements, tokens=tokens, segments=segments)
+
+
+COMMANDS: Dict[str, Callable[[Session, Dict[str, Any]], Any]] = {
+    "db-init": cmd_db_init,
+    "db-load": cmd_db_load,
+    "db-save": cmd_db_save,
+    "db-add": cmd_db_add,
+    "db-query": cmd_db_query,
+    "db-validate": cmd_db_validate,
+    "list-templates": cmd_list_templates,
+    "compile": cmd_compile,
+    "validate-pdf": cmd_validate_pdf,
+    "check-coverage": cmd_check_coverage,
+}
+
+
+def result_exit_code(command: str, args: Dict[str, Any], result: Any) -> int:
+    """Mirror the exit codes of the standalone scripts."""
+    if command == "db-load" and isinstance(result, list):
+        # Selectors that match nothing exit 3, as in db_load.py
+        selecting = args.get("id") or args.get("where") or args.get("fields")
+        return 3 if selecting and not result else 0
+    if not isinstance(result, dict):
+        return 0
+    if command == "compile" and not result.get("success"):
+        return 1
+    if command in ("db-validate", "validate-pdf") and not result.get("valid"):
+        return 1
+    if command == "check-coverage" and result.get("status") == "critical_gaps":
+        return 1
+    return 0
+
+
+def run_command(session: Session, command: str, args: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Run one command and wrap the outcome as a response dict.
+
+    Scripts print progress to stdout; that is redirected to stderr so the
+    response stream stays pure JSON.
+    """
+    handler = COMMANDS.get(command)
+    if handler is None:
+        return {"ok": False, "error": f"Unknown command: {command}", "exit_code": 1}
+
+    from db_lock import VersionConflict
+
+    try:
+        with contextlib.redirect_stdout(sys.stderr):
+            result = handler(session, args)
+    except VersionConflict as e:
+        return {"ok": False, "error": str(e), "exit_code": 3}
+    except FileNotFoundError as e:
+        return {"ok": False, "error": str(e), "exit_code": 2}
+    except json.JSONDecodeError as e:
+        return {"ok": False, "error": f"Invalid JSON - {e}", "exit_code": 1}
+    except KeyError as e:
+        return {"ok": False, "error": f"Missing argument: {e}", "exit_code": 1}
+    except SystemExit as e:
+        code = e.code if isinstance(e.code, int) else 1
+        return {"ok": False, "error": f"{command} exited with status {code}", "exit_code": code}
+    except Exception as e:
+        return {"ok": False, "error": str(e), "exit_code": 1}
+
+    return {"ok": True, "result": result, "exit_code": result_exit_code(command, args, result)}
+
+
+def serve(session: Session) -> int:
+    """Answer newline-delimited JSON requests from stdin until EOF."""
+    session.serving = True
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict):
+                raise ValueError("request must be a JSON object")
+        except ValueError as e:
+            response = {"ok": False, "error": f"Invalid request: {e}", "exit_code": 1}
+        else:
+            response = run_command(session, request.get("command", ""), request.get("args") or {})
+            if "id" in request:
+                response = {"id": request["id"], **response}
+
+        sys.stdout.write(json.dumps(response) + "\n")
+        sys.stdout.flush()
+
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Rescume unified CLI")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    sub.add_parser("serve", help="Answer NDJSON requests on stdin until EOF")
+
+    p = sub.add_parser("db-init", help="Initialize resume database")
+    p.add_argument("--output", required=True, help="Output directory path")
+
+    p = sub.add_parser("db-load", help="Load resume database")
+    p.add_argument("--db-path", required=True, help="Database directory path")
+    p.add_argument("--file", help="Specific file to load (experiences, skills, etc.)")
+    p.add_argument("--with-versions", action="store_true", help="Also return file versions")
+    p.add_argument("--id", action="append", help="Only this entry id (repeatable)")
+    p.add_argument("--where", action="append", help="Only entries with field=value (repeatable)")
+    p.add_argument("--fields", help="Comma-separated fields to keep per entry")
+    p.add_argument("--format", choices=["json", "jsonl"], default="json",
+                   help="jsonl prints one entry per line")
+    p.add_argument("--pretty", action="store_true", help="Indent JSON output")
+
+    p = sub.add_parser("db-save", help="Save resume database")
+    p.add_argument("--db-path", required=True, help="Database directory path")
+    p.add_argument("--file", help="Specific file to save (experiences, skills, etc.)")
+    p.add_argument("--data", required=True, help="JSON data to save")
+    p.add_argument("--expected-version", action="append",
+                   help="Refuse the save if a file changed: N with --file, otherwise name=N")
+
+    p = sub.add_parser("db-add", help="Add entry to resume database")
+    p.add_argument("--db-path", required=True, help="Database directory path")
+    p.add_argument("--type", help="Entry type (experience, skill, project, education)")
+    p.add_argument("--data", help="JSON data for new entry")
+    p.add_argument("--bulk", metavar="FILE",
+                   help="JSONL file of {\"type\", \"data\"} records to add or update ('-' for stdin)")
+
+    p = sub.add_parser("db-query", help="Look up entries through the database index")
+    p.add_argument("--db-path", required=True, help="Database directory path")
+    p.add_argument("--id", action="append", help="Entry id (repeatable)")
+    p.add_argument("--skill", action="append", help="Entries demonstrating a skill (repeatable)")
+    p.add_argument("--technology", action="append", help="Entries listing a technology (repeatable)")
+    p.add_argument("--type", help="Restrict --skill/--technology to one table")
+
+    p = sub.add_parser("db-validate", help="Validate resume database")
+    p.add_argument("--db-path", required=True, help="Database directory path")
+
+    sub.add_parser("list-templates", help="List available Typst templates")
+
+    p = sub.add_parser("compile", help="Compile resume JSON to a single-page PDF")
+    p.add_argument("content", help="Resume content JSON")
+    p.add_argument("template", help="Template name")
+    p.add_argument("output", help="Output PDF path")
+    p.add_argument("--strategy", help="Font size search strategy")
+    p.add_argument("--font-step", type=float, help="Font size granularity in pt")
+    p.add_argument("--no-cache", action="store_true", help="Bypass the compile cache")
+    p.add_argument("--backend", help="oneshot or watch")
+    p.add_argument("--probe-jobs", type=int, help="Concurrent compiles for --strategy parallel")
+
+    p = sub.add_parser("validate-pdf", help="Validate a PDF file")
+    p.add_argument("pdf", help="PDF file")
+
+    p = sub.add_parser("check-coverage", help="Check skill coverage in resume")
+    p.add_argument("--resume", required=True, help="Resume DOCX, PDF or content JSON")
+    p.add_argument("--state", help="Per-bullet match index; only changed bullets are re-scored")
+    p.add_argument("--requirements", required=True, help="Path to JD requirements JSON")
+
+    return parser
+
+
+def print_result(command: str, args: Dict[str, Any], result: Any) -> None:
+    """Print a result as the standalone script would (db-load: compact unless --pretty)."""
+    if command != "db-load":
+        print(json.dumps(result, indent=2))
+    elif args.get("format") == "jsonl":
+        for entry in result:
+            sys.stdout.write(json.dumps(entry, separators=(",", ":")) + "\n")
+    elif args.get("pretty"):
+        print(json.dumps(result, indent=2))
+    else:
+        print(json.dumps(result, separators=(",", ":")))
+
+
+def main():
+    """CLI entry point."""
+    args = vars(build_parser().parse_args())
+    command = args.pop("command")
+    session = Session()
+
+    if command == "serve":
+        sys.exit(serve(session))
+
+    response = run_command(session, command, args)
+    if response["ok"]:
+        print_result(command, args, response["result"])
+    else:
+        print(f"Error: {response['error']}", file=sys.stderr)
+    sys.exit(response["exit_code"])
+
+
+if __name__ == "__main__":
+    main()
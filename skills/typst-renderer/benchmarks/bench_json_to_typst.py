@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+JSON → Typst Serializer Benchmark for Rescume v2.0
+
+Converts synthetic resume content of increasing size (default 1–50 MB of
+JSON) with the previous recursive converter and with the streaming
+writer, both into a string and straight into a file. Reports wall time,
+time per MB (flat = linear scaling) and peak memory allocated during the
+conversion (tracemalloc, measured in a separate run).
+
+Usage:
+    bench_json_to_typst.py [--sizes 1,5,10,25,50] [--repeat N] [--compact]
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Dict
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent / "scripts"
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+from json_to_typst import convert_json_to_typst, write_typst_data  # noqa: E402
+
+MB = 1024 * 1024
+
+
+def legacy_escape(s: str) -> str:
+    s = s.replace('\\', '\\\\')
+    s = s.replace('"', '\\"')
+    return s.replace('#', '\\#')
+
+
+def legacy_json_value_to_typst(value: Any, indent_level: int = 0) -> str:
+    """The recursive string-concatenating converter this replaced, for comparison."""
+    indent = "  " * indent_level
+    if value is None:
+        return "none"
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (int, float)):
+        return str(value)
+    if isinstance(value, str):
+        return f'"{legacy_escape(value)}"'
+    if isinstance(value, list):
+        if not value:
+            return "()"
+        items = [f"{indent}  {legacy_json_value_to_typst(item, indent_level + 1)}" for item in value]
+        return "(\n" + ",\n".join(items) + f",\n{indent})"
+    if isinstance(value, dict):
+        if not value:
+            return "()"
+        pairs = []
+        for key, val in value.items():
+            safe_key = key.replace("-", "_").replace(" ", "_")
+            typst_val = legacy_json_value_to_typst(val, indent_level + 1)
+            if "\n" in typst_val:
+                pairs.append(f"{indent}  {safe_key}: {typst_val}")
+            else:
+                pairs.append(f"{indent}  {safe_key}: {typst_val}")
+        return "(\n" + ",\n".join(pairs) + f",\n{indent})"
+    return f'"{legacy_escape(str(value))}"'
+
+
+def legacy_convert(json_data: Dict[str, Any]) -> str:
+    return ("// Resume data generated by Rescume v2.0\n"
+            "// Auto-generated from JSON - do not edit manually\n\n"
+            f"#let resume_data = {legacy_json_value_to_typst(json_data)}\n")
+
+
+def synthetic_content(target_bytes: int) -> Dict[str, Any]:
+    """Resume-shaped content whose JSON encoding is about target_bytes."""
+    def experience(i: int) -> Dict[str, Any]:
+        return {
+            "id": f"exp_{i:06d}",
+            "company": f"Company #{i} \"Labs\"",
+            "role": "Senior Software Engineer",
+            "dates": "2019 - Present",
+            "location": "New York, NY",
+            "bullets": [
+                {
+                    "text": f"Cut p99 latency by {j * 7 % 90}% for service #{i}-{j} "
+                            f"by rewriting the C:\\path\\to\\cache layer",
+                    "skills_demonstrated": ["Python", "Go", "Distributed Systems"],
+                    "metrics": {"before_ms": 120 + j, "after_ms": 40.5, "verified": True},
+                }
+                for j in range(6)
+            ],
+            "technologies": ["Python", "PostgreSQL", "Kubernetes", "gRPC"],
+            "manager": None,
+        }
+
+    sample = len(json.dumps(experience(0)))
+    return {
+        "header": {"name": "Jane Smith", "email": "jane@example.com", "phone": "(212) 555-0100"},
+        "summary": "Engineer building scalable systems.",
+        "experience": [experience(i) for i in range(max(1, target_bytes // sample))],
+        "skills": {"languages": ["Python", "Go", "TypeScript"]},
+    }
+
+
+def time_run(fn, repeat: int) -> float:
+    """Best wall time in ms over repeat runs."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, (time.perf_counter() - start) * 1000)
+    return best
+
+
+def peak_mb(fn) -> float:
+    """Peak memory allocated while fn runs, in MB."""
+    tracemalloc.start()
+    try:
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak / MB
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark JSON → Typst conversion")
+    parser.add_argument("--sizes", default="1,5,10,25,50",
+                        help="Comma-separated content sizes in MB (default: %(default)s)")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per case (default: 3)")
+    parser.add_argument("--compact", action="store_true", help="Benchmark compact output too")
+    args = parser.parse_args()
+
+    def to_file(data, compact=False):
+        with open(os.devnull, 'w', encoding='utf-8') as f:
+            write_typst_data(data, f, compact)
+
+    cases = {
+        "legacy": legacy_convert,
+        "stream_string": convert_json_to_typst,
+        "stream_file": to_file,
+    }
+    if args.compact:
+        cases["stream_file_compact"] = lambda data: to_file(data, compact=True)
+
+    rows = []
+    for size in (float(s) for s in args.sizes.split(",") if s.strip()):
+        data = synthetic_content(int(size * MB))
+        input_mb = len(json.dumps(data)) / MB
+        assert legacy_convert(data) == convert_json_to_typst(data)
+
+        row = {"input_mb": round(input_mb, 2), "output_mb": round(len(convert_json_to_typst(data)) / MB, 2)}
+        for name, fn in cases.items():
+            ms = time_run(lambda: fn(data), args.repeat)
+            row[name] = {
+                "ms": round(ms, 1),
+                "ms_per_mb": round(ms / input_mb, 1),
+                "peak_mb": round(peak_mb(lambda: fn(data)), 1),
+            }
+        rows.append(row)
+        print(json.dumps(row), file=sys.stderr)
+
+    print(json.dumps({"repeat": args.repeat, "results": rows}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Page Count Micro-Benchmark for Rescume v2.0
+
+Compares pdf_pages.fast_page_count against pdfplumber on the templates'
+preview.pdf / example.pdf files, plus the one-off cost of importing
+pdfplumber in a fresh interpreter.
+
+Usage:
+    bench_page_count.py [--repeat N] [pdf ...]
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent / "scripts"
+REPO_TEMPLATES = Path(__file__).resolve().parents[3] / "templates"
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+from pdf_pages import fast_page_count  # noqa: E402
+
+
+def time_calls(fn, path: Path, repeat: int):
+    """Return (result, mean_ms) over repeat calls."""
+    result = fn(path)
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn(path)
+    return result, (time.perf_counter() - start) * 1000 / repeat
+
+
+def pdfplumber_page_count(path: Path) -> int:
+    import pdfplumber
+    with pdfplumber.open(path) as pdf:
+        return len(pdf.pages)
+
+
+def pdfplumber_import_ms() -> float:
+    """Cold import time of pdfplumber in a fresh interpreter."""
+    code = "import time; t = time.perf_counter(); import pdfplumber; print((time.perf_counter() - t) * 1000)"
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+    return round(float(result.stdout), 2) if result.returncode == 0 else None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark PDF page counting")
+    parser.add_argument("pdfs", nargs="*", help="PDFs to test (default: template previews)")
+    parser.add_argument("--repeat", type=int, default=200, help="Calls per file (default: 200)")
+    args = parser.parse_args()
+
+    pdfs = [Path(p) for p in args.pdfs] or sorted(REPO_TEMPLATES.glob("*/*.pdf"))
+
+    try:
+        import pdfplumber  # noqa: F401
+        have_pdfplumber = True
+    except ImportError:
+        have_pdfplumber = False
+
+    rows = []
+    for pdf in pdfs:
+        pages, fast_ms = time_calls(fast_page_count, pdf, args.repeat)
+        row = {"file": str(pdf), "pages_fast": pages, "fast_ms": round(fast_ms, 4)}
+
+        if have_pdfplumber:
+            slow_pages, slow_ms = time_calls(pdfplumber_page_count, pdf, max(1, args.repeat // 10))
+            row.update({
+                "pages_pdfplumber": slow_pages,
+                "pdfplumber_ms": round(slow_ms, 4),
+                "speedup": round(slow_ms / fast_ms, 1) if fast_ms else None,
+                "agree": pages == slow_pages,
+            })
+        rows.append(row)
+
+    print(json.dumps({
+        "repeat": args.repeat,
+        "pdfplumber_import_ms": pdfplumber_import_ms() if have_pdfplumber else None,
+        "results": rows,
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    main()
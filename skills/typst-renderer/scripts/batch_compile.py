@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Batch Resume Compilation Script for Rescume v2.0
+
+Compiles many resumes against many templates in one process, fanning the
+jobs out across a bounded process pool. One JSON result per job is
+streamed to stdout (JSONL) as soon as that job finishes.
+
+Usage:
+    batch_compile.py --manifest jobs.jsonl [-j N]
+    batch_compile.py --content 'variants/*.json' --templates basic-resume,modern-cv
+                     --output-dir out/ [-j N]
+
+Manifest lines look like:
+    {"content": "acme.json", "template": "basic-resume", "output": "acme.pdf"}
+"""
+
+import argparse
+import glob
+import json
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+from compile import (
+    BACKENDS, DEFAULT_BACKEND, DEFAULT_FIT_STRATEGY, FIT_STRATEGIES, FONT_STEP,
+    TEMPLATES_DIR, auto_fit_compile
+)
+from compile_cache import CompileCache
+
+
+def load_manifest(manifest_path: Path) -> List[Dict[str, str]]:
+    """Read content/template/output triples from a JSONL manifest."""
+    jobs = []
+    with open(manifest_path, 'r', encoding='utf-8') as f:
+        for line_no, line in enumerate(f, 1):
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            job = json.loads(line)
+            missing = [k for k in ("content", "template", "output") if k not in job]
+            if missing:
+                raise ValueError(f"{manifest_path}:{line_no}: missing {', '.join(missing)}")
+            jobs.append(job)
+    return jobs
+
+
+def expand_glob(pattern: str, templates: List[str], output_dir: Path) -> List[Dict[str, str]]:
+    """Build one job per matched content file per template."""
+    jobs = []
+    for content in sorted(glob.glob(pattern)):
+        stem = Path(content).stem
+        for template in templates:
+            output = output_dir / f"{stem}-{template}.pdf"
+            jobs.append({"content": content, "template": template, "output": str(output)})
+    return jobs
+
+
+def run_job(job: Dict[str, str], strategy: str, font_step: float, use_cache: bool,
+            backend: str = DEFAULT_BACKEND, probe_jobs: int = 1) -> Dict[str, Any]:
+    """Compile a single job. Runs inside a worker process."""
+    content_path = Path(job["content"])
+    output_path = Path(job["output"])
+
+    if not content_path.exists():
+        return {"success": False, "error": f"Content file not found: {content_path}"}
+    if not (TEMPLATES_DIR / job["template"]).exists():
+        return {"success": False, "error": f"Template not found: {job['template']}"}
+
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    try:
+        return auto_fit_compile(
+            content_path, job["template"], output_path,
+            strategy=strategy, font_step=font_step,
+            cache=CompileCache(enabled=use_cache),
+            backend=backend, probe_jobs=probe_jobs
+        )
+    except SystemExit:
+        # load_json_content exits on invalid input; keep the batch going
+        return {"success": False, "error": f"Could not load content: {content_path}"}
+    except Exception as e:
+        return {"success": False, "error": str(e)}
+
+
+def main():
+    """CLI entry point."""
+    parser = argparse.ArgumentParser(description="Compile many resumes in parallel")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--manifest", help="JSONL file of {content, template, output} jobs")
+    source.add_argument("--content", help="Glob of content JSON files, e.g. 'variants/*.json'")
+    parser.add_argument("--templates", help="Comma-separated templates (with --content)")
+    parser.add_argument("--output-dir", help="Directory for output PDFs (with --content)")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1,
+                        help="Number of parallel workers (default: CPU count)")
+    parser.add_argument("--strategy", choices=FIT_STRATEGIES, default=DEFAULT_FIT_STRATEGY,
+                        help="Font size search strategy (default: %(default)s)")
+    parser.add_argument("--font-step", type=float, default=FONT_STEP,
+                        help="Font size granularity in pt (default: %(default)s)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Always run Typst; do not read or write the compile cache")
+    parser.add_argument("--backend", choices=BACKENDS, default=DEFAULT_BACKEND,
+                        help="oneshot: fresh typst per compile; watch: reuse a typst watch process")
+
+    args = parser.parse_args()
+
+    try:
+        if args.manifest:
+            jobs = load_manifest(Path(args.manifest))
+        else:
+            if not args.templates or not args.output_dir:
+                parser.error("--content requires --templates and --output-dir")
+            templates = [t.strip() for t in args.templates.split(",") if t.strip()]
+            jobs = expand_glob(args.content, templates, Path(args.output_dir))
+    except FileNotFoundError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(2)
+    except (ValueError, json.JSONDecodeError) as e:
+        print(f"Error: Invalid manifest: {e}", file=sys.stderr)
+        sys.exit(3)
+
+    if not jobs:
+        print("Error: No jobs to run", file=sys.stderr)
+        sys.exit(2)
+
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+
+    start_time = time.time()
+    failures = 0
+    workers = max(1, min(args.jobs, len(jobs)))
+    # --strategy parallel: share the CPUs between workers instead of oversubscribing
+    probe_jobs = max(1, (os.cpu_count() or 1) // workers)
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {
+            pool.submit(run_job, job, args.strategy, args.font_step, not args.no_cache,
+                        args.backend, probe_jobs): job
+            for job in jobs
+        }
+        for future in as_completed(futures):
+            job = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:
+                result = {"success": False, "error": str(e)}
+
+            if not result.get("success"):
+                failures += 1
+
+            print(json.dumps({**job, **result}), flush=True)
+
+    elapsed_ms = int((time.time() - start_time) * 1000)
+    print(f"\n{len(jobs) - failures}/{len(jobs)} compiled with {workers} workers in {elapsed_ms}ms",
+          file=sys.stderr)
+
+    sys.exit(0 if failures == 0 else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -7,21 +7,27 @@ single-page PDF using Typst templates with automatic font size adjustment.
 
 Usage:
     compile.py <content.json> <template-name> <output.pdf>
+               [--strategy bisect|linear|measure|parallel] [--font-step 0.1] [--no-cache]
+               [--backend oneshot|watch] [--probe-jobs N]
 """
 
+import argparse
 import json
+import os
 import subprocess
 import sys
-import tempfile
 import time
 from pathlib import Path
-from typing import Dict, Any, Tuple
+from typing import TYPE_CHECKING, Awaitable, Callable, Dict, Any, List, Optional, Set, Tuple
 
-try:
-    import pdfplumber
-except ImportError:
-    print("Error: pdfplumber not installed. Run: pip install pdfplumber", file=sys.stderr)
-    sys.exit(1)
+from compile_cache import CompileCache, typst_version
+from json_to_typst import convert_json_to_typst_modules, write_typst_modules
+from pdf_pages import fast_page_count
+from typst_assets import typst_asset_args
+from typst_workspace import get_workspace, publish_file
+
+if TYPE_CHECKING:
+    from typst_watch import TypstWatcher
 
 
 # Configuration
@@ -30,10 +36,41 @@ TEMPLATES_DIR = Path.home() / ".claude" / "skills" / "rescume" / "templates"
 MIN_FONT_SIZE = 9.0
 MAX_FONT_SIZE = 11.0
 FONT_STEP = 0.5
+FIT_STRATEGIES = ("bisect", "linear", "measure", "parallel")
+DEFAULT_FIT_STRATEGY = "bisect"
+BACKENDS = ("oneshot", "watch")
+DEFAULT_BACKEND = "oneshot"
+PROBE_JOBS = os.cpu_count() or 1
+# Main files import the template from the workspace root (see typst_workspace)
+TEMPLATE_IMPORT = "/template.typ"
+
+
+class FitError(Exception):
+    """Raised by a font probe when compilation or page counting fails."""
+
+    def __init__(self, message: str, details: str = ""):
+        super().__init__(message)
+        self.message = message
+        self.details = details
 
 
 def get_pdf_page_count(pdf_path: Path) -> int:
-    """Get number of pages in PDF."""
+    """
+    Get number of pages in PDF.
+
+    Reads /Count from the page tree directly; pdfplumber is only imported
+    for files the fast path can't follow.
+    """
+    pages = fast_page_count(pdf_path)
+    if pages is not None:
+        return pages
+
+    try:
+        import pdfplumber
+    except ImportError:
+        print("Error: pdfplumber not installed. Run: pip install pdfplumber", file=sys.stderr)
+        return -1
+
     try:
         with pdfplumber.open(pdf_path) as pdf:
             return len(pdf.pages)
@@ -65,21 +102,9 @@ def load_json_content(json_path: Path) -> Dict[str, Any]:
         sys.exit(2)
 
 
-def create_typst_main_file(template_name: str, data_typ_filename: str,
-                           template_typ_filename: str, font_size: float) -> str:
-    """
-    Create main Typst file that imports template and data.
-    Assumes template and data files are copied into the same directory.
-
-    Returns the Typst content as a string.
-    """
-    typst_content = f"""// Main resume file - auto-generated
-#import "{template_typ_filename}": resume
-#import "{data_typ_filename}": resume_data
-
-// Call template with data and font size
-// Note: Typst function calls need exact parameter matching
-#resume(
+def format_resume_call(font_size: float) -> str:
+    """Return the Typst call that renders resume_data with the template at font_size."""
+    return f"""resume(
   font-size: {font_size}pt,
   name: resume_data.header.name,
   email: resume_data.header.at("email", default: none),
@@ -93,20 +118,104 @@ def create_typst_main_file(template_name: str, data_typ_filename: str,
   experience: resume_data.at("experience", default: ()),
   projects: resume_data.at("projects", default: ()),
   skills: resume_data.at("skills", default: none),
-)
+)"""
+
+
+def create_typst_main_file(template_name: str, data_typ_filename: str,
+                           template_typ_filename: str, font_size: float) -> str:
+    """
+    Create main Typst file that imports template and data.
+    Paths are resolved by Typst: relative to the main file, or to the
+    project root if they start with "/".
+
+    Returns the Typst content as a string.
+    """
+    typst_content = f"""// Main resume file - auto-generated
+#import "{template_typ_filename}": resume
+#import "{data_typ_filename}": resume_data
+
+// Call template with data and font size
+// Note: Typst function calls need exact parameter matching
+#{format_resume_call(font_size)}
 """
     return typst_content
 
 
-def compile_typst(main_typ_path: Path, output_pdf_path: Path) -> Tuple[bool, str]:
+def create_typst_measure_file(data_typ_filename: str, template_typ_filename: str,
+                              font_sizes: List[float]) -> str:
     """
-    Compile Typst file to PDF.
+    Create a Typst file that lays out the resume once per candidate font size.
+
+    Templates configure the page themselves (`set page`), so the resume
+    cannot be wrapped in `measure()`. Instead each candidate is rendered
+    between two marker pages carrying labelled metadata, and a final context
+    block records how many pages each candidate spanned as <fit-result>
+    metadata for `typst query` to read back.
+
+    Returns the Typst content as a string.
+    """
+    lines = [
+        "// Font fit measurement - auto-generated",
+        f'#import "{template_typ_filename}": resume',
+        f'#import "{data_typ_filename}": resume_data',
+        "",
+        "// Marker pages between candidates; each resume sets its own page",
+        "#set page(width: 1in, height: 1in, margin: 0pt)",
+        "",
+    ]
+    for font_size in font_sizes:
+        lines.append(f"#metadata({font_size}) <fit-start>")
+        lines.append("#box(width: 1pt, height: 1pt)")
+        lines.append(f"#{format_resume_call(font_size)}")
+        lines.append(f"#metadata({font_size}) <fit-end>")
+        lines.append("#box(width: 1pt, height: 1pt)")
+        lines.append("")
+
+    lines.append("""#context {
+  for (start, end) in query(<fit-start>).zip(query(<fit-end>)) {
+    let pages = end.location().page() - start.location().page() - 1
+    [#metadata((size: start.value, pages: pages)) <fit-result>]
+  }
+}
+""")
+    return "\n".join(lines)
+
+
+def typst_args(root: Optional[Path] = None) -> List[str]:
+    """Options shared by every Typst invocation: project root and vendored assets."""
+    args = ["--root", str(root)] if root is not None else []
+    return args + typst_asset_args(TEMPLATES_DIR)
+
+
+def compile_typst(main_typ_path: Path, output_pdf_path: Path,
+                  cache: Optional[CompileCache] = None,
+                  cache_key: Optional[str] = None,
+                  watcher: Optional["TypstWatcher"] = None,
+                  root: Optional[Path] = None) -> Tuple[bool, str]:
+    """
+    Compile Typst file to PDF (root: Typst project root, default the file's directory).
+
+    If cache and cache_key are given, a cached PDF is copied to
+    output_pdf_path without running Typst, and fresh output is stored.
+    If a watcher is given, the compile goes through its long-lived
+    `typst watch` process first and falls back to a one-shot compile.
 
     Returns: (success: bool, error_message: str)
     """
+    if cache is not None and cache_key is not None and cache.fetch_pdf(cache_key, output_pdf_path):
+        return True, ""
+
+    if watcher is not None:
+        success, _ = watcher.compile(main_typ_path, output_pdf_path)
+        if success:
+            if cache is not None and cache_key is not None:
+                cache.put(cache_key, {}, output_pdf_path)
+            return True, ""
+
     try:
         result = subprocess.run(
-            [str(TYPST_CLI), "compile", str(main_typ_path), str(output_pdf_path)],
+            [str(TYPST_CLI), "compile", *typst_args(root),
+             str(main_typ_path), str(output_pdf_path)],
             capture_output=True,
             text=True,
             timeout=30
@@ -115,6 +224,9 @@ def compile_typst(main_typ_path: Path, output_pdf_path: Path) -> Tuple[bool, str
         if result.returncode != 0:
             return False, result.stderr
 
+        if cache is not None and cache_key is not None:
+            cache.put(cache_key, {}, output_pdf_path)
+
         return True, ""
 
     except subprocess.TimeoutExpired:
@@ -125,123 +237,546 @@ def compile_typst(main_typ_path: Path, output_pdf_path: Path) -> Tuple[bool, str
         return False, str(e)
 
 
+async def compile_typst_async(main_typ_path: Path, output_pdf_path: Path,
+                              root: Optional[Path] = None) -> "Tuple[bool, str]":
+    """
+    compile_typst as a coroutine, for running several probes at once.
+
+    Cancelling the coroutine kills the Typst process.
+
+    Returns: (success: bool, error_message: str)
+    """
+    import asyncio  # deferred: only the parallel strategy needs it (see bench_startup)
+
+    try:
+        process = await asyncio.create_subprocess_exec(
+            str(TYPST_CLI), "compile", *typst_args(root),
+            str(main_typ_path), str(output_pdf_path),
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.PIPE
+        )
+    except FileNotFoundError:
+        return False, f"Typst CLI not found at {TYPST_CLI}. Is it installed?"
+
+    try:
+        _, stderr = await asyncio.wait_for(process.communicate(), timeout=30)
+    except asyncio.TimeoutError:
+        process.kill()
+        await process.wait()
+        return False, "Compilation timed out (>30s)"
+    except asyncio.CancelledError:
+        process.kill()
+        await process.wait()
+        raise
+
+    if process.returncode != 0:
+        return False, stderr.decode(errors="replace")
+    return True, ""
+
+
+def query_typst(main_typ_path: Path, selector: str,
+                root: Optional[Path] = None) -> Tuple[bool, Any]:
+    """
+    Run `typst query` and return the `value` field of every matching element.
+
+    Returns: (success: bool, values or error_message)
+    """
+    try:
+        result = subprocess.run(
+            [str(TYPST_CLI), "query", *typst_args(root),
+             str(main_typ_path), selector, "--field", "value"],
+            capture_output=True,
+            text=True,
+            timeout=30
+        )
+
+        if result.returncode != 0:
+            return False, result.stderr
+
+        return True, json.loads(result.stdout)
+
+    except subprocess.TimeoutExpired:
+        return False, "Query timed out (>30s)"
+    except FileNotFoundError:
+        return False, f"Typst CLI not found at {TYPST_CLI}. Is it installed?"
+    except json.JSONDecodeError as e:
+        return False, f"Invalid query output: {e}"
+    except Exception as e:
+        return False, str(e)
+
+
+def measure_page_counts(workdir: Path, data_typ_filename: str, template_typ_filename: str,
+                        font_sizes: List[float], root: Optional[Path] = None) -> Tuple[bool, Any]:
+    """
+    Lay out every candidate font size in a single Typst run.
+
+    Returns: (success: bool, {font_size: pages} or error_message)
+    """
+    measure_typ_path = workdir / "measure.typ"
+    with open(measure_typ_path, 'w', encoding='utf-8') as f:
+        f.write(create_typst_measure_file(data_typ_filename, template_typ_filename, font_sizes))
+
+    success, values = query_typst(measure_typ_path, "<fit-result>", root)
+    if not success:
+        return False, values
+
+    try:
+        places = max(map(decimal_places, font_sizes), default=1)
+        measured = {round(float(v["size"]), places): int(v["pages"]) for v in values}
+    except (KeyError, TypeError, ValueError) as e:
+        return False, f"Unexpected measurement output: {e}"
+
+    missing = [size for size in font_sizes if size not in measured]
+    if missing:
+        return False, f"No measurement for font sizes: {missing}"
+
+    return True, measured
+
+
+def decimal_places(value: float) -> int:
+    """Decimal places needed to write value exactly (at least one, at most ten)."""
+    return max(1, len(f"{value:.10f}".rstrip("0").split(".")[1]))
+
+
+def build_font_candidates(min_size: float, max_size: float, step: float) -> List[float]:
+    """
+    Return the font sizes to search, ascending from min_size to max_size.
+
+    Sizes are rounded to the decimal places of step (at least one, so 0.5
+    gives 10.5 and 0.25 gives 10.25) so they can be used as stable
+    dictionary keys and printed in the result JSON.
+    """
+    if step <= 0:
+        raise ValueError(f"Font step must be positive, got {step}")
+
+    places = decimal_places(step)
+    count = int(round((max_size - min_size) / step))
+    candidates = [round(min_size + i * step, places) for i in range(count + 1)]
+    candidates = [c for c in candidates if c <= max_size]
+    if candidates[-1] != max_size:
+        candidates.append(max_size)
+    return candidates
+
+
+def linear_fit(candidates: List[float], probe: Callable[[float], int]) -> Optional[float]:
+    """
+    Walk down from the largest candidate until one fits on a single page.
+
+    Returns the fitted font size, or None if even the smallest overflows.
+    """
+    for font_size in reversed(candidates):
+        if probe(font_size) == 1:
+            return font_size
+    return None
+
+
+def bisect_fit(candidates: List[float], probe: Callable[[float], int]) -> Optional[float]:
+    """
+    Binary-search the largest candidate that fits on a single page.
+
+    Page count is monotonic in font size, so after checking both ends this
+    needs O(log n) probes regardless of how fine the step is. The largest
+    size is probed first because most resumes fit without shrinking.
+
+    Returns the fitted font size, or None if even the smallest overflows.
+    """
+    if probe(candidates[-1]) == 1:
+        return candidates[-1]
+    if probe(candidates[0]) > 1:
+        return None
+
+    # Invariant: candidates[lo] fits, candidates[hi] overflows
+    lo, hi = 0, len(candidates) - 1
+    while hi - lo > 1:
+        mid = (lo + hi) // 2
+        if probe(candidates[mid]) == 1:
+            lo = mid
+        else:
+            hi = mid
+    return candidates[lo]
+
+
+def pick_probes(lo: int, hi: int, busy: Set[int], slots: int, count: int) -> List[int]:
+    """
+    Choose up to `slots` untested candidate indices strictly between lo and hi.
+
+    The largest candidate goes first while it is unknown (most resumes fit
+    without shrinking); the rest are spread evenly over the open interval.
+    """
+    free = [i for i in range(lo + 1, hi) if i not in busy]
+    picked = []
+    if hi == count and count - 1 in free and slots > 0:
+        picked.append(count - 1)
+        free.remove(count - 1)
+    slots -= len(picked)
+    if len(free) <= slots:
+        return picked + free
+    return picked + [free[(j + 1) * len(free) // (slots + 1)] for j in range(slots)]
+
+
+async def parallel_fit(candidates: List[float], probe: "Callable[[float], Awaitable[int]]",
+                       jobs: int) -> "Optional[float]":
+    """
+    Find the largest candidate that fits by probing up to `jobs` sizes at once.
+
+    Keeps the bisect invariant (candidates[lo] fits, candidates[hi]
+    overflows, with -1 and len(candidates) as sentinels) but narrows it with
+    every probe that finishes, cancels probes that fall outside the interval,
+    and refills free slots. It stops, cancelling everything still running,
+    as soon as lo and hi are adjacent.
+
+    Returns the fitted font size, or None if even the smallest overflows.
+    """
+    import asyncio
+
+    lo, hi = -1, len(candidates)
+    running: Dict[int, "asyncio.Task[int]"] = {}
+    try:
+        while hi - lo > 1:
+            for i in pick_probes(lo, hi, set(running), max(1, jobs) - len(running), len(candidates)):
+                running[i] = asyncio.ensure_future(probe(candidates[i]))
+
+            done, _ = await asyncio.wait(running.values(), return_when=asyncio.FIRST_COMPLETED)
+            for i in [i for i, task in running.items() if task in done]:
+                if running.pop(i).result() == 1:
+                    lo = max(lo, i)
+                else:
+                    hi = min(hi, i)
+
+            for i in [i for i in running if not lo < i < hi]:
+                running.pop(i).cancel()
+    finally:
+        for task in running.values():
+            task.cancel()
+        await asyncio.gather(*running.values(), return_exceptions=True)
+
+    return candidates[lo] if lo >= 0 else None
+
+
+def cached_fit_result(
+    cached_fit: Dict[str, Any],
+    cache: CompileCache,
+    compile_key: Callable[[float], Optional[str]],
+    output_pdf_path: Path,
+    strategy: str,
+    start_time: float
+) -> Optional[Dict[str, Any]]:
+    """
+    Build the auto_fit_compile result for a fit cache hit.
+
+    Returns None if the fitted PDF has since been evicted, so the caller
+    falls through to a normal search.
+    """
+    font_size = cached_fit.get("font_size_used")
+    pages = cached_fit.get("pages")
+    search_info = {"strategy": strategy, "probes": 0, "iterations": 0, "cached": True}
+
+    if font_size is None:
+        bullets_to_remove = max(2, int((pages - 1.0) * 10))
+        return {
+            "success": False,
+            "status": "overflow",
+            "pages": pages,
+            "min_font_reached": MIN_FONT_SIZE,
+            **search_info,
+            "cache": cache.stats(),
+            "compilation_time_ms": int((time.time() - start_time) * 1000),
+            "recommendation": f"Content still overflows at minimum font size ({MIN_FONT_SIZE}pt). "
+                            f"Please reduce content by approximately {bullets_to_remove}-{bullets_to_remove + 1} bullet points."
+        }
+
+    if not cache.fetch_pdf(compile_key(font_size), output_pdf_path, copy=publish_file):
+        return None
+
+    return {
+        "success": True,
+        "pages": 1,
+        "font_size_used": font_size,
+        "output_path": str(output_pdf_path),
+        **search_info,
+        "cache": cache.stats(),
+        "compilation_time_ms": int((time.time() - start_time) * 1000)
+    }
+
+
 def auto_fit_compile(
     content_json_path: Path,
     template_name: str,
-    output_pdf_path: Path
+    output_pdf_path: Path,
+    strategy: str = DEFAULT_FIT_STRATEGY,
+    font_step: float = FONT_STEP,
+    cache: Optional[CompileCache] = None,
+    backend: str = DEFAULT_BACKEND,
+    probe_jobs: int = PROBE_JOBS
 ) -> Dict[str, Any]:
     """
     Compile resume with automatic font size adjustment to fit 1 page.
 
+    strategy selects how font sizes are searched: "bisect" (default) finds
+    the largest fitting size in O(log n) compiles, "linear" steps down from
+    MAX_FONT_SIZE one font_step at a time, and "measure" lays out every
+    candidate in one `typst query` run and then compiles only the winner.
+    If measurement fails, "measure" falls back to bisect. "parallel" runs
+    up to probe_jobs one-shot compiles at once (see parallel_fit), so a
+    dense resume costs about one compile of wall time instead of several.
+
+    With a cache, both individual compiles and the fitted font size are
+    looked up by content hash; a fit hit returns without running Typst.
+
+    backend "watch" routes probe compiles through a persistent `typst watch`
+    process for the working directory, falling back to one-shot compiles.
+
     Returns result dictionary with status and metadata.
     """
+    if strategy not in FIT_STRATEGIES:
+        return {
+            "success": False,
+            "error": f"Unknown fit strategy: {strategy}. Must be: {', '.join(FIT_STRATEGIES)}"
+        }
+    if backend not in BACKENDS:
+        return {
+            "success": False,
+            "error": f"Unknown backend: {backend}. Must be: {', '.join(BACKENDS)}"
+        }
+
+    try:
+        candidates = build_font_candidates(MIN_FONT_SIZE, MAX_FONT_SIZE, font_step)
+    except ValueError as e:
+        return {"success": False, "error": str(e)}
+
     start_time = time.time()
 
     # Load JSON content
     json_data = load_json_content(content_json_path)
 
-    # Create temporary working directory
-    with tempfile.TemporaryDirectory() as tmpdir:
-        tmpdir_path = Path(tmpdir)
-
-        # Step 1: Convert JSON to Typst data
-        json_to_typst_script = Path(__file__).parent / "json_to_typst.py"
-        data_typ_path = tmpdir_path / "data.typ"
-
-        result = subprocess.run(
-            [sys.executable, str(json_to_typst_script),
-             str(content_json_path), str(data_typ_path)],
-            capture_output=True,
-            text=True
-        )
+    template_dir = TEMPLATES_DIR / template_name
+    if not (template_dir / "template.typ").exists():
+        return {
+            "success": False,
+            "error": f"Template not found: {template_dir / 'template.typ'}"
+        }
 
-        if result.returncode != 0:
+    # The template directory is linked into a pooled workspace once per process;
+    # each compile only gets its own job directory inside it. Watch compiles
+    # share one persistent job directory (and typst watch process) per template,
+    # so Typst keeps unchanged data sections laid out between compiles.
+    try:
+        workspace = get_workspace(template_dir)
+    except OSError as e:
+        return {"success": False, "error": "Failed to prepare template workspace", "details": str(e)}
+    root = workspace.root
+    use_watcher = backend == "watch" and strategy != "parallel"
+
+    with workspace.job("watch" if use_watcher else None) as job_dir:
+        # Step 1: Convert JSON to Typst data (in-process, reusing the parsed JSON):
+        # one module per section, rewriting only the sections that changed
+        timings = {"convert_ms": 0.0, "compile_ms": 0.0, "measure_ms": 0.0}
+
+        convert_start = time.perf_counter()
+        try:
+            data_modules = convert_json_to_typst_modules(json_data, "data.typ")
+        except Exception as e:
             return {
                 "success": False,
                 "error": "Failed to convert JSON to Typst",
-                "details": result.stderr
+                "details": str(e)
             }
+        rewritten = write_typst_modules(data_modules, job_dir)
+        timings["convert_ms"] += (time.perf_counter() - convert_start) * 1000
+
+        # Cache keys cover everything that determines the PDF
+        if cache is None:
+            cache = CompileCache(enabled=False)
+        if cache.enabled:
+            # Covers template.typ and the assets it loads (images etc.)
+            template_bytes = workspace.digest()
+            # Vendored fonts/packages can change the output, so they are part of the key
+            version = [typst_version(TYPST_CLI, cache.cache_dir), typst_asset_args(TEMPLATES_DIR)]
+
+            def compile_key(font_size: float) -> Optional[str]:
+                return cache.make_key("compile", data_modules, template_bytes, font_size, version)
+
+            fit_key = cache.make_key("fit", data_modules, template_bytes, candidates, version)
+        else:
+            def compile_key(font_size: float) -> Optional[str]:
+                return None
+
+            fit_key = None
+
+        cached_fit = cache.get(fit_key) if fit_key else None
+        if cached_fit is not None:
+            result = cached_fit_result(
+                cached_fit, cache, compile_key, output_pdf_path, strategy, start_time
+            )
+            if result is not None:
+                return result
 
-        # Copy template file to temp directory
-        template_source = TEMPLATES_DIR / template_name / "template.typ"
-        if not template_source.exists():
-            return {
-                "success": False,
-                "error": f"Template not found: {template_source}"
-            }
+        # Step 2: Auto-fit search
+        watcher = None
+        if use_watcher:
+            from typst_watch import get_watcher
 
-        import shutil
-        template_typ_path = tmpdir_path / "template.typ"
-        shutil.copy(template_source, template_typ_path)
+            # Kept running for the next compile; stopped at exit
+            watcher = get_watcher(TYPST_CLI, job_dir, typst_args(root))
+            if rewritten:
+                watcher.settle()
 
-        # Step 2: Auto-fit loop
-        current_font = MAX_FONT_SIZE
-        iterations = 0
-        max_iterations = int((MAX_FONT_SIZE - MIN_FONT_SIZE) / FONT_STEP) + 1
+        page_counts: Dict[float, int] = {}
+        probe_pdfs: Dict[float, Path] = {}
 
-        while current_font >= MIN_FONT_SIZE and iterations < max_iterations:
-            iterations += 1
+        def probe(font_size: float) -> int:
+            """Compile at font_size and return its page count (memoized)."""
+            if font_size in page_counts:
+                return page_counts[font_size]
 
             # Create main Typst file with current font size
             main_content = create_typst_main_file(
-                template_name, "data.typ", "template.typ", current_font
+                template_name, "data.typ", TEMPLATE_IMPORT, font_size
             )
 
-            main_typ_path = tmpdir_path / "main.typ"
+            main_typ_path = job_dir / "main.typ"
             with open(main_typ_path, 'w', encoding='utf-8') as f:
                 f.write(main_content)
 
             # Compile
-            temp_pdf = tmpdir_path / f"output_{current_font}.pdf"
-            success, error_msg = compile_typst(main_typ_path, temp_pdf)
+            temp_pdf = job_dir / f"output_{font_size}.pdf"
+            compile_start = time.perf_counter()
+            success, error_msg = compile_typst(
+                main_typ_path, temp_pdf, cache, compile_key(font_size), watcher, root
+            )
+            timings["compile_ms"] += (time.perf_counter() - compile_start) * 1000
 
             if not success:
-                return {
-                    "success": False,
-                    "error": f"Compilation failed at font size {current_font}pt",
-                    "details": error_msg
-                }
+                raise FitError(
+                    f"Compilation failed at font size {font_size}pt", error_msg
+                )
 
             # Check page count
+            measure_start = time.perf_counter()
             pages = get_pdf_page_count(temp_pdf)
+            timings["measure_ms"] += (time.perf_counter() - measure_start) * 1000
 
             if pages < 0:
-                return {
-                    "success": False,
-                    "error": "Failed to read output PDF"
-                }
-
-            if pages == 1:
-                # Success! Copy to final output
-                shutil.copy(temp_pdf, output_pdf_path)
-
-                elapsed_ms = int((time.time() - start_time) * 1000)
-
-                return {
-                    "success": True,
-                    "pages": 1,
-                    "font_size_used": current_font,
-                    "output_path": str(output_pdf_path),
-                    "iterations": iterations,
-                    "compilation_time_ms": elapsed_ms
-                }
-
-            elif pages > 1:
-                # Too much content, try smaller font
-                current_font -= FONT_STEP
-                current_font = round(current_font, 1)  # Avoid floating point issues
-            else:
+                raise FitError("Failed to read output PDF")
+            if pages == 0:
                 # Should not happen (0 pages)
-                return {
-                    "success": False,
-                    "error": f"Unexpected page count: {pages}"
-                }
+                raise FitError(f"Unexpected page count: {pages}")
+
+            page_counts[font_size] = pages
+            probe_pdfs[font_size] = temp_pdf
+            return pages
+
+        cancelled: List[float] = []
+
+        async def probe_async(font_size: float) -> "int":
+            """Like probe, but with its own main file so probes can overlap."""
+            import asyncio
+
+            key = compile_key(font_size)
+            temp_pdf = job_dir / f"output_{font_size}.pdf"
+            if not (key and cache.fetch_pdf(key, temp_pdf)):
+                main_typ_path = job_dir / f"main_{font_size}.typ"
+                with open(main_typ_path, 'w', encoding='utf-8') as f:
+                    f.write(create_typst_main_file(template_name, "data.typ", TEMPLATE_IMPORT, font_size))
+                try:
+                    success, error_msg = await compile_typst_async(main_typ_path, temp_pdf, root)
+                except asyncio.CancelledError:
+                    cancelled.append(font_size)
+                    raise
+                if not success:
+                    raise FitError(f"Compilation failed at font size {font_size}pt", error_msg)
+                if key:
+                    cache.put(key, {}, temp_pdf)
+
+            pages = get_pdf_page_count(temp_pdf)
+            if pages < 0:
+                raise FitError("Failed to read output PDF")
+            if pages == 0:
+                raise FitError(f"Unexpected page count: {pages}")
+
+            page_counts[font_size] = pages
+            probe_pdfs[font_size] = temp_pdf
+            return pages
+
+        measured: Dict[float, int] = {}
+        queries = 0
+        fallback = None
+
+        try:
+            if strategy == "measure":
+                queries += 1
+                measure_start = time.perf_counter()
+                success, outcome = measure_page_counts(
+                    job_dir, "data.typ", TEMPLATE_IMPORT, candidates, root
+                )
+                timings["measure_ms"] += (time.perf_counter() - measure_start) * 1000
+                if success:
+                    measured = outcome
+                    best_font = max(
+                        (size for size, pages in measured.items() if pages == 1),
+                        default=None
+                    )
+                    if best_font is not None and probe(best_font) != 1:
+                        fallback = f"Measured fit at {best_font}pt did not compile to one page"
+                        best_font = bisect_fit(candidates, probe)
+                else:
+                    fallback = str(outcome).strip()
+                    best_font = bisect_fit(candidates, probe)
+            elif strategy == "linear":
+                best_font = linear_fit(candidates, probe)
+            elif strategy == "parallel":
+                import asyncio
+
+                compile_start = time.perf_counter()
+                best_font = asyncio.run(parallel_fit(candidates, probe_async, probe_jobs))
+                # Wall time: the probes overlap
+                timings["compile_ms"] += (time.perf_counter() - compile_start) * 1000
+            else:
+                best_font = bisect_fit(candidates, probe)
+        except FitError as e:
+            result = {"success": False, "error": e.message}
+            if e.details:
+                result["details"] = e.details
+            return result
 
-        # If we get here, couldn't fit even at minimum font
         elapsed_ms = int((time.time() - start_time) * 1000)
+        search_info = {
+            "strategy": strategy,
+            "probes": len(page_counts) + queries,
+            "iterations": len(page_counts) + queries,
+        }
+        if fallback:
+            search_info["fallback"] = fallback
+        if strategy == "parallel":
+            search_info["probe_jobs"] = probe_jobs
+            search_info["cancelled"] = len(cancelled)
+        search_info["backend"] = backend if strategy != "parallel" else "oneshot"
+        if watcher is not None and watcher.failures:
+            search_info["backend_fallbacks"] = watcher.failures
+        search_info.update({name: round(ms, 1) for name, ms in timings.items()})
+
+        if fit_key:
+            final_pages = 1 if best_font is not None else \
+                page_counts.get(candidates[0], measured.get(candidates[0]))
+            cache.put(fit_key, {"font_size_used": best_font, "pages": final_pages})
+        search_info["cache"] = cache.stats()
+
+        if best_font is not None:
+            # Success! Move the probe PDF into place (atomic; the job dir is discarded)
+            publish_file(probe_pdfs[best_font], output_pdf_path, move=True)
 
+            return {
+                "success": True,
+                "pages": 1,
+                "font_size_used": best_font,
+                "output_path": str(output_pdf_path),
+                **search_info,
+                "compilation_time_ms": elapsed_ms
+            }
+
+        # If we get here, couldn't fit even at minimum font
         # Estimate how much content to remove
-        final_pages = get_pdf_page_count(temp_pdf)
+        final_pages = page_counts.get(candidates[0], measured.get(candidates[0]))
         overflow_ratio = (final_pages - 1.0) / 1.0
         bullets_to_remove = max(2, int(overflow_ratio * 10))
 
@@ -250,7 +785,7 @@ def auto_fit_compile(
             "status": "overflow",
             "pages": final_pages,
             "min_font_reached": MIN_FONT_SIZE,
-            "iterations": iterations,
+            **search_info,
             "compilation_time_ms": elapsed_ms,
             "recommendation": f"Content still overflows at minimum font size ({MIN_FONT_SIZE}pt). "
                             f"Please reduce content by approximately {bullets_to_remove}-{bullets_to_remove + 1} bullet points."
@@ -259,18 +794,29 @@ def auto_fit_compile(
 
 def main():
     """CLI entry point."""
-    if len(sys.argv) != 4:
-        print("Usage: compile.py <content.json> <template-name> <output.pdf>")
-        print("\nExample:")
-        print("  compile.py resume_content.json basic-resume final_resume.pdf")
-        print("\nAvailable templates:")
-        print("  - basic-resume")
-        print("  - modern-resume")
-        sys.exit(1)
-
-    content_json_path = Path(sys.argv[1])
-    template_name = sys.argv[2]
-    output_pdf_path = Path(sys.argv[3])
+    parser = argparse.ArgumentParser(
+        description="Compile resume JSON to a single-page PDF",
+        epilog="Example: compile.py resume_content.json basic-resume final_resume.pdf"
+    )
+    parser.add_argument("content", help="Resume content JSON")
+    parser.add_argument("template", help="Template name (see list_templates.py)")
+    parser.add_argument("output", help="Output PDF path")
+    parser.add_argument("--strategy", choices=FIT_STRATEGIES, default=DEFAULT_FIT_STRATEGY,
+                        help="Font size search strategy (default: %(default)s)")
+    parser.add_argument("--font-step", type=float, default=FONT_STEP,
+                        help="Font size granularity in pt (default: %(default)s)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Always run Typst; do not read or write the compile cache")
+    parser.add_argument("--backend", choices=BACKENDS, default=DEFAULT_BACKEND,
+                        help="oneshot: fresh typst per compile; watch: reuse a typst watch process")
+    parser.add_argument("--probe-jobs", type=int, default=PROBE_JOBS,
+                        help="Concurrent compiles for --strategy parallel (default: CPU count)")
+
+    args = parser.parse_args()
+
+    content_json_path = Path(args.content)
+    template_name = args.template
+    output_pdf_path = Path(args.output)
 
     if not content_json_path.exists():
         print(f"Error: Content file not found: {content_json_path}", file=sys.stderr)
@@ -290,7 +836,13 @@ def main():
     print()
 
     # Compile with auto-fit
-    result = auto_fit_compile(content_json_path, template_name, output_pdf_path)
+    result = auto_fit_compile(
+        content_json_path, template_name, output_pdf_path,
+        strategy=args.strategy, font_step=args.font_step,
+        cache=CompileCache(enabled=not args.no_cache),
+        backend=args.backend,
+        probe_jobs=args.probe_jobs
+    )
 
     # Output result
     print(json.dumps(result, indent=2))
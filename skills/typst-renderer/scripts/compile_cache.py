@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+"""
+Content-Addressed Compile Cache for Rescume v2.0
+
+Stores compiled PDFs (and fitted font sizes) on disk keyed by a hash of
+everything that determines the output: the generated data.typ, the
+template directory's files, the font size and the Typst version. Entries are
+evicted least-recently-used once the cache exceeds its size limit.
+
+Usage:
+    compile_cache.py [--stats | --clear]
+"""
+
+import json
+import os
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+
+# Configuration
+CACHE_DIR = Path(os.environ.get(
+    "RESCUME_CACHE_DIR", Path.home() / ".cache" / "rescume" / "typst"
+))
+CACHE_MAX_BYTES = int(os.environ.get("RESCUME_CACHE_MAX_MB", "256")) * 1024 * 1024
+# Full rescans of the cache directory between size-triggered evictions, so
+# entries written by other processes are eventually counted too
+RESCAN_EVERY_PUTS = 64
+# Eviction frees down to this fraction of the limit, so a full cache isn't
+# rescanned on every put
+EVICT_TO_FRACTION = 0.9
+
+
+def typst_version(typst_cli: Path, cache_dir: Path = CACHE_DIR) -> str:
+    """
+    Return the `typst --version` string for typst_cli.
+
+    The answer is memoized on disk against the binary's size and mtime so
+    cache lookups never have to start Typst.
+    """
+    try:
+        stat = typst_cli.stat()
+    except OSError:
+        return "unknown"
+
+    fingerprint = f"{typst_cli}:{stat.st_size}:{stat.st_mtime_ns}"
+    memo_path = cache_dir / "typst_version.json"
+
+    try:
+        with open(memo_path, 'r', encoding='utf-8') as f:
+            memo = json.load(f)
+        if memo.get("fingerprint") == fingerprint:
+            return memo["version"]
+    except (OSError, ValueError, KeyError):
+        pass
+
+    try:
+        result = subprocess.run(
+            [str(typst_cli), "--version"], capture_output=True, text=True, timeout=10
+        )
+        version = result.stdout.strip() or "unknown"
+    except Exception:
+        return "unknown"
+
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        with open(memo_path, 'w', encoding='utf-8') as f:
+            json.dump({"fingerprint": fingerprint, "version": version}, f)
+    except OSError:
+        pass
+
+    return version
+
+
+class CompileCache:
+    """On-disk LRU cache of compiled PDFs and fit results."""
+
+    def __init__(self, cache_dir: Path = CACHE_DIR, max_bytes: int = CACHE_MAX_BYTES,
+                 enabled: bool = True):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+        # Bytes on disk as of the last scan plus what this process wrote since
+        self.estimated_bytes: Optional[int] = None
+        self.puts_since_scan = 0
+
+    @staticmethod
+    def make_key(*parts: Any) -> str:
+        """Hash the given parts (str, bytes or JSON-serializable) into a cache key."""
+        import hashlib  # deferred: only needed when the cache is enabled
+
+        digest = hashlib.sha256()
+        for part in parts:
+            if isinstance(part, bytes):
+                data = part
+            elif isinstance(part, str):
+                data = part.encode('utf-8')
+            else:
+                data = json.dumps(part, sort_keys=True).encode('utf-8')
+            digest.update(len(data).to_bytes(8, 'big'))
+            digest.update(data)
+        return digest.hexdigest()
+
+    def _paths(self, key: str):
+        entry_dir = self.cache_dir / key[:2]
+        return entry_dir / f"{key}.json", entry_dir / f"{key}.pdf"
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up an entry and count the hit or miss.
+
+        Returns the stored metadata, with "pdf_path" set if a PDF was stored.
+        """
+        if not self.enabled:
+            return None
+
+        meta_path, pdf_path = self._paths(key)
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+            if meta.get("has_pdf"):
+                if not pdf_path.exists():
+                    raise FileNotFoundError(pdf_path)
+                os.utime(pdf_path)
+                meta["pdf_path"] = str(pdf_path)
+            os.utime(meta_path)
+        except (OSError, ValueError):
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return meta
+
+    def fetch_pdf(self, key: str, dest: Path, copy: Callable = shutil.copyfile) -> bool:
+        """
+        Copy the cached PDF for key to dest with copy(src, dest).
+
+        Returns False on a miss, including a PDF that another process evicted
+        between the lookup and the copy.
+        """
+        entry = self.get(key)
+        if entry is None or "pdf_path" not in entry:
+            return False
+        try:
+            copy(entry["pdf_path"], dest)
+        except FileNotFoundError:
+            self.hits -= 1
+            self.misses += 1
+            return False
+        return True
+
+    def put(self, key: str, meta: Dict[str, Any], pdf_path: Optional[Path] = None) -> None:
+        """
+        Store metadata (and optionally a PDF) under key.
+
+        The cache directory is only scanned for eviction when the running size
+        estimate passes max_bytes, or every RESCAN_EVERY_PUTS puts.
+        """
+        if not self.enabled:
+            return
+
+        meta_path, cached_pdf = self._paths(key)
+        written = 0
+        try:
+            meta_path.parent.mkdir(parents=True, exist_ok=True)
+            if pdf_path is not None:
+                tmp_pdf = cached_pdf.with_suffix(f".pdf.{os.getpid()}.tmp")
+                shutil.copyfile(pdf_path, tmp_pdf)
+                written += tmp_pdf.stat().st_size
+                os.replace(tmp_pdf, cached_pdf)
+            stored = json.dumps(dict(meta, has_pdf=pdf_path is not None))
+            tmp_meta = meta_path.with_suffix(f".json.{os.getpid()}.tmp")
+            with open(tmp_meta, 'w', encoding='utf-8') as f:
+                f.write(stored)
+            written += len(stored)
+            os.replace(tmp_meta, meta_path)
+        except OSError as e:
+            print(f"Warning: could not write compile cache: {e}", file=sys.stderr)
+            return
+
+        self.puts_since_scan += 1
+        if self.estimated_bytes is None or self.puts_since_scan >= RESCAN_EVERY_PUTS:
+            self.evict()
+            return
+        self.estimated_bytes += written
+        if self.estimated_bytes > self.max_bytes:
+            self.evict()
+
+    def evict(self) -> int:
+        """
+        If over max_bytes, delete least-recently-used entries until under
+        EVICT_TO_FRACTION of it. Returns entries removed.
+        """
+        self.puts_since_scan = 0
+        if not self.cache_dir.exists():
+            self.estimated_bytes = 0
+            return 0
+
+        entries: Dict[str, Dict[str, Any]] = {}
+        for path in self.cache_dir.glob("*/*"):
+            if path.suffix not in (".json", ".pdf"):
+                continue
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entry = entries.setdefault(path.stem, {"size": 0, "atime": 0.0, "paths": []})
+            entry["size"] += stat.st_size
+            entry["atime"] = max(entry["atime"], stat.st_mtime)
+            entry["paths"].append(path)
+
+        total = sum(e["size"] for e in entries.values())
+        target = self.max_bytes * EVICT_TO_FRACTION if total > self.max_bytes else total
+        removed = 0
+        for entry in sorted(entries.values(), key=lambda e: e["atime"]):
+            if total <= target:
+                break
+            for path in entry["paths"]:
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+            total -= entry["size"]
+            removed += 1
+
+        self.estimated_bytes = total
+        return removed
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters for this process."""
+        return {"enabled": self.enabled, "hits": self.hits, "misses": self.misses}
+
+    def usage(self) -> Dict[str, Any]:
+        """Return on-disk size and entry count."""
+        files = [p for p in self.cache_dir.glob("*/*") if p.suffix in (".json", ".pdf")]
+        return {
+            "cache_dir": str(self.cache_dir),
+            "entries": len({p.stem for p in files}),
+            "size_kb": round(sum(p.stat().st_size for p in files) / 1024, 2),
+            "max_size_kb": round(self.max_bytes / 1024, 2),
+        }
+
+    def clear(self) -> None:
+        """Remove every cached entry."""
+        if self.cache_dir.exists():
+            shutil.rmtree(self.cache_dir)
+
+
+def main():
+    """CLI entry point."""
+    cache = CompileCache()
+
+    if "--clear" in sys.argv:
+        cache.clear()
+        print(f"✓ Cleared compile cache at {cache.cache_dir}")
+        sys.exit(0)
+
+    if "--stats" in sys.argv or len(sys.argv) == 1:
+        print(json.dumps(cache.usage(), indent=2))
+        sys.exit(0)
+
+    print("Usage: compile_cache.py [--stats | --clear]")
+    sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -4,12 +4,38 @@ JSON to Typst Data Converter for Rescume v2.0
 
 Converts structured JSON resume content into Typst variable declarations.
 Handles string escaping, nested structures, and type conversions.
+
+With --split, each top-level section goes to its own module
+(data_header.typ, data_experience.typ, ...) imported by a thin data.typ,
+and only modules whose content changed are rewritten, so Typst's
+incremental compiler re-lays out just the edited sections.
 """
 
+import io
 import json
+import os
 import sys
 from pathlib import Path
-from typing import Any, Dict, List, Union
+from typing import Any, Dict, List, TextIO, Tuple
+
+
+_KEY_CHARS = str.maketrans("- ", "__")
+
+FILE_HEADER = """// Resume data generated by Rescume v2.0
+// Auto-generated from JSON - do not edit manually
+
+"""
+HEADER = FILE_HEADER + "#let resume_data = "
+
+# Buffered pieces are written to the output in chunks of about this many
+FLUSH_PIECES = 8192
+
+# Top-level keys written to their own modules by convert_json_to_typst_modules
+SECTIONS = ("header", "summary", "education", "experience", "projects", "skills")
+SECTION_FILE = "data_{}.typ"
+
+# path → (sha256, mtime_ns, size) of module files written by this process
+_WRITTEN: Dict[str, Tuple[str, int, int]] = {}
 
 
 def escape_typst_string(s: str) -> str:
@@ -24,6 +50,11 @@ def escape_typst_string(s: str) -> str:
     if not isinstance(s, str):
         return str(s)
 
+    # Most strings need no escaping; the membership tests are much cheaper
+    # than the replaces (and than str.translate, which is slow for 1→2 char maps)
+    if '\\' not in s and '"' not in s and '#' not in s:
+        return s
+
     # Escape backslashes first
     s = s.replace('\\', '\\\\')
     # Escape quotes
@@ -34,9 +65,28 @@ def escape_typst_string(s: str) -> str:
     return s
 
 
-def json_value_to_typst(value: Any, indent_level: int = 0) -> str:
+def scalar_to_typst(value: Any) -> str:
+    """Typst literal for a non-container JSON value (or an empty container)."""
+    if value is None:
+        return "none"
+    if value is True:
+        return "true"
+    if value is False:
+        return "false"
+    if isinstance(value, str):
+        return f'"{escape_typst_string(value)}"'
+    if isinstance(value, (int, float)):
+        return str(value)
+    if isinstance(value, (list, dict)):
+        return "()"
+    # Fallback: convert to string
+    return f'"{escape_typst_string(str(value))}"'
+
+
+def write_typst_value(value: Any, out: TextIO, indent_level: int = 0,
+                      compact: bool = False) -> None:
     """
-    Convert a JSON value to Typst syntax.
+    Write a JSON value as Typst syntax to out, in a single pass.
 
     Supports:
     - Strings → "string"
@@ -45,90 +95,210 @@ def json_value_to_typst(value: Any, indent_level: int = 0) -> str:
     - null → none
     - Arrays → (item1, item2, )
     - Objects → (key1: value1, key2: value2, )
-    """
-    indent = "  " * indent_level
 
-    if value is None:
-        return "none"
+    Containers are walked with an explicit stack, so deeply nested input
+    can't hit the recursion limit, and output goes to out in chunks rather
+    than being assembled in memory. compact=True drops newlines and
+    indentation. Keys have "-" and " " replaced by "_" so they are valid
+    identifiers.
+    """
+    if not isinstance(value, (list, dict)) or not value:
+        out.write(scalar_to_typst(value))
+        return
+
+    write = out.write
+    buf: List[str] = []
+    append = buf.append
+    key_text: Dict[Any, str] = {}
+    key_suffix = ":" if compact else ": "
+    opener = "(" if compact else "(\n"
+    indents = ["  " * n for n in range(indent_level + 2)]
+
+    # Each frame: [iterator, is_dict, indent_level]; the trailing comma on
+    # close keeps single-element arrays arrays
+    append(opener)
+    stack = [[iter(value.items()) if isinstance(value, dict) else iter(value),
+              isinstance(value, dict), indent_level]]
+    fresh = True
+
+    while stack:
+        frame = stack[-1]
+        is_dict = frame[1]
+        level = frame[2]
+        if len(indents) < level + 3:
+            indents.append("  " * len(indents))
+        if compact:
+            lead, between, closer = "", ",", ",)"
+        else:
+            lead = indents[level + 1]
+            between = ",\n" + lead
+            closer = ",\n" + indents[level] + ")"
+
+        for child in frame[0]:
+            if fresh:
+                append(lead)
+                fresh = False
+            else:
+                append(between)
+            if is_dict:
+                key, child = child
+                text = key_text.get(key)
+                if text is None:
+                    text = key_text[key] = str(key).translate(_KEY_CHARS) + key_suffix
+                append(text)
+
+            if type(child) is str:
+                if '\\' in child or '"' in child or '#' in child:
+                    child = escape_typst_string(child)
+                append('"' + child + '"')
+            elif isinstance(child, (list, dict)) and child:
+                append(opener)
+                child_is_dict = isinstance(child, dict)
+                stack.append([iter(child.items()) if child_is_dict else iter(child),
+                              child_is_dict, level + 1])
+                fresh = True
+                break
+            else:
+                append(scalar_to_typst(child))
+        else:
+            stack.pop()
+            append(closer)
 
-    elif isinstance(value, bool):
-        return "true" if value else "false"
+        if len(buf) >= FLUSH_PIECES:
+            write("".join(buf))
+            buf.clear()
 
-    elif isinstance(value, (int, float)):
-        return str(value)
+    write("".join(buf))
 
-    elif isinstance(value, str):
-        return f'"{escape_typst_string(value)}"'
 
-    elif isinstance(value, list):
-        if not value:
-            return "()"
-
-        # Arrays in Typst: (item1, item2, item3, )
-        # Note the trailing comma for single-element arrays
-        items = []
-        for item in value:
-            typst_item = json_value_to_typst(item, indent_level + 1)
-            items.append(f"{indent}  {typst_item}")
-
-        items_str = ",\n".join(items)
-        return f"(\n{items_str},\n{indent})"
-
-    elif isinstance(value, dict):
-        if not value:
-            return "()"
-
-        # Objects in Typst: (key1: value1, key2: value2)
-        pairs = []
-        for key, val in value.items():
-            # Keys in Typst don't need quotes if they're valid identifiers
-            # For safety, we'll use identifiers without special chars
-            safe_key = key.replace("-", "_").replace(" ", "_")
-            typst_val = json_value_to_typst(val, indent_level + 1)
-
-            # Format based on complexity
-            if "\n" in typst_val:
-                # Multi-line value
-                pairs.append(f"{indent}  {safe_key}: {typst_val}")
-            else:
-                # Single-line value
-                pairs.append(f"{indent}  {safe_key}: {typst_val}")
+def json_value_to_typst(value: Any, indent_level: int = 0, compact: bool = False) -> str:
+    """Convert a JSON value to Typst syntax (see write_typst_value)."""
+    out = io.StringIO()
+    write_typst_value(value, out, indent_level, compact)
+    return out.getvalue()
 
-        pairs_str = ",\n".join(pairs)
-        return f"(\n{pairs_str},\n{indent})"
 
-    else:
-        # Fallback: convert to string
-        return f'"{escape_typst_string(str(value))}"'
+def write_typst_data(json_data: Dict[str, Any], out: TextIO, compact: bool = False) -> None:
+    """Stream a complete Typst data file (see convert_json_to_typst) to out."""
+    out.write(HEADER)
+    write_typst_value(json_data, out, 0, compact)
+    out.write("\n")
 
 
-def convert_json_to_typst(json_data: Dict[str, Any]) -> str:
+def convert_json_to_typst(json_data: Dict[str, Any], compact: bool = False) -> str:
     """
     Convert complete JSON resume data to Typst data file.
 
     Returns a Typst file content with #let statements defining the data structure.
     """
-    # Convert the JSON to Typst dictionary format
-    typst_data = json_value_to_typst(json_data, indent_level=0)
+    out = io.StringIO()
+    write_typst_data(json_data, out, compact)
+    return out.getvalue()
 
-    # Create the complete Typst file
-    typst_content = f"""// Resume data generated by Rescume v2.0
-// Auto-generated from JSON - do not edit manually
 
-#let resume_data = {typst_data}
-"""
+def convert_json_to_typst_modules(json_data: Dict[str, Any], data_typ_filename: str = "data.typ",
+                                  compact: bool = False) -> Dict[str, str]:
+    """
+    Convert resume data to one Typst module per section plus an aggregator.
+
+    Each present key in SECTIONS becomes data_<section>.typ defining
+    `#let <section> = ...`; data_typ_filename imports them and defines
+    resume_data with the same value convert_json_to_typst would (other
+    keys are inlined). Returns {filename: content}, aggregator last.
+    """
+    if not isinstance(json_data, dict):
+        return {data_typ_filename: convert_json_to_typst(json_data, compact)}
+
+    modules: Dict[str, str] = {}
+    imports = []
+    fields = []
+    for key, value in json_data.items():
+        name = str(key).translate(_KEY_CHARS)
+        if key in SECTIONS:
+            filename = SECTION_FILE.format(key)
+            out = io.StringIO()
+            out.write(f"{FILE_HEADER}#let {key} = ")
+            write_typst_value(value, out, 0, compact)
+            out.write("\n")
+            modules[filename] = out.getvalue()
+            imports.append(f'#import "{filename}": {key}\n')
+            fields.append(f"{name}:{key}" if compact else f"  {name}: {key}")
+        else:
+            fields.append(f"{name}:{json_value_to_typst(value, 0, True)}" if compact
+                          else f"  {name}: {json_value_to_typst(value, 1)}")
+
+    if not fields:
+        body = "()"
+    elif compact:
+        body = "(" + ",".join(fields) + ",)"
+    else:
+        body = "(\n" + ",\n".join(fields) + ",\n)"
+    imports = "".join(imports) + "\n" if imports else ""
+    modules[data_typ_filename] = f"{FILE_HEADER}{imports}#let resume_data = {body}\n"
+    return modules
 
-    return typst_content
+
+def write_typst_modules(modules: Dict[str, str], out_dir: Path) -> List[str]:
+    """
+    Write modules into out_dir, skipping files whose content hash is unchanged.
+
+    Section modules for sections no longer present are removed. Files are
+    replaced atomically, so a `typst watch` never reads a partial module.
+    Returns the filenames actually written.
+    """
+    import hashlib  # deferred: the plain converter never hashes
+
+    out_dir = Path(out_dir)
+    written = []
+    for filename, content in modules.items():
+        path = out_dir / filename
+        data = content.encode('utf-8')
+        digest = hashlib.sha256(data).hexdigest()
+        try:
+            stat = path.stat()
+            known = _WRITTEN.get(str(path))
+            if known and known[1:] == (stat.st_mtime_ns, stat.st_size):
+                current = known[0]
+            else:
+                current = hashlib.sha256(path.read_bytes()).hexdigest()
+        except OSError:
+            current = None
+        if current == digest:
+            continue
+
+        tmp_path = path.with_name(f".{filename}.{os.getpid()}.tmp")
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+        stat = path.stat()
+        _WRITTEN[str(path)] = (digest, stat.st_mtime_ns, stat.st_size)
+        written.append(filename)
+
+    for section in SECTIONS:
+        filename = SECTION_FILE.format(section)
+        if filename not in modules:
+            try:
+                (out_dir / filename).unlink()
+            except OSError:
+                pass
+    return written
 
 
 def main():
     """CLI entry point."""
-    if len(sys.argv) < 2:
-        print("Usage: json_to_typst.py <input.json> [output.typ]")
+    args = [a for a in sys.argv[1:] if a not in ("--compact", "--split")]
+    compact = "--compact" in sys.argv[1:]
+    split = "--split" in sys.argv[1:]
+
+    if len(args) < 1 or (split and len(args) < 2):
+        print("Usage: json_to_typst.py <input.json> [output.typ] [--compact] [--split]")
         print("  If output.typ is omitted, prints to stdout")
+        print("  --compact writes everything on one line, without indentation")
+        print("  --split writes one data_<section>.typ per section next to output.typ,")
+        print("          rewriting only sections that changed")
         sys.exit(1)
 
-    input_path = Path(sys.argv[1])
+    input_path = Path(args[0])
 
     if not input_path.exists():
         print(f"Error: Input file not found: {input_path}", file=sys.stderr)
@@ -139,17 +309,21 @@ def main():
         with open(input_path, 'r', encoding='utf-8') as f:
             json_data = json.load(f)
 
-        # Convert to Typst
-        typst_content = convert_json_to_typst(json_data)
-
-        # Output
-        if len(sys.argv) >= 3:
-            output_path = Path(sys.argv[2])
+        # Convert to Typst, streaming straight to the output
+        if split:
+            output_path = Path(args[1])
+            modules = convert_json_to_typst_modules(json_data, output_path.name, compact)
+            written = write_typst_modules(modules, output_path.parent)
+            print(f"✓ Converted {input_path} → {output_path} "
+                  f"({len(written)} of {len(modules)} module(s) rewritten)")
+        elif len(args) >= 2:
+            output_path = Path(args[1])
             with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(typst_content)
+                write_typst_data(json_data, f, compact)
             print(f"✓ Converted {input_path} → {output_path}")
         else:
-            print(typst_content)
+            write_typst_data(json_data, sys.stdout, compact)
+            print()
 
         sys.exit(0)
 
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Fast PDF Page Counter for Rescume v2.0
+
+Reads the page count straight from the PDF structure: trailer /Root →
+catalog /Pages → page tree /Count, using a memory-mapped read instead of
+parsing the whole document. Returns None when the structure can't be
+followed (e.g. objects inside compressed object streams) so callers can
+fall back to pdfplumber.
+
+Usage:
+    pdf_pages.py <file.pdf> [...]
+"""
+
+import mmap
+import re
+import sys
+from pathlib import Path
+from typing import Optional
+
+
+ROOT_RE = re.compile(rb"/Root\s+(\d+)\s+(\d+)\s+R")
+PAGES_RE = re.compile(rb"/Pages\s+(\d+)\s+(\d+)\s+R")
+COUNT_RE = re.compile(rb"/Count\s+(\d+)")
+
+
+def _find_object(data, obj_num: bytes, gen: bytes) -> int:
+    """
+    Return the offset just past "N G obj" for the newest copy of an object, or -1.
+
+    Incremental updates append newer versions, so the last occurrence wins.
+    Single-space headers (what Typst writes) are found with rfind; anything
+    else falls back to a regex scan.
+    """
+    needle = obj_num + b" " + gen + b" obj"
+    end = len(data)
+    while True:
+        pos = data.rfind(needle, 0, end)
+        if pos < 0:
+            break
+        if pos == 0 or data[pos - 1:pos] in b" \t\r\n":
+            return pos + len(needle)
+        end = pos
+
+    header = re.compile(rb"(?<![0-9])" + obj_num + rb"\s+" + gen + rb"\s+obj\b")
+    last = None
+    for last in header.finditer(data):
+        pass
+    return last.end() if last else -1
+
+
+def _object_body(data, obj_num: bytes, gen: bytes) -> Optional[bytes]:
+    """Return the bytes between "N G obj" and "endobj" for an object."""
+    start = _find_object(data, obj_num, gen)
+    if start < 0:
+        return None
+
+    end = data.find(b"endobj", start)
+    if end < 0:
+        return None
+    return data[start:end]
+
+
+def fast_page_count(pdf_path: Path) -> Optional[int]:
+    """
+    Return the page count of pdf_path, or None if it can't be read cheaply.
+    """
+    try:
+        with open(pdf_path, 'rb') as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                if data[:5] != b"%PDF-":
+                    return None
+
+                # The trailer (or xref stream dict) at the end names the catalog
+                root = None
+                for root in ROOT_RE.finditer(data, max(0, len(data) - 4096)):
+                    pass
+                if root is None:
+                    return None
+
+                catalog = _object_body(data, root.group(1), root.group(2))
+                if catalog is None:
+                    return None
+
+                pages_ref = PAGES_RE.search(catalog)
+                if pages_ref is None:
+                    return None
+
+                pages = _object_body(data, pages_ref.group(1), pages_ref.group(2))
+                if pages is None:
+                    return None
+
+                count = COUNT_RE.search(pages)
+                return int(count.group(1)) if count else None
+
+    except (OSError, ValueError):
+        return None
+
+
+def main():
+    """CLI entry point."""
+    if len(sys.argv) < 2:
+        print("Usage: pdf_pages.py <file.pdf> [...]")
+        sys.exit(1)
+
+    status = 0
+    for arg in sys.argv[1:]:
+        pages = fast_page_count(Path(arg))
+        if pages is None:
+            print(f"{arg}: unreadable (use pdfplumber)", file=sys.stderr)
+            status = 1
+        else:
+            print(f"{arg}: {pages}")
+
+    sys.exit(status)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,336 @@
+#!/usr/bin/env python3
+"""
+Offline Typst Packages and Fonts for Rescume v2.0
+
+`warm` vendors every package the templates import (plus the packages
+those import) into <templates>/packages/ and copies the fonts they name
+into <templates>/fonts/. Once those directories exist, compile.py runs
+Typst with --package-path, --font-path and --ignore-system-fonts: the
+first compile on a fresh machine doesn't block on a package download,
+and no compile rescans the system fonts.
+
+Packages are copied from Typst's own package cache when present and
+downloaded by Typst otherwise. Typst's embedded fonts (New Computer
+Modern, Libertinus Serif, DejaVu Sans Mono) are always available and are
+never copied.
+
+Usage:
+    typst_assets.py warm [--templates-dir DIR] [--font-dir DIR]...
+    typst_assets.py status [--templates-dir DIR]
+"""
+
+import argparse
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+
+# Configuration
+TYPST_CLI = Path.home() / ".local" / "bin" / "typst"
+TEMPLATES_DIR = Path.home() / ".claude" / "skills" / "rescume" / "templates"
+PACKAGES_SUBDIR = "packages"
+FONTS_SUBDIR = "fonts"
+
+PACKAGE_RE = re.compile(r'"@([a-z0-9-]+)/([a-z0-9-]+):(\d+\.\d+\.\d+)"')
+FONT_SETTING_RE = re.compile(r'\bfont:\s*(\([^)]*\)|"[^"]*")')
+QUOTED_RE = re.compile(r'"([^"]+)"')
+FONT_SUFFIXES = (".ttf", ".otf", ".ttc", ".otc")
+EMBEDDED_FONTS = {"new computer modern", "new computer modern math", "libertinus serif",
+                  "dejavu sans mono"}
+
+PackageSpec = Tuple[str, str, str]
+
+
+def asset_dirs(templates_dir: Path = TEMPLATES_DIR) -> Tuple[Path, Path]:
+    """Return (packages_dir, fonts_dir) for a templates directory."""
+    return templates_dir / PACKAGES_SUBDIR, templates_dir / FONTS_SUBDIR
+
+
+def typst_asset_args(templates_dir: Path = TEMPLATES_DIR) -> List[str]:
+    """Extra `typst compile/query/watch` arguments once `warm` has run."""
+    packages_dir, fonts_dir = asset_dirs(templates_dir)
+    args = []
+    if packages_dir.is_dir():
+        args += ["--package-path", str(packages_dir)]
+    if fonts_dir.is_dir():
+        args += ["--font-path", str(fonts_dir), "--ignore-system-fonts"]
+    return args
+
+
+def typst_package_caches() -> List[Path]:
+    """Where Typst itself keeps downloaded and local packages on this machine."""
+    home = Path.home()
+    roots = []
+    if os.environ.get("TYPST_PACKAGE_CACHE_PATH"):
+        roots.append(Path(os.environ["TYPST_PACKAGE_CACHE_PATH"]))
+    if os.environ.get("TYPST_PACKAGE_PATH"):
+        roots.append(Path(os.environ["TYPST_PACKAGE_PATH"]))
+    roots += [
+        Path(os.environ.get("XDG_CACHE_HOME", home / ".cache")) / "typst" / "packages",
+        Path(os.environ.get("XDG_DATA_HOME", home / ".local" / "share")) / "typst" / "packages",
+        home / "Library" / "Caches" / "typst" / "packages",
+        home / "Library" / "Application Support" / "typst" / "packages",
+    ]
+    if os.environ.get("LOCALAPPDATA"):
+        roots.append(Path(os.environ["LOCALAPPDATA"]) / "typst" / "packages")
+    return [root for root in roots if root.is_dir()]
+
+
+def system_font_dirs() -> List[Path]:
+    home = Path.home()
+    dirs = [
+        Path("/usr/share/fonts"), Path("/usr/local/share/fonts"),
+        home / ".local" / "share" / "fonts", home / ".fonts",
+        Path("/Library/Fonts"), Path("/System/Library/Fonts"), home / "Library" / "Fonts",
+    ]
+    if os.environ.get("WINDIR"):
+        dirs.append(Path(os.environ["WINDIR"]) / "Fonts")
+    return [d for d in dirs if d.is_dir()]
+
+
+def template_files(templates_dir: Path) -> List[Path]:
+    """The template.typ of every template (the only file compile.py uses)."""
+    return sorted(templates_dir.glob("*/template.typ"))
+
+
+def package_specs(files: Iterable[Path]) -> Set[PackageSpec]:
+    """Every "@namespace/name:version" referenced by the given .typ files."""
+    specs = set()
+    for path in files:
+        specs.update(PACKAGE_RE.findall(path.read_text(encoding='utf-8', errors='replace')))
+    return specs
+
+
+def font_choices(files: Iterable[Path]) -> List[List[str]]:
+    """Each `font:` setting as its fallback list, e.g. ["Source Sans Pro", "Roboto"]."""
+    choices = []
+    for path in files:
+        text = path.read_text(encoding='utf-8', errors='replace')
+        for setting in FONT_SETTING_RE.findall(text):
+            names = QUOTED_RE.findall(setting)
+            if names and names not in choices:
+                choices.append(names)
+    return choices
+
+
+def package_dir(root: Path, spec: PackageSpec) -> Path:
+    namespace, name, version = spec
+    return root / namespace / name / version
+
+
+def vendor_packages(specs: Set[PackageSpec], packages_dir: Path,
+                    typst_cli: Path = TYPST_CLI) -> Dict[str, List[str]]:
+    """
+    Make every spec (and everything it imports) present under packages_dir.
+
+    Returns {"present", "copied", "downloaded", "missing"} lists of specs.
+    """
+    report: Dict[str, List[str]] = {"present": [], "copied": [], "downloaded": [], "missing": []}
+    caches = typst_package_caches()
+    pending = set(specs)
+    seen: Set[PackageSpec] = set()
+    to_download: Set[PackageSpec] = set()
+
+    while pending:
+        spec = pending.pop()
+        if spec in seen:
+            continue
+        seen.add(spec)
+        target = package_dir(packages_dir, spec)
+        label = "@{}/{}:{}".format(*spec)
+
+        if target.is_dir():
+            report["present"].append(label)
+        else:
+            source = next((package_dir(c, spec) for c in caches if package_dir(c, spec).is_dir()), None)
+            if source is None:
+                to_download.add(spec)
+                continue
+            shutil.copytree(source, target)
+            report["copied"].append(label)
+        pending |= package_specs(target.rglob("*.typ")) - seen
+
+    if to_download:
+        downloaded = download_packages(to_download, packages_dir, typst_cli)
+        for spec in sorted(to_download):
+            label = "@{}/{}:{}".format(*spec)
+            report["downloaded" if spec in downloaded else "missing"].append(label)
+        # Typst fetched their imports too; anything still absent is reported on the next run
+
+    return report
+
+
+def download_packages(specs: Set[PackageSpec], packages_dir: Path,
+                      typst_cli: Path = TYPST_CLI) -> Set[PackageSpec]:
+    """
+    Let Typst download specs (and their imports) straight into packages_dir.
+
+    Compiles a stub importing each package with packages_dir as the package
+    cache. Returns the specs that are present afterwards.
+    """
+    import tempfile  # deferred: compile.py imports this module for typst_asset_args
+
+    packages_dir.mkdir(parents=True, exist_ok=True)
+    with tempfile.TemporaryDirectory() as tmpdir:
+        stub = Path(tmpdir) / "warm.typ"
+        stub.write_text("".join('#import "@{}/{}:{}"\n'.format(*spec) for spec in sorted(specs)),
+                        encoding='utf-8')
+        try:
+            result = subprocess.run(
+                [str(typst_cli), "compile", "--package-cache-path", str(packages_dir),
+                 str(stub), str(Path(tmpdir) / "warm.pdf")],
+                capture_output=True, text=True, timeout=300
+            )
+            if result.returncode != 0:
+                print(f"Warning: typst could not fetch packages: {result.stderr.strip()}",
+                      file=sys.stderr)
+        except (OSError, subprocess.TimeoutExpired) as e:
+            print(f"Warning: typst could not fetch packages: {e}", file=sys.stderr)
+
+    return {spec for spec in specs if package_dir(packages_dir, spec).is_dir()}
+
+
+def normalize_family(name: str) -> str:
+    return re.sub(r"[^a-z0-9]", "", name.lower())
+
+
+def font_files_by_family(font_dirs: List[Path]) -> Dict[str, List[Path]]:
+    """
+    Map normalized family names to font files.
+
+    Uses fontconfig's fc-list when it is installed; otherwise falls back to
+    matching file names (e.g. SourceSansPro-Regular.otf) in font_dirs.
+    """
+    families: Dict[str, List[Path]] = {}
+    fc_list = shutil.which("fc-list")
+    if fc_list:
+        try:
+            result = subprocess.run([fc_list, "--format", "%{family}|%{file}\n"],
+                                    capture_output=True, text=True, timeout=30)
+            for line in result.stdout.splitlines():
+                family, _, file = line.rpartition("|")
+                for name in family.split(","):
+                    families.setdefault(normalize_family(name), []).append(Path(file))
+        except (OSError, subprocess.TimeoutExpired):
+            pass
+
+    for font_dir in font_dirs:
+        for path in font_dir.rglob("*"):
+            if path.suffix.lower() in FONT_SUFFIXES:
+                stem = normalize_family(path.stem.split("-")[0])
+                families.setdefault(stem, []).append(path)
+    return families
+
+
+def vendor_fonts(choices: List[List[str]], fonts_dir: Path,
+                 font_dirs: List[Path]) -> Dict[str, List[str]]:
+    """
+    Copy the first available family of each font setting into fonts_dir.
+
+    Nothing is copied (and fonts_dir is not created) while any setting has
+    no available family, since compiles would then lose system fonts they
+    still need.
+
+    Returns {"embedded", "present", "copied", "missing"} lists of families.
+    """
+    report: Dict[str, List[str]] = {"embedded": [], "present": [], "copied": [], "missing": []}
+    vendored = font_files_by_family([fonts_dir]) if fonts_dir.is_dir() else {}
+    available: Optional[Dict[str, List[Path]]] = None
+    to_copy: List[Path] = []
+
+    for names in choices:
+        for name in names:
+            key = normalize_family(name)
+            if name.lower() in EMBEDDED_FONTS:
+                bucket, files = "embedded", []
+            elif key in vendored:
+                bucket, files = "present", []
+            else:
+                if available is None:
+                    available = font_files_by_family(font_dirs)
+                files = available.get(key, [])
+                bucket = "copied" if files else None
+            if bucket is None:
+                continue
+            to_copy += files
+            vendored.setdefault(key, files)
+            if name not in report[bucket]:
+                report[bucket].append(name)
+            break
+        else:
+            report["missing"].append(" / ".join(names))
+
+    if not report["missing"]:
+        fonts_dir.mkdir(parents=True, exist_ok=True)
+        for path in to_copy:
+            shutil.copy2(path, fonts_dir / path.name)
+    return report
+
+
+def warm(templates_dir: Path = TEMPLATES_DIR, font_dirs: Optional[List[Path]] = None,
+         typst_cli: Path = TYPST_CLI) -> Dict[str, Dict[str, List[str]]]:
+    """Vendor the packages and fonts every template needs."""
+    packages_dir, fonts_dir = asset_dirs(templates_dir)
+    templates = template_files(templates_dir)
+
+    packages = vendor_packages(package_specs(templates), packages_dir, typst_cli)
+    packages_dir.mkdir(parents=True, exist_ok=True)
+
+    # Packages set fonts too (e.g. modern-cv's headings)
+    all_files = templates + list(packages_dir.rglob("*.typ"))
+    fonts = vendor_fonts(font_choices(all_files), fonts_dir,
+                         font_dirs if font_dirs is not None else system_font_dirs())
+    return {"packages": packages, "fonts": fonts}
+
+
+def status(templates_dir: Path = TEMPLATES_DIR) -> Dict[str, object]:
+    packages_dir, fonts_dir = asset_dirs(templates_dir)
+    specs = package_specs(template_files(templates_dir))
+    return {
+        "hermetic": packages_dir.is_dir() and fonts_dir.is_dir(),
+        "packages_dir": str(packages_dir),
+        "fonts_dir": str(fonts_dir),
+        "packages_missing": sorted("@{}/{}:{}".format(*s) for s in specs
+                                   if not package_dir(packages_dir, s).is_dir()),
+        "fonts": sorted(p.name for p in fonts_dir.iterdir()) if fonts_dir.is_dir() else [],
+        "typst_args": typst_asset_args(templates_dir),
+    }
+
+
+def main():
+    """CLI entry point."""
+    parser = argparse.ArgumentParser(description="Vendor Typst packages and fonts for offline compiles")
+    parser.add_argument("command", choices=["warm", "vendor", "status"],
+                        help="warm/vendor: populate packages and fonts; status: show what is vendored")
+    parser.add_argument("--templates-dir", type=Path, default=TEMPLATES_DIR,
+                        help="Templates directory (default: %(default)s)")
+    parser.add_argument("--font-dir", type=Path, action="append",
+                        help="Where to look for fonts (repeatable; default: system font directories)")
+
+    args = parser.parse_args()
+
+    if not args.templates_dir.is_dir():
+        print(f"Error: Templates directory not found: {args.templates_dir}", file=sys.stderr)
+        return 2
+
+    if args.command == "status":
+        print(json.dumps(status(args.templates_dir), indent=2))
+        return 0
+
+    report = warm(args.templates_dir, args.font_dir)
+    print(json.dumps(report, indent=2))
+    missing = report["packages"]["missing"] + report["fonts"]["missing"]
+    if missing:
+        print(f"\n✗ Not vendored: {', '.join(missing)}", file=sys.stderr)
+        return 1
+    print(f"\n✓ Templates can compile offline with: {' '.join(typst_asset_args(args.templates_dir))}")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""
+Persistent Typst Watch Backend for Rescume v2.0
+
+Keeps one long-lived `typst watch` process per working directory so
+repeated compiles (e.g. font-fit probes) reuse Typst's loaded fonts,
+parsed template and memoized layout instead of starting from scratch.
+
+The watcher owns its own input and output files (watch_main.typ and
+watch_output.pdf). Each compile atomically replaces watch_main.typ (with a
+trailing nonce comment, so the file always changes and Typst always
+recompiles), waits for the next "compiled ..." status line, and copies the
+output. A watcher that died is restarted on the next compile; at most
+MAX_STARTS processes are started in all (the first plus three restarts). Callers fall back to a one-shot `typst compile`
+whenever this returns False.
+"""
+
+import atexit
+import os
+import queue
+import re
+import shutil
+import subprocess
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+
+WATCH_MAIN = "watch_main.typ"
+WATCH_OUTPUT = "watch_output.pdf"
+WATCH_TIMEOUT = 30
+SETTLE_TIMEOUT = 5
+SETTLE_QUIET = 0.2
+MAX_STARTS = 4  # the first start plus up to three restarts
+STATUS_RE = re.compile(r"compiled (successfully|with warnings|with errors)")
+ANSI_RE = re.compile(r"\x1b\[[0-9;?]*[A-Za-z]")
+
+
+class TypstWatcher:
+    """A `typst watch` process bound to one working directory."""
+
+    def __init__(self, typst_cli: Path, workdir: Path, args: Optional[List[str]] = None):
+        self.typst_cli = typst_cli
+        self.args = list(args or [])
+        self.workdir = Path(workdir)
+        self.main_path = self.workdir / WATCH_MAIN
+        self.output_path = self.workdir / WATCH_OUTPUT
+        self.process: Optional[subprocess.Popen] = None
+        self.statuses: "queue.Queue[Tuple[str, str]]" = queue.Queue()
+        self.compiles = 0
+        self.failures = 0
+        self.starts = 0
+        self.nonce = 0
+
+    @staticmethod
+    def _read_status(process: subprocess.Popen, statuses: "queue.Queue[Tuple[str, str]]") -> None:
+        """Forward completion statuses (with any error text) from stderr to the queue."""
+        buffer = []
+        for raw in process.stderr:
+            line = ANSI_RE.sub("", raw).strip()
+            match = STATUS_RE.search(line)
+            if match:
+                statuses.put((match.group(1), "\n".join(buffer)))
+                buffer = []
+            elif line and not line.startswith(("watching", "writing to")):
+                buffer.append(line)
+        statuses.put(("exited", "\n".join(buffer)))
+
+    def alive(self) -> bool:
+        return self.process is not None and self.process.poll() is None
+
+    def _write_main(self, content: str) -> None:
+        """Replace the watched file atomically so Typst never sees a partial write."""
+        tmp_path = self.workdir / f".{WATCH_MAIN}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        os.replace(tmp_path, self.main_path)
+
+    def _start(self) -> bool:
+        # A fresh queue per process: a dead process's reader can't post into the new one
+        self.statuses = queue.Queue()
+        try:
+            self.process = subprocess.Popen(
+                [str(self.typst_cli), "watch", *self.args, WATCH_MAIN, WATCH_OUTPUT],
+                cwd=self.workdir,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                text=True,
+                errors="replace",
+            )
+        except OSError:
+            self.process = None
+            return False
+
+        threading.Thread(target=self._read_status, args=(self.process, self.statuses),
+                         daemon=True).start()
+        return True
+
+    def _ensure_running(self) -> bool:
+        """Start the watcher, or restart it if it died (at most MAX_STARTS starts in all)."""
+        if self.alive():
+            return True
+        if self.process is not None:
+            # Reap the dead process so it can be replaced
+            self.process.wait()
+            self.process = None
+        if self.starts >= MAX_STARTS:
+            return False
+        self.starts += 1
+        return self._start()
+
+    def _wait(self, timeout: float) -> Tuple[bool, str]:
+        try:
+            status, details = self.statuses.get(timeout=timeout)
+        except queue.Empty:
+            return False, f"typst watch did not respond within {timeout}s"
+
+        if status == "exited":
+            # stderr closed: reap the process so _ensure_running can replace it
+            try:
+                self.process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+                self.process.wait()
+            return False, details or "typst watch exited"
+        if status == "with errors":
+            return False, details
+
+        self.compiles += 1
+        return True, ""
+
+    def settle(self, timeout: float = SETTLE_TIMEOUT, quiet: float = SETTLE_QUIET) -> None:
+        """
+        Wait out recompiles triggered by files changed outside compile()
+        (e.g. rewritten data modules), so a later compile doesn't mistake
+        their status for its own.
+        """
+        if not self.alive():
+            return
+        wait = timeout
+        while True:
+            try:
+                status, _ = self.statuses.get(timeout=wait)
+            except queue.Empty:
+                return
+            if status == "exited":
+                return
+            wait = quiet
+
+    def compile(self, main_typ_path: Path, output_pdf_path: Path,
+                timeout: float = WATCH_TIMEOUT) -> Tuple[bool, str]:
+        """
+        Compile main_typ_path's content through the watcher into output_pdf_path.
+
+        Returns: (success: bool, error_message: str)
+        """
+        success, error_msg = self._compile(main_typ_path, output_pdf_path, timeout)
+        if not success:
+            self.failures += 1
+        return success, error_msg
+
+    def _compile(self, main_typ_path: Path, output_pdf_path: Path,
+                 timeout: float) -> Tuple[bool, str]:
+        content = Path(main_typ_path).read_text(encoding='utf-8')
+
+        # Drop any stale statuses from duplicate file events
+        while not self.statuses.empty():
+            self.statuses.get_nowait()
+
+        # The nonce makes every write a real change, so Typst always reports a
+        # compile for it, even when the probe repeats the previous content
+        self.nonce += 1
+        self._write_main(f"{content}\n// rescume compile {self.nonce}\n")
+
+        if not self._ensure_running():
+            return False, "typst watch is not running"
+
+        # Completion is the status line Typst prints for this compile
+        success, error_msg = self._wait(timeout)
+        if not success and not self.alive() and self._ensure_running():
+            # The watcher died mid-compile; its replacement compiles the current file on start
+            success, error_msg = self._wait(timeout)
+        if not success:
+            return False, error_msg
+
+        try:
+            shutil.copyfile(self.output_path, output_pdf_path)
+        except OSError as e:
+            return False, str(e)
+
+        return True, ""
+
+    def stop(self) -> None:
+        if self.alive():
+            self.process.terminate()
+            try:
+                self.process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+        self.process = None
+
+
+_WATCHERS: Dict[Path, TypstWatcher] = {}
+
+
+def get_watcher(typst_cli: Path, workdir: Path, args: Optional[List[str]] = None) -> TypstWatcher:
+    """Return the watcher for workdir, creating it on first use (args: extra typst options)."""
+    key = Path(workdir).resolve()
+    watcher = _WATCHERS.get(key)
+    if watcher is None:
+        watcher = _WATCHERS[key] = TypstWatcher(typst_cli, key, args)
+    return watcher
+
+
+def stop_watcher(workdir: Path) -> None:
+    """Stop and forget the watcher for workdir, if any."""
+    watcher = _WATCHERS.pop(Path(workdir).resolve(), None)
+    if watcher is not None:
+        watcher.stop()
+
+
+def stop_all_watchers() -> None:
+    for workdir in list(_WATCHERS):
+        stop_watcher(workdir)
+
+
+atexit.register(stop_all_watchers)
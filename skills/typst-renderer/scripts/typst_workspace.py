@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+Pooled Template Workspaces for Rescume v2.0
+
+Each template gets one build workspace per process: a mirror of its whole
+template directory (template.typ plus images such as profile.png) made of
+hardlinks, falling back to symlinks and then copies. The workspace is the
+Typst project root (`--root`), so templates import as "/template.typ" and
+their relative image paths keep working.
+
+Compiles run in per-job subdirectories (.jobs/<id>/) holding data.typ, the
+main files and probe PDFs; only those are created and removed per compile.
+A named slot (.jobs/<slot>/) instead persists for the process, so
+successive compiles can reuse its files. The mirror is rebuilt if any file
+in the template directory changes.
+"""
+
+import atexit
+import os
+import shutil
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, Optional, Tuple
+
+
+JOBS_DIR = ".jobs"
+
+
+def template_signature(template_dir: Path) -> Dict[str, Tuple[int, int]]:
+    """Relative path → (mtime_ns, size) for every file in the template directory."""
+    signature = {}
+    for dirpath, dirnames, filenames in os.walk(template_dir):
+        dirnames[:] = sorted(d for d in dirnames if not d.startswith("."))
+        for name in sorted(filenames):
+            if name.startswith("."):
+                continue
+            path = Path(dirpath) / name
+            stat = path.stat()
+            signature[str(path.relative_to(template_dir))] = (stat.st_mtime_ns, stat.st_size)
+    return signature
+
+
+def link_file(source: Path, target: Path) -> str:
+    """Mirror one file; returns how: "hardlink", "symlink" or "copy"."""
+    try:
+        os.link(source, target)
+        return "hardlink"
+    except OSError:
+        pass
+    try:
+        os.symlink(source.resolve(), target)
+        return "symlink"
+    except OSError:
+        shutil.copy2(source, target)
+        return "copy"
+
+
+def publish_file(source: Path, dest: Path, move: bool = False) -> None:
+    """
+    Put source at dest atomically: readers see the old file or the new one.
+
+    With move=True the file is renamed into place when source and dest share
+    a filesystem, so the PDF is never copied; otherwise it is copied to a
+    temporary file next to dest first.
+    """
+    dest = Path(dest)
+    if move:
+        try:
+            os.replace(source, dest)
+            return
+        except OSError:
+            pass
+
+    tmp_path = dest.with_name(f".{dest.name}.{os.getpid()}.tmp")
+    try:
+        shutil.copyfile(source, tmp_path)
+        os.replace(tmp_path, dest)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+class TemplateWorkspace:
+    """A linked mirror of one template directory with per-job subdirectories."""
+
+    def __init__(self, template_dir: Path, root: Path):
+        self.template_dir = Path(template_dir)
+        self.root = Path(root)
+        self.signature: Dict[str, Tuple[int, int]] = {}
+        self.link_mode = ""
+        self.builds = 0
+        self._digest: Optional[str] = None
+
+    def refresh(self) -> bool:
+        """(Re)build the mirror if the template directory changed. Returns True if rebuilt."""
+        signature = template_signature(self.template_dir)
+        if signature == self.signature and self.root.is_dir():
+            return False
+
+        if self.root.exists():
+            for child in self.root.iterdir():
+                if child.name == JOBS_DIR:
+                    continue
+                if child.is_dir() and not child.is_symlink():
+                    shutil.rmtree(child)
+                else:
+                    child.unlink()
+        (self.root / JOBS_DIR).mkdir(parents=True, exist_ok=True)
+
+        modes = set()
+        for relpath in signature:
+            target = self.root / relpath
+            target.parent.mkdir(parents=True, exist_ok=True)
+            modes.add(link_file(self.template_dir / relpath, target))
+
+        self.signature = signature
+        self.link_mode = "+".join(sorted(modes))
+        self.builds += 1
+        self._digest = None
+        return True
+
+    def digest(self) -> str:
+        """Hash of every template file's path and bytes (for cache keys)."""
+        if self._digest is None:
+            import hashlib  # deferred: only needed when the cache is enabled
+
+            h = hashlib.sha256()
+            for relpath in self.signature:
+                h.update(relpath.encode('utf-8') + b"\0")
+                h.update((self.template_dir / relpath).read_bytes())
+            self._digest = h.hexdigest()
+        return self._digest
+
+    @contextmanager
+    def job(self, slot: Optional[str] = None) -> Iterator[Path]:
+        """
+        A job directory inside the workspace: fresh and removed afterwards,
+        or with slot, the same persistent directory for every job using it.
+        """
+        if slot is not None:
+            job_dir = self.root / JOBS_DIR / slot
+            job_dir.mkdir(parents=True, exist_ok=True)
+            yield job_dir
+            return
+
+        import tempfile  # deferred, like the other imports off the --help path
+
+        job_dir = Path(tempfile.mkdtemp(dir=self.root / JOBS_DIR))
+        try:
+            yield job_dir
+        finally:
+            shutil.rmtree(job_dir, ignore_errors=True)
+
+
+_BASE_DIR: Optional[Path] = None
+_WORKSPACES: Dict[Path, TemplateWorkspace] = {}
+
+
+def get_workspace(template_dir: Path) -> TemplateWorkspace:
+    """Return this process's workspace for template_dir, building or refreshing it."""
+    global _BASE_DIR
+
+    key = Path(template_dir).resolve()
+    workspace = _WORKSPACES.get(key)
+    if workspace is None:
+        if _BASE_DIR is None:
+            import tempfile
+
+            _BASE_DIR = Path(tempfile.mkdtemp(prefix="rescume-typst-"))
+        workspace = _WORKSPACES[key] = TemplateWorkspace(
+            key, _BASE_DIR / f"{key.name}-{len(_WORKSPACES)}"
+        )
+    workspace.refresh()
+    return workspace
+
+
+def remove_workspaces() -> None:
+    global _BASE_DIR
+
+    _WORKSPACES.clear()
+    if _BASE_DIR is not None:
+        shutil.rmtree(_BASE_DIR, ignore_errors=True)
+        _BASE_DIR = None
+
+
+atexit.register(remove_workspaces)
@@ -13,12 +13,6 @@ import sys
 from pathlib import Path
 from typing import Dict, Any
 
-try:
-    import pdfplumber
-except ImportError:
-    print("Error: pdfplumber not installed. Run: pip install pdfplumber", file=sys.stderr)
-    sys.exit(1)
-
 
 def validate_pdf(pdf_path: Path) -> Dict[str, Any]:
     """
@@ -56,6 +50,13 @@ def validate_pdf(pdf_path: Path) -> Dict[str, Any]:
         result["errors"].append(f"Could not read file size: {e}")
         return result
 
+    # Imported here so usage errors and missing files don't pay for pdfminer
+    try:
+        import pdfplumber
+    except ImportError:
+        print("Error: pdfplumber not installed. Run: pip install pdfplumber", file=sys.stderr)
+        sys.exit(1)
+
     # Try to open and read PDF
     try:
         with pdfplumber.open(pdf_path) as pdf: